@@ -0,0 +1,74 @@
+import datetime
+import platform
+import statistics
+import sys
+import time
+
+
+class BenchmarkRunner:
+    """
+    Times benchmark cases and collects the results in a machine-readable report.
+    Each case is repeated, the state of every repetition is built by its setup outside of the timed section.
+
+    :param repeat: The number of timed repetitions of each case.
+    """
+
+    def __init__(self, suite: str, repeat: int = 5):
+        self.suite = suite
+        self.repeat = repeat
+        self.results = []
+
+    def measure(self, name: str, setup, operation, number: int, **params) -> dict:
+        """
+        Time a benchmark case.
+
+        :param name: The name of the case.
+        :param setup: Function without arguments building the state of a repetition.
+        :param operation: Function called number times per repetition with the state and the iteration index.
+        :param number: The number of operations in a repetition.
+        :param params: Parameters of the case, reported as they are.
+        :return: The result of the case.
+        """
+        timings = []
+        for _ in range(self.repeat):
+            state = setup()
+            start = time.perf_counter()
+            for index in range(number):
+                operation(state, index)
+            timings.append(time.perf_counter() - start)
+
+        return self.record(name, timings, number, **params)
+
+    def record(self, name: str, timings: list[float], number: int, **params) -> dict:
+        """
+        Record the timings of a case measured by the caller, e.g. across threads.
+
+        :param timings: Seconds taken by each repetition.
+        :param number: The number of operations in a repetition.
+        :return: The result of the case.
+        """
+        per_op = [timing / number for timing in timings]
+        result = {
+            "name": name,
+            "params": params,
+            "number": number,
+            "repeat": len(timings),
+            "mean_us": statistics.mean(per_op) * 1e6,
+            "median_us": statistics.median(per_op) * 1e6,
+            "min_us": min(per_op) * 1e6,
+            "stdev_us": statistics.stdev(per_op) * 1e6 if len(per_op) > 1 else 0.0,
+            "ops_per_sec": number / statistics.median(timings) if statistics.median(timings) > 0 else None
+        }
+        self.results.append(result)
+        print(f"{name} {params}: median {result['median_us']:.2f} us/op", file=sys.stderr)
+        return result
+
+    def report(self) -> dict:
+        return {
+            "suite": self.suite,
+            "created_at": datetime.datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "results": self.results
+        }
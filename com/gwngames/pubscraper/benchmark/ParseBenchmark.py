@@ -0,0 +1,133 @@
+import argparse
+import json
+import logging
+import os
+
+from com.gwngames.pubscraper.benchmark.BenchmarkRunner import BenchmarkRunner
+from com.gwngames.pubscraper.simulation.CrawlSimulator import prepare_environment
+from com.gwngames.pubscraper.utils.JsonReader import JsonReader
+
+
+class ParseBenchmark:
+    """
+    Parse time per fetched page, on pages recorded with record_pages_dir.
+    Each page goes through the ban checks, the captcha check on the HTML and an extractor walk, as a scraper handles
+    it: once with the raw HTML, each step parsing the page on its own, and once with a shared Page.
+    The ban check alone is compared as well: a phrase looked up in the text of the parsed page, against the scan of
+    the raw HTML for every signal of the interface.
+    Parse throughput is measured per page type with each installed parser backend, building the tree of the whole
+    page and the tree of the regions declared by its spec.
+    """
+    # Ban checks and captcha check on the HTML run by the scrapers on each page, by spec
+    CHECKS = {
+        "scholar_search": (2, True),
+        "scholar_citations": (2, True),
+        "scholar_versions": (2, True),
+        "dblp_search": (1, False),
+        "core_ranks": (1, False)
+    }
+    BAN_PHRASE = "We're sorry..."
+    SCRAPERS = {"scholar": "ScholarScraper", "dblp": "DblpScraper", "core": "CoreEduScraper",
+                "scimago": "ScimagoScraper"}
+
+    def __init__(self, runner: BenchmarkRunner, pages_dir: str):
+        from com.gwngames.pubscraper.Context import Context
+        from com.gwngames.pubscraper.scraper.BanChecker import BanChecker
+        from com.gwngames.pubscraper.scraper.scraper.CaptchaHandler import CaptchaHandler
+
+        self.runner = runner
+        self.checker = BanChecker(Context())
+        self.captcha = CaptchaHandler(None, 0, 0, None, "gs_captcha_ccl")
+        self.pages = self._load(pages_dir)
+        self.specs = self._specs()
+
+    @staticmethod
+    def _load(pages_dir: str) -> dict[str, list[str]]:
+        """
+        :return: The recorded pages by spec, the spec being the file name up to its digest.
+        """
+        pages = {}
+        for name in sorted(os.listdir(pages_dir)):
+            if not name.endswith(".html"):
+                continue
+            with open(os.path.join(pages_dir, name), 'r', encoding='utf-8') as f:
+                pages.setdefault(name.rsplit("_", 1)[0], []).append(f.read())
+        return pages
+
+    @staticmethod
+    def _specs() -> dict:
+        """
+        :return: The page specs of the scrapers, by name.
+        """
+        from com.gwngames.pubscraper.scraper.scraper.CoreEduScraper import CoreEduScraper
+        from com.gwngames.pubscraper.scraper.scraper.DblpScraper import DblpScraper
+        from com.gwngames.pubscraper.scraper.scraper.PageSpec import PageSpec
+        from com.gwngames.pubscraper.scraper.scraper.ScholarScraper import ScholarScraper
+        from com.gwngames.pubscraper.scraper.scraper.ScimagoScraper import ScimagoScraper
+
+        return {spec.name: spec for scraper in (ScholarScraper, DblpScraper, ScimagoScraper, CoreEduScraper)
+                for spec in vars(scraper).values() if isinstance(spec, PageSpec)}
+
+    def _handle(self, spec: str, html: str, shared: bool):
+        from com.gwngames.pubscraper.scraper.scraper.Page import Page
+
+        page = Page(html) if shared else html
+        ban_checks, captcha_check = ParseBenchmark.CHECKS.get(spec, (0, False))
+        for _ in range(ban_checks):
+            self.checker.has_ban_phrase(page, ParseBenchmark.BAN_PHRASE)
+        if captcha_check:
+            self.captcha._check_html_for_captcha(Page.of(page))
+        Page.of(page).soup.find_all('a')
+
+    def run(self) -> dict:
+        from com.gwngames.pubscraper.scraper.BanDetector import BanDetector
+        from com.gwngames.pubscraper.scraper.scraper.HtmlParser import HtmlParser
+        from com.gwngames.pubscraper.scraper.scraper.Page import Page
+
+        for spec, pages in self.pages.items():
+            kb_per_page = sum(map(len, pages)) // len(pages) // 1024
+            for shared in (False, True):
+                self.runner.measure("parse_shared_page" if shared else "parse_per_step", lambda: pages,
+                                    lambda state, index, s=spec, sh=shared: self._handle(s, state[index], sh),
+                                    len(pages), spec=spec, kb_per_page=kb_per_page)
+
+            regions = self.specs[spec].regions if spec in self.specs else []
+            for backend in HtmlParser.available():
+                self.runner.measure("parse_whole", lambda: pages,
+                                    lambda state, index, b=backend: HtmlParser.parse(state[index], backend=b),
+                                    len(pages), spec=spec, kb_per_page=kb_per_page, backend=backend)
+                if regions:
+                    self.runner.measure("parse_regions", lambda: pages,
+                                        lambda state, index, r=regions, b=backend: HtmlParser.parse(state[index], r, b),
+                                        len(pages), spec=spec, kb_per_page=kb_per_page, backend=backend,
+                                        regions=", ".join(map(str, regions)))
+
+            detector = BanDetector.get(ParseBenchmark.SCRAPERS.get(spec.split("_", 1)[0], ""))
+            self.runner.measure("ban_phrase_in_text", lambda: pages,
+                                lambda state, index: Page(state[index]).lower_text.find(ParseBenchmark.BAN_PHRASE),
+                                len(pages), spec=spec, kb_per_page=kb_per_page)
+            self.runner.measure("ban_signals_scan", lambda: pages,
+                                lambda state, index, d=detector: d.detect(state[index]),
+                                len(pages), spec=spec, kb_per_page=kb_per_page, signals=len(detector.signals))
+        return self.runner.report()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the parsing of fetched pages.")
+    parser.add_argument("pages_dir", help="Directory of pages recorded with record_pages_dir")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                                         JsonReader.CONFIG_FILE_NAME))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=None, help="File receiving the JSON report")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    pages_dir = os.path.abspath(args.pages_dir)  # Before the working directory moves to the scratch one
+    prepare_environment(args.config, {})
+    benchmark = ParseBenchmark(BenchmarkRunner("parse", repeat=args.repeat), pages_dir)
+    report = json.dumps(benchmark.run(), indent=4)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report)
+    print(report)
@@ -0,0 +1,171 @@
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+
+from com.gwngames.pubscraper.benchmark.BenchmarkRunner import BenchmarkRunner
+from com.gwngames.pubscraper.constants.EntityCidConstants import EntityCidConstants
+from com.gwngames.pubscraper.simulation.CrawlSimulator import prepare_environment
+from com.gwngames.pubscraper.utils.JsonReader import JsonReader
+
+
+class SchedulingBenchmark:
+    """
+    Microbenchmarks of the scheduling core: the master queue, the router with its duplicate check,
+    message construction, the ordering of the roots and the message statistics file.
+    Runs offline, against a scratch configuration and an in-memory database.
+    """
+    MESSAGE_TYPE = "Benchmark"
+
+    def __init__(self, runner: BenchmarkRunner, sizes: list[int], threads: list[int]):
+        from com.gwngames.pubscraper.scheduling.MessageRouter import MessageRouter
+
+        self.runner = runner
+        self.sizes = sizes
+        self.threads = threads
+        self.router = MessageRouter.get_instance()
+        self.queue = self.router.incoming_queue
+        self._messages = []
+
+    def _fetch_messages(self, count: int) -> list:
+        """
+        Scraper messages with distinct expected ids, built once and reused across cases.
+        """
+        from com.gwngames.pubscraper.msg.scraper.FetchGeneralData import FetchGeneralData
+        from com.gwngames.pubscraper.scraper.adapter.AdapterPropertiesConstants import AdapterPropertiesConstants
+        from com.gwngames.pubscraper.scraper.adapter.GeneralDataAdapter import GeneralDataAdapter
+
+        while len(self._messages) < count:
+            adapter = GeneralDataAdapter()
+            adapter.add_property(AdapterPropertiesConstants.IFACE_REF, "benchmark")
+            adapter.add_property(AdapterPropertiesConstants.PHASE_REF, EntityCidConstants.AUTHOR)
+            adapter.add_property(AdapterPropertiesConstants.EXPECTED_ID, f"author {len(self._messages)}")
+            self._messages.append(FetchGeneralData(SchedulingBenchmark.MESSAGE_TYPE, adapter))
+
+        messages = self._messages[:count]
+        for message in messages:
+            message.depth = 0
+        return messages
+
+    def _reset_queue(self):
+        self.queue.system_queue = []
+        self.queue.process_queue = []
+        self.queue.processed_message_count = 1  # Aging runs when the count reaches a multiple of 100
+
+    def _filled_queue(self, size: int):
+        self._reset_queue()
+        for index, message in enumerate(self._fetch_messages(size)):
+            self.queue.send(index % 10, message)
+
+    def bench_queue(self):
+        for size in self.sizes:
+            messages = self._fetch_messages(size)
+
+            def send_setup():
+                self._reset_queue()
+                return messages
+
+            self.runner.measure("queue_send", send_setup,
+                                lambda state, index: self.queue.send(index % 10, state[index]), size, size=size)
+            self.runner.measure("queue_receive", lambda: self._filled_queue(size),
+                                lambda state, index: self.queue.receive(), size, size=size)
+
+    def bench_aging(self):
+        for size in self.sizes:
+            self.runner.measure("queue_aging_pass", lambda: self._filled_queue(size),
+                                lambda state, index: self.queue._decrease_priorities(self.queue.process_queue),
+                                10, size=size)
+
+    def bench_router(self):
+        from com.gwngames.pubscraper.scheduling import MessageRouter as router_module
+
+        for size in self.sizes:
+            messages = self._fetch_messages(size)
+
+            def send_setup():
+                self._reset_queue()
+                router_module.duplicate_messages.clear()
+                return self._fetch_messages(size)
+
+            def duplicate_setup():
+                send_setup()
+                for message in messages:
+                    router_module.duplicate_messages.add(str(message))
+                return messages
+
+            self.runner.measure("router_send_message", send_setup,
+                                lambda state, index: self.router.send_message(state[index], index % 10), size,
+                                size=size)
+            self.runner.measure("router_send_duplicate", duplicate_setup,
+                                lambda state, index: self.router.send_message(state[index], index % 10), size,
+                                size=size)
+
+    def bench_message_creation(self):
+        from com.gwngames.pubscraper.msg.BaseMessage import BaseMessage
+
+        self.runner.measure("message_construction", lambda: None,
+                            lambda state, index: BaseMessage(SchedulingBenchmark.MESSAGE_TYPE, "content"), 1000)
+
+    def bench_root_order(self):
+        from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+        from com.gwngames.pubscraper.scraper.WebScraper import WebScraper
+
+        config = JsonReader(JsonReader.CONFIG_FILE_NAME)
+        config.set_value(ConfigConstants.SHUFFLE_ROOTS, True)
+        for size in self.sizes:
+            roots = [f"author {index}" for index in range(size)]
+            self.runner.measure("root_shuffle", lambda: None,
+                                lambda state, index: WebScraper.order_roots(config, roots), 1, size=size)
+
+    def bench_stats_contention(self, operations: int = 2000):
+        for thread_count in self.threads:
+            stats = JsonReader(JsonReader.MESSAGE_STAT_FILE_NAME)
+            per_thread = operations // thread_count
+
+            def work(thread_index: int):
+                for index in range(per_thread):
+                    stats.set_and_save(f"benchmark_{thread_index}", index)
+
+            timings = []
+            for _ in range(self.runner.repeat):
+                workers = [threading.Thread(target=work, args=(thread_index,)) for thread_index in range(thread_count)]
+                start = time.perf_counter()
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+                timings.append(time.perf_counter() - start)
+            self.runner.record("stats_set_and_save", timings, per_thread * thread_count, threads=thread_count)
+
+    def run(self, cases: list[str]) -> dict:
+        for case in cases:
+            getattr(self, "bench_" + case)()
+        return self.runner.report()
+
+
+CASES = ["queue", "aging", "router", "message_creation", "root_order", "stats_contention"]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling core.")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                                         JsonReader.CONFIG_FILE_NAME))
+    parser.add_argument("--cases", default=",".join(CASES), help="Comma separated cases, among: " + ", ".join(CASES))
+    parser.add_argument("--sizes", default="1000,10000", help="Comma separated queue sizes")
+    parser.add_argument("--threads", default="1,4,16", help="Comma separated thread counts for contention cases")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=None, help="File receiving the JSON report")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    prepare_environment(args.config, {})
+    benchmark = SchedulingBenchmark(BenchmarkRunner("scheduling", repeat=args.repeat),
+                                    [int(size) for size in args.sizes.split(",")],
+                                    [int(count) for count in args.threads.split(",")])
+    report = json.dumps(benchmark.run(args.cases.split(",")), indent=4)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report)
+    print(report)
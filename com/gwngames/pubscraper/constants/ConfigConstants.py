@@ -37,6 +37,40 @@ class ConfigConstants:
     SHUFFLE_ROOTS: Final = 'shuffle_roots'
     DEBUG_DELAY: Final = 'debug_delay'
     RECOVERY_INST: Final = 'recovery_instance'
+    PHASE_TTL_SEC: Final = 'phase_ttl_sec'
+    RECRAWL_ENABLED: Final = 'recrawl_enabled'
+    RECRAWL_RATE_PER_MIN: Final = 'recrawl_rate_per_min'
+    RECRAWL_BATCH_SIZE: Final = 'recrawl_batch_size'
+    SEED_LOW_WATER: Final = 'seed_low_water'
+    SEED_POLL_SEC: Final = 'seed_poll_sec'
+    DRIVER_POOL_SIZE: Final = 'driver_pool_size'
+    DRIVER_PROXIES: Final = 'driver_proxies'
+    HTTP_FAST_PATH: Final = 'http_fast_path'
+    BROWSER_PROFILES: Final = 'browser_profiles'
+    BROWSER_HEADLESS: Final = 'browser_headless'
+    CAPTCHA_FULL_PROFILE: Final = 'captcha_full_profile'
+    DRIVER_HOT_SPARE: Final = 'driver_hot_spare'
+    TOR_CONTROL_PASSWORD: Final = 'tor_control_password'
+    TOR_ROTATIONS_BEFORE_RESTART: Final = 'tor_rotations_before_restart'
+    SESSION_STORE_DIR: Final = 'session_store_dir'
+    SESSION_SNAPSHOT_SEC: Final = 'session_snapshot_sec'
+    SESSION_DISCARD_ON_BAN: Final = 'session_discard_on_ban'
+    DRIVER_MAX_PAGES: Final = 'driver_max_pages'
+    DRIVER_MAX_RSS_MB: Final = 'driver_max_rss_mb'
+    DRIVER_RSS_SAMPLE_SEC: Final = 'driver_rss_sample_sec'
+    SINGLE_FLIGHT_TTL_SEC: Final = 'single_flight_ttl_sec'
+    METRICS_FILE: Final = 'metrics_file'
+    AIMD_ENABLED: Final = 'aimd_enabled'
+    AIMD_LATENCY_SEC: Final = 'aimd_latency_sec'
+    AIMD_DECREASE_FACTOR: Final = 'aimd_decrease_factor'
+    AIMD_COOLDOWN_SEC: Final = 'aimd_cooldown_sec'
+    WATCHDOG_POLL_SEC: Final = 'watchdog_poll_sec'
+    DRIVER_COMMAND_TIMEOUT_SEC: Final = 'driver_command_timeout_sec'
+    DRIVER_STALL_SEC: Final = 'driver_stall_sec'
+    HANDLER_STALL_SEC: Final = 'handler_stall_sec'
+    RECORD_PAGES_DIR: Final = 'record_pages_dir'
+    BAN_SIGNALS: Final = 'ban_signals'
+    HTML_PARSER: Final = 'html_parser'
 
 
     # Actual constants
@@ -12,5 +12,6 @@ class PriorityConstants:
     CONFERENCE_REQ: Final = 102
     PUB_REQ: Final = 101
     AUTHOR_REQ: Final = 102
+    RECRAWL_REQ: Final = 103  # Refreshes come after newly discovered entities
 
 
@@ -0,0 +1,8 @@
+class CaptchaDetectedException(Exception):
+    """Exception raised by a driver whose page shows a captcha, handled by its pool."""
+
+    def __init__(self, domain, handler):
+        self.domain = domain
+        self.handler = handler
+        self.message = f"Captcha detected on {domain}"
+        super().__init__(self.message)
@@ -11,8 +11,11 @@ from com.gwngames.pubscraper.LogFileHandler import LogFileHandler
 from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
 from com.gwngames.pubscraper.install_browser import install_browser
 from com.gwngames.pubscraper.scheduling.MessageRouter import MessageRouter
+from com.gwngames.pubscraper.scheduling.RecrawlPlanner import RecrawlPlanner
 from com.gwngames.pubscraper.scraper.BanChecker import BanChecker
 from com.gwngames.pubscraper.scraper.WebScraper import WebScraper
+from com.gwngames.pubscraper.scraper.ifaces.GeneralDataFetcher import GeneralDataFetcher
+from com.gwngames.pubscraper.scraper.scraper.SeleniumDriverPool import SeleniumDriverManager
 from com.gwngames.pubscraper.utils.ClassRegisterer import QueueRegisterer
 from com.gwngames.pubscraper.utils.JsonReader import JsonReader
 
@@ -80,8 +83,7 @@ if __name__ == '__main__':
         BanChecker(ctx).start_monitoring()
 
     # Check if embedded browser is required
-    if conf_reader.get_value(ConfigConstants.BROWSER_EMBEDDED) is True:
-        logging.info("Using embedded browser")
+    def prepare_embedded_browser():
         install_browser()
         current_dir = os.getcwd()
         browser_driver_path = os.path.join(current_dir, "tor_download/tor-browser/Browser/firefox")
@@ -93,8 +95,22 @@ if __name__ == '__main__':
         conf_reader.set_and_save(ConfigConstants.BROWSER_TYPE, "embedded")
         conf_reader.set_and_save("geckodriver", gecko_dir)
 
+    prepare_browser = None
+    if conf_reader.get_value(ConfigConstants.BROWSER_EMBEDDED) is True:
+        logging.info("Using embedded browser")
+        prepare_browser = prepare_embedded_browser
+
+    # Browsers are installed and started in the background, while recovery and seeding go on
+    fetchers = [GeneralDataFetcher.get_data_fetcher_class(name) for name in ctx.get_main_interfaces()]
+    SeleniumDriverManager.warm_up([fetcher.SCRAPER.__name__ for fetcher in fetchers if fetcher is not None],
+                                  prepare=prepare_browser)
+
     scraper = WebScraper()
     scraper.start()  # Asynchronous call, scraper has started
 
+    if conf_reader.get_value(ConfigConstants.RECRAWL_ENABLED) is True:
+        logging.info("Scheduling refreshes of stale entities")
+        RecrawlPlanner().start()
+
     while True:  # Keep child processes alive
         time.sleep(1000000)
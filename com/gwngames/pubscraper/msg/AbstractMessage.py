@@ -1,3 +1,4 @@
+import copy
 import datetime
 import json
 from typing import Dict
@@ -104,3 +105,9 @@ class AbstractMessage:
 
     def prepare_for_retry(self):
         return
+
+    def copy(self) -> 'AbstractMessage':
+        """
+        :return: A copy of the message, under the same message id, to send again while this one is still held.
+        """
+        return copy.copy(self)
@@ -23,4 +23,9 @@ class FetchGeneralData(BaseMessage):
         else:
             return f"Message Type: {self.message_type}, Expected ID: {str(expected_id)}"
 
+    def copy(self) -> 'FetchGeneralData':
+        message = super().copy()
+        message.adapter = self.adapter.copy()
+        return message
+
 
@@ -1,4 +1,6 @@
 import datetime
+import heapq
+import itertools
 import logging
 import threading
 import time
@@ -10,6 +12,7 @@ from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
 from com.gwngames.pubscraper.constants.QueueConstants import QueueConstants
 from com.gwngames.pubscraper.msg.AbstractMessage import AbstractMessage
 from com.gwngames.pubscraper.scheduling.MasterPriorityQueue import MasterPriorityQueue
+from com.gwngames.pubscraper.utils.Clock import Clock
 from com.gwngames.pubscraper.utils.JsonReader import JsonReader
 from com.gwngames.pubscraper.utils.ThreadUtils import ThreadUtils
 
@@ -26,6 +29,10 @@ class PrioritizedTask:
 class MessageRouter:
     """
     A class that handles routing of messages.
+    Messages whose queue needs capacity, such as a driver of their scraper, are only handed to a thread once
+    admitted; the others are parked, by priority, until an admitted message of the same capacity is processed or
+    the capacity grows.
+    The admission of a message whose handler stalled is ended when the handler is given up, see abandon.
     """
     _instance = None
     _lock = threading.Lock()
@@ -51,6 +58,13 @@ class MessageRouter:
         self.logger.info(f"Configured maximum active threads: {self.MAX_ACTIVE_THREADS}")
         self.executor = ThreadPoolExecutor(max_workers=self.MAX_ACTIVE_THREADS)
         self.task_queue = PriorityQueue()
+        self.parked = {}  # Messages waiting for admission, a heap per capacity
+        self._parked_order = itertools.count()
+        self._admission_lock = threading.Lock()
+        self._admissions = {}  # The admission held by each message being processed, by message id
+        self._completion_callbacks = {}  # Called once the handler of a message is done, by message id
+        self._given_up = set()  # Messages held by handlers given up, their completion is ignored
+        self._completion_lock = threading.Lock()
         threading.Thread(target=self._process_task_queue, daemon=True).start()
         self.logger.info("MessageRouter initialization complete.")
 
@@ -102,22 +116,105 @@ class MessageRouter:
             self.logger.info(f"Executing system message: {message.message_id}")
             message_queue.process_message(message)
         else:
-            self.executor.submit(message_queue.process_message, message)
+            admission = message_queue.admission(message)
+            if admission is None:
+                self.executor.submit(message_queue.process_message, message)
+                return
+            with self._admission_lock:
+                if not admission.admit():
+                    if admission not in self.parked:
+                        admission.on_capacity(lambda: self.drain(admission))
+                    heapq.heappush(self.parked.setdefault(admission, []),
+                                   (message.priority, next(self._parked_order), message, message_queue))
+                    self.logger.debug(f"Message {message.message_id} parked until admitted.")
+                    return
+            self.executor.submit(self._process_admitted, admission, message, message_queue)
 
-    def send_message(self, message: AbstractMessage, priority: int, delay_min: int = 0, delay_max: int = 0):
+    def _process_admitted(self, admission, message: AbstractMessage, message_queue: Any):
+        """
+        Process an admitted message, then go on with the parked messages admitted in its place.
+        """
+        while message is not None:
+            held = (admission, object())  # Told apart from the admission of the message if it is sent again
+            with self._admission_lock:
+                self._admissions[message.message_id] = held
+            try:
+                message_queue.process_message(message)
+            except Exception as e:
+                self.logger.error(f"Error processing message {message.message_id}: {e}")
+            message, message_queue = self._end_admission(message, held)
+
+    def _end_admission(self, message: AbstractMessage, held: tuple) -> tuple:
+        """
+        End the admission held by a message, once, and admit parked messages in its place.
+
+        :return: The first message admitted and its queue, for the calling thread to process, the others are
+                 dispatched; None if the admission was already ended.
+        """
+        admission = held[0]
+        with self._admission_lock:
+            if self._admissions.get(message.message_id) is not held:
+                return None, None
+            del self._admissions[message.message_id]
+            admission.dismiss()
+            admitted = self._admit_parked(admission)
+        for other in admitted[1:]:
+            self.executor.submit(self._process_admitted, admission, *other)
+        return admitted[0] if admitted else (None, None)
+
+    def _admit_parked(self, admission) -> list:
+        """
+        Admit the parked messages of a capacity while it allows. Called with the admission lock held.
+
+        :return: The admitted messages, with their queue, by priority.
+        """
+        admitted = []
+        parked = self.parked.get(admission)
+        while parked and admission.admit():
+            admitted.append(heapq.heappop(parked)[2:])
+        return admitted
+
+    def drain(self, admission):
+        """
+        Dispatch the parked messages of a capacity which grew, called by the capacity itself.
+        """
+        with self._admission_lock:
+            admitted = self._admit_parked(admission)
+        for message, message_queue in admitted:
+            self.logger.debug(f"Message {message.message_id} admitted on a grown capacity.")
+            self.executor.submit(self._process_admitted, admission, message, message_queue)
+
+    def abandon(self, message: AbstractMessage):
+        """
+        End the admission of a message whose handler stalled, the thread of the handler is left behind.
+        Its completion is ignored, the message being sent again as a copy.
+        """
+        with self._completion_lock:
+            self._given_up.add(message)
+        with self._admission_lock:
+            held = self._admissions.get(message.message_id)
+        if held is None:
+            return
+        admitted, message_queue = self._end_admission(message, held)
+        if admitted is not None:
+            self.executor.submit(self._process_admitted, held[0], admitted, message_queue)
+
+    def send_message(self, message: AbstractMessage, priority: int, delay_min: int = 0, delay_max: int = 0) -> bool:
         """
         Send a message to a message queue with an optional priority.
+
+        :return: False if the message was dropped, as a duplicate or past the scraping timeout.
         """
         if (self.config.get_value(ConfigConstants.MAX_MS_WORKTIME) != -1
                 and self.config.get_value(ConfigConstants.MAX_MS_WORKTIME) < (
                         datetime.datetime.now() - self.started_at).total_seconds()
                 and message.destination_queue == QueueConstants.SCRAPER_QUEUE):
             self.logger.warning(f"Scraping timeout reached. Not sending message: {message}")
-            return
+            return False
 
         if self.config.get_value(ConfigConstants.DEBUG_DELAY):
             self.logger.debug("Debug delay enabled. Sleeping for 10 seconds before sending message.")
-            time.sleep(10)
+            Clock.get().sleep(10)
 
         if message.delayed:
             ThreadUtils.sleep_for(delay_min, delay_max, self.logger, message.message_id)
@@ -131,7 +228,7 @@ class MessageRouter:
 
         if message.system_message is not True and str(message) in duplicate_messages:
             self.logger.info(f"Duplicate message detected. Scrapping message: {message}")
-            return
+            return False
         else:
             duplicate_messages.add(str(message))
             self.logger.debug(f"Message added to duplicate tracker: {message}")
@@ -139,14 +236,41 @@ class MessageRouter:
         message.priority = priority
         self.logger.info(f"Sending message {message.message_id} to incoming queue with priority {priority}.")
         self.incoming_queue.send(priority, message, loaded_queue())
+        return True
+
+    def on_completed(self, message: AbstractMessage, callback):
+        """
+        Register a callback, called once the handler of the message is done, retries included.
+        """
+        with self._completion_lock:
+            self._completion_callbacks[message.message_id] = callback
+
+    def completed(self, message: AbstractMessage):
+        """
+        Signal that the handler of a message is done, calling the callback registered for it,
+        unless the handler was given up.
+        """
+        with self._completion_lock:
+            if message in self._given_up:
+                self._given_up.discard(message)
+                return
+            callback = self._completion_callbacks.pop(message.message_id, None)
+        if callback is not None:
+            callback()
+
+    def resend(self, message: AbstractMessage, priority: int):
+        """
+        Send a message bypassing the duplicate tracker, for entities which are intentionally processed again.
+        """
+        duplicate_messages.discard(str(message))
+        self.send_message(message, priority)
 
     def send_later_in(self, message: AbstractMessage, priority: int, delay_min: int = 0, delay_max: int = 0):
         message.delayed = True
         def send_message_thread():
             self.send_message(message, priority=priority, delay_min=delay_min, delay_max=delay_max)
 
-        thread = threading.Thread(target=send_message_thread)
-        thread.start()
+        Clock.get().spawn(send_message_thread)
 
     @staticmethod
     def later_in(data, priority: int, delay_min: int = 0, delay_max: int = 0):
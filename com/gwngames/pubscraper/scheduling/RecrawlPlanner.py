@@ -0,0 +1,108 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+from com.gwngames.pubscraper.Context import Context
+from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+from com.gwngames.pubscraper.constants.PriorityConstants import PriorityConstants
+from com.gwngames.pubscraper.scheduling.MessageRouter import MessageRouter
+from com.gwngames.pubscraper.scraper.adapter.AdapterPropertiesConstants import AdapterPropertiesConstants
+from com.gwngames.pubscraper.scraper.buffer.DatabaseHandler import DatabaseHandler
+from com.gwngames.pubscraper.scraper.ifaces.GeneralDataFetcher import GeneralDataFetcher
+
+
+class RecrawlPlanner:
+    """
+    Feeds the stalest stored entities back into the frontier, oldest first and at a configured rate.
+    Staleness is decided per phase through the phase TTLs, using the update date view of each interface database.
+    An entity is not requested again within the TTL of its phase, the requests older than it are forgotten.
+    """
+    IDLE_SLEEP_SEC = 600
+
+    def __init__(self):
+        self.ctx = Context()
+        self.logger = logging.getLogger(RecrawlPlanner.__name__)
+        self.thread = None
+        self._scheduled = {}  # (interface, entity id) -> time of the last refresh request and TTL of its phase
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+            self.logger.info("Recrawl planner started")
+
+    def _run(self):
+        while True:
+            try:
+                sent = self.plan_once()
+            except Exception as e:
+                self.logger.error(f"Error planning recrawl: {e}")
+                sent = 0
+            if sent == 0:
+                time.sleep(RecrawlPlanner.IDLE_SLEEP_SEC)
+
+    def collect_stale_entities(self, limit: int) -> list[tuple]:
+        """
+        Query every enabled interface for its stale entities.
+
+        :param limit: The maximum number of entities to return.
+        :return: Tuples of (update date, fetcher, phase, entity), oldest first.
+        """
+        stale = []
+        for interface_id in self.ctx.get_main_interfaces():
+            fetcher_class = GeneralDataFetcher.get_data_fetcher_class(interface_id)
+            if fetcher_class is None:
+                continue
+            fetcher: GeneralDataFetcher = fetcher_class()
+            data_source = DatabaseHandler(self.ctx.get_dbclient(), interface_id)
+
+            for phase_ref in fetcher.get_refresh_phases():
+                older_than = datetime.now() - timedelta(seconds=fetcher.get_phase_ttl(phase_ref))
+                for entity in data_source.get_stale_documents(phase_ref, older_than, limit):
+                    stale.append((entity["update_date"], fetcher, phase_ref, entity))
+
+        stale.sort(key=lambda item: item[0])
+        return stale[:limit]
+
+    def _forget_expired(self):
+        """
+        Drop the refresh requests older than the TTL of their phase, the entity may be requested again.
+        """
+        now = datetime.now()
+        self._scheduled = {key: (scheduled_at, ttl) for key, (scheduled_at, ttl) in self._scheduled.items()
+                           if now - scheduled_at < ttl}
+
+    def plan_once(self) -> int:
+        """
+        Send one batch of refresh requests to the frontier.
+
+        :return: The number of refresh requests sent.
+        """
+        config = self.ctx.get_config()
+        rate_per_min = config.get_value(ConfigConstants.RECRAWL_RATE_PER_MIN)
+        batch_size = config.get_value(ConfigConstants.RECRAWL_BATCH_SIZE)
+
+        self._forget_expired()
+        sent = 0
+        for update_date, fetcher, phase_ref, entity in self.collect_stale_entities(batch_size):
+            key = (fetcher.get_interface_id(), entity["_id"])
+            if key in self._scheduled:
+                continue  # Already requested within the TTL of its phase, still waiting for its turn
+
+            params = fetcher.get_refresh_params(phase_ref, entity)
+            if params is None:
+                continue
+
+            adapter = fetcher.generate_fetch_adapter(phase_ref)
+            adapter.add_property(AdapterPropertiesConstants.IFACE_FX_PARAM_LIST, params)
+            adapter.add_property(AdapterPropertiesConstants.EXPECTED_ID, entity["_id"])
+
+            self.logger.info("Refreshing %s - %s, last updated on %s", key[0], key[1], update_date)
+            MessageRouter.get_instance().resend(fetcher.generate_fetch_message(adapter), PriorityConstants.RECRAWL_REQ)
+            self._scheduled[key] = (datetime.now(), timedelta(seconds=fetcher.get_phase_ttl(phase_ref)))
+            sent += 1
+            time.sleep(60 / rate_per_min)
+
+        self.logger.info("Recrawl batch completed, %s refresh requests sent", sent)
+        return sent
@@ -0,0 +1,78 @@
+import itertools
+import logging
+import threading
+from typing import Iterable
+
+from com.gwngames.pubscraper.Context import Context
+from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+from com.gwngames.pubscraper.scheduling.MessageRouter import MessageRouter
+from com.gwngames.pubscraper.utils.Clock import Clock
+
+
+class RootSeeder:
+    """
+    Feeds the root authors of an interface to the frontier, topping it up whenever fewer root messages than
+    the low-water mark are pending. A root is pending from its sending until its handler is done.
+    Roots are consumed lazily and the cursor, the position up to which every root was handled, is persisted in the
+    message statistics, so that a restart resumes from the first root not handled yet.
+
+    :param fetcher: The data fetcher of the interface, generating the root messages.
+    :param roots: The roots, always in the same order across restarts.
+    """
+    CURSOR_KEY = "root_cursor_"
+
+    def __init__(self, fetcher, roots: Iterable[str]):
+        self.ctx = Context()
+        self.fetcher = fetcher
+        self.roots = roots
+        self.interface_id = fetcher.get_interface_id()
+        self.logger = logging.getLogger(RootSeeder.__name__)
+        self.cursor = 0
+        self._pending = set()  # Positions of the roots whose handler is not done
+        self._handled = set()  # Positions of the roots handled past the cursor
+        self._lock = threading.Lock()
+
+    def pending(self) -> int:
+        """
+        :return: The number of root messages of the interface sent and not handled yet.
+        """
+        with self._lock:
+            return len(self._pending)
+
+    def _handled_root(self, position: int):
+        with self._lock:
+            self._pending.discard(position)
+            self._handled.add(position)
+            cursor = self.cursor
+            while self.cursor in self._handled:
+                self._handled.remove(self.cursor)
+                self.cursor += 1
+            if self.cursor != cursor:
+                self.ctx.get_message_data().set_and_save(RootSeeder.CURSOR_KEY + self.interface_id, self.cursor)
+
+    def run(self):
+        config = self.ctx.get_config()
+        low_water = config.get_value(ConfigConstants.SEED_LOW_WATER)
+        poll_sec = config.get_value(ConfigConstants.SEED_POLL_SEC)
+        router = MessageRouter.get_instance()
+
+        # Roots pending when the previous run stopped are past the cursor, they are sent again
+        self.cursor = self.ctx.get_message_data().get_value(RootSeeder.CURSOR_KEY + self.interface_id) or 0
+        self.logger.info("Seeding %s from root %s", self.interface_id, self.cursor)
+
+        seeded = self.cursor
+        for position, root in enumerate(itertools.islice(self.roots, self.cursor, None), self.cursor):
+            while self.pending() >= low_water:
+                Clock.get().sleep(poll_sec)
+
+            message, priority = self.fetcher.generate_root_message(root)
+            with self._lock:
+                self._pending.add(position)
+            router.on_completed(message, lambda p=position: self._handled_root(p))
+            if not router.send_message(message, priority):
+                router.completed(message)  # Dropped, nothing to wait for
+
+            seeded = position + 1
+            self.logger.debug("Seeded %s root %s: %s", self.interface_id, seeded, root)
+
+        self.logger.info("All %s roots of %s have been seeded", seeded, self.interface_id)
@@ -1,5 +1,6 @@
 import logging
 import queue
+import threading
 import time
 import traceback
 from abc import abstractmethod
@@ -10,7 +11,9 @@ from com.gwngames.pubscraper.Context import Context
 from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
 from com.gwngames.pubscraper.msg.AbstractMessage import AbstractMessage
 from com.gwngames.pubscraper.utils.ClassUtils import ClassUtils
+from com.gwngames.pubscraper.utils.Clock import Clock
 from com.gwngames.pubscraper.utils.JsonReader import JsonReader
+from com.gwngames.pubscraper.utils.Watchdog import Watchdog
 
 class AsyncQueue(queue.Queue):
 
@@ -44,7 +47,12 @@ class AsyncQueue(queue.Queue):
             self.logger.debug(f"Message routed for topic '{msg.message_type}': {msg.message_id}")
 
             try:
-                self.on_message(msg)
+                # Each fetch of the handler re-arms the deadline, a long listing is not a stall
+                thread = threading.get_ident()
+                with Watchdog().watch(f"Handler of {msg.message_type} {msg.message_id}",
+                                      self.ctx.get_config().get_value(ConfigConstants.HANDLER_STALL_SEC),
+                                      lambda: self.requeue_stalled(msg, thread), per_step=True):
+                    self.on_message(msg)
                 retries = 0
             except TimeoutException:
                 #  Network issues, ignore and re-send
@@ -61,17 +69,44 @@ class AsyncQueue(queue.Queue):
                 msg.prepare_for_retry()
                 self.logger.error(
                     f"[FAILURE] for topic '{msg.message_type}': {msg.message_id}, retrying in {retry_time} seconds...")
-                time.sleep(retry_time)
+                Clock.get().sleep(retry_time)
                 retries -= 1
 
         if exception_caught is True:
             self.logger.error(f"[CRITICAL FAILURE] for topic '{msg.message_type}': {msg.message_id}, aborting...")
             # TODO: add storing mechanism for recovery
 
+        from com.gwngames.pubscraper.scheduling.MessageRouter import MessageRouter
+        MessageRouter.get_instance().completed(msg)
+
         elapsed_time: float = (time.time() - start_time) * 1000
         self.logger.debug(
             f"Managed message for topic '{msg.message_type}': {msg.message_id} - Time: {elapsed_time:.3f} ms.")
 
+    def requeue_stalled(self, msg: AbstractMessage, thread: int):
+        """
+        Give up a message whose handler made no progress for handler_stall_sec and send a copy of it again.
+        The stalled thread cannot be interrupted and is left behind, holding the message: the drivers it leased and
+        the admission of the message are taken back, and its completion is ignored.
+
+        :param thread: The identifier of the thread of the handler.
+        """
+        from com.gwngames.pubscraper.scheduling.MessageRouter import MessageRouter
+        self.logger.error(f"[STALLED] for topic '{msg.message_type}': {msg.message_id}, requeueing...")
+        admission = self.admission(msg)
+        if admission is not None:
+            admission.abandon_leases(thread)
+        MessageRouter.get_instance().abandon(msg)
+        MessageRouter.get_instance().resend(msg.copy(), msg.priority)
+
+    def admission(self, msg: AbstractMessage):
+        """
+        :param msg: A message about to be dispatched.
+        :return: The capacity the message needs, with admit, dismiss, on_capacity and abandon_leases methods,
+                 None if it can always be dispatched.
+        """
+        return None
+
     @abstractmethod
     def on_message(self, msg: AbstractMessage) -> None:
         """
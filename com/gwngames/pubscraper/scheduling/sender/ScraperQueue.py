@@ -15,9 +15,12 @@ from com.gwngames.pubscraper.scraper.ifaces.CoreEduDataFetcher import CoreEduDat
 from com.gwngames.pubscraper.scraper.ifaces.DblpDataFetcher import DblpDataFetcher
 from com.gwngames.pubscraper.scraper.ifaces.ScholarDataFetcher import ScholarDataFetcher
 from com.gwngames.pubscraper.scraper.ifaces.ScimagoDataFetcher import ScimagoDataFetcher
+from com.gwngames.pubscraper.scraper.scraper.SeleniumDriverPool import SeleniumDriverManager
 
 class ScraperQueue(AsyncQueue):
     QUEUE: Final = QueueConstants.SCRAPER_QUEUE
+    FETCHERS: Final = {FetchScholarlyData: ScholarDataFetcher, FetchDblpData: DblpDataFetcher,
+                       FetchScimagoData: ScimagoDataFetcher, FetchCoreEduData: CoreEduDataFetcher}
 
     def __init__(self):
         super().__init__()
@@ -26,6 +29,15 @@ class ScraperQueue(AsyncQueue):
     def register_me(self) -> type:
         return ScraperQueue
 
+    def admission(self, msg: BaseMessage):
+        """
+        :return: The driver pool of the interface fetching the message.
+        """
+        fetcher = ScraperQueue.FETCHERS.get(type(msg))
+        if fetcher is None:
+            return None
+        return SeleniumDriverManager.get_instance(fetcher.SCRAPER.__name__)
+
     def on_message(self, msg: BaseMessage) -> None:
         self.logger.info("Received message: %s", msg)
 
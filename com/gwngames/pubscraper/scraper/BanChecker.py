@@ -3,9 +3,9 @@ import threading
 import time
 from random import Random
 
-from bs4 import BeautifulSoup
-
 from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+from com.gwngames.pubscraper.scraper.BanDetector import BanDetector
+from com.gwngames.pubscraper.scraper.scraper.Page import Page
 
 
 class BanChecker:
@@ -18,44 +18,61 @@ class BanChecker:
         """
         Check if a specific ban phrase is present in the HTML content.
         Args:
-            html_content (str): The HTML content of the page as a string.
+            html_content (str): The HTML content of the page, its text is extracted once when it is a Page.
             phrase (str): The specific phrase to check for. Default is Google's "We're sorry...".
 
         Returns:
             bool: True if the phrase is found, False otherwise.
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        text_content = soup.get_text(separator=' ', strip=True)
+        if phrase.lower() in Page.of(html_content).lower_text:
+            self.penalize()
+            return True
 
-        if phrase.lower() in text_content.lower():
-            min_wait_time = self.ctx.get_config().get_value(ConfigConstants.MIN_WAIT_TIME)
-            max_wait_time = self.ctx.get_config().get_value(ConfigConstants.MAX_WAIT_TIME)
+        return False
 
-            if Random().random() > 0.5 and max_wait_time > min_wait_time:
-                new_min_wait_time = min_wait_time + self.penalty
-                self.ctx.get_config().set_and_save(ConfigConstants.MIN_WAIT_TIME, new_min_wait_time)
+    def check_signals(self, html_content: str, interface_name: str) -> list[tuple[str, str]]:
+        """
+        Check the raw HTML for the signals registered for the interface in ban_signals, without parsing it.
+        The wait times are penalized, as for a ban phrase, only if a signal of the ban category is found.
 
-                # Ensure max wait time remains valid
-                if max_wait_time < new_min_wait_time + math.sqrt(new_min_wait_time):
-                    self.ctx.get_config().set_and_save(ConfigConstants.MAX_WAIT_TIME,
-                                                       new_min_wait_time + math.sqrt(new_min_wait_time))
-            else:
-                new_max_wait_time = max_wait_time + self.penalty
-                self.ctx.get_config().set_and_save(ConfigConstants.MAX_WAIT_TIME, new_max_wait_time)
+        :param html_content: The HTML content of the page.
+        :param interface_name: The scraper which fetched the page.
+        :return: Each signal found, with its category, see BanDetector.categories.
+        """
+        signals = BanDetector.get(interface_name).detect(html_content)
+        if BanDetector.BAN in BanDetector.categories(signals):
+            self.penalize()
+        return signals
 
-                # Ensure max wait time remains valid
-                if new_max_wait_time < min_wait_time + math.sqrt(min_wait_time):
-                    self.ctx.get_config().set_and_save(ConfigConstants.MAX_WAIT_TIME,
-                                                       min_wait_time + math.sqrt(min_wait_time))
+    def penalize(self):
+        """
+        Widen the wait between requests after a ban.
+        """
+        min_wait_time = self.ctx.get_config().get_value(ConfigConstants.MIN_WAIT_TIME)
+        max_wait_time = self.ctx.get_config().get_value(ConfigConstants.MAX_WAIT_TIME)
 
-            self.ctx.get_message_data().set_and_save("was_banned", True)
-            return True
+        if Random().random() > 0.5 and max_wait_time > min_wait_time:
+            new_min_wait_time = min_wait_time + self.penalty
+            self.ctx.get_config().set_and_save(ConfigConstants.MIN_WAIT_TIME, new_min_wait_time)
 
-        return False
+            # Ensure max wait time remains valid
+            if max_wait_time < new_min_wait_time + math.sqrt(new_min_wait_time):
+                self.ctx.get_config().set_and_save(ConfigConstants.MAX_WAIT_TIME,
+                                                   new_min_wait_time + math.sqrt(new_min_wait_time))
+        else:
+            new_max_wait_time = max_wait_time + self.penalty
+            self.ctx.get_config().set_and_save(ConfigConstants.MAX_WAIT_TIME, new_max_wait_time)
+
+            # Ensure max wait time remains valid
+            if new_max_wait_time < min_wait_time + math.sqrt(min_wait_time):
+                self.ctx.get_config().set_and_save(ConfigConstants.MAX_WAIT_TIME,
+                                                   min_wait_time + math.sqrt(min_wait_time))
+
+        self.ctx.get_message_data().set_and_save("was_banned", True)
 
     def reverse_logic(self):
         """
-        Perform the opposite of the logic specified in `has_ban_phrase`.
+        Perform the opposite of the logic specified in `penalize`.
         """
         min_wait_time = self.ctx.get_config().get_value(ConfigConstants.MIN_WAIT_TIME)
         max_wait_time = self.ctx.get_config().get_value(ConfigConstants.MAX_WAIT_TIME)
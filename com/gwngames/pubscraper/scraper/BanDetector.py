@@ -0,0 +1,78 @@
+import re
+import threading
+
+from com.gwngames.pubscraper.Context import Context
+from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+
+
+class BanDetector:
+    """
+    Detects the ban and error signals of an interface in the raw HTML of a page, in a single scan without parsing it.
+    The signals of each interface come from the ban_signals registry of the configuration, each with a category and
+    either a phrase, matched case-insensitively with any apostrophe and whitespace, or a regular expression matched
+    against the lowercased HTML.
+    They are compiled once into a single alternation, scanned over the lowercased HTML: the alternation stays
+    without groups so that the scan skips ahead to the possible first characters of a signal, the signal of a match
+    is then told by trying each pattern at its position.
+
+    :param signals: The registry entries of the interface.
+    """
+    BAN: str = "ban"
+    ERROR: str = "error"
+    END: str = "end"  # The listing has no more pages
+
+    APOSTROPHE = r"(?:'|’|&#39;|&#x27;|&rsquo;|&apos;)"
+
+    _detectors = {}
+    _lock = threading.Lock()
+
+    def __init__(self, signals: list[dict]):
+        self.signals = []
+        self._patterns = []
+        for signal in signals:
+            pattern = signal.get("pattern") or BanDetector._phrase_pattern(signal["phrase"])
+            self.signals.append((signal.get("phrase") or signal["pattern"], signal.get("category", BanDetector.BAN)))
+            self._patterns.append(re.compile(pattern))
+        self._regex = re.compile("|".join(f"(?:{pattern.pattern})" for pattern in self._patterns)) \
+            if self._patterns else None
+
+    @staticmethod
+    def _phrase_pattern(phrase: str) -> str:
+        words = [BanDetector.APOSTROPHE.join(re.escape(part) for part in re.split(r"['’]", word))
+                 for word in phrase.lower().split()]
+        return r"\s+".join(words)
+
+    @classmethod
+    def get(cls, interface_name: str) -> 'BanDetector':
+        """
+        :param interface_name: The scraper whose signals are detected.
+        :return: The detector compiled from the registry of the scraper.
+        """
+        with cls._lock:
+            if interface_name not in cls._detectors:
+                registry = Context().get_config().get_value(ConfigConstants.BAN_SIGNALS) or {}
+                cls._detectors[interface_name] = BanDetector(registry.get(interface_name, []))
+            return cls._detectors[interface_name]
+
+    def detect(self, html: str) -> list[tuple[str, str]]:
+        """
+        :param html: The raw HTML of the page.
+        :return: Each signal found in the page, with its category, in the order of their first occurrence.
+        """
+        if self._regex is None:
+            return []
+        lowered = html.lower()
+        found = {}
+        for match in self._regex.finditer(lowered):
+            # The alternation takes the first pattern matching at the position
+            index = next(i for i, pattern in enumerate(self._patterns) if pattern.match(lowered, match.start()))
+            found.setdefault(index, self.signals[index])
+        return list(found.values())
+
+    @staticmethod
+    def categories(signals: list[tuple[str, str]]) -> set[str]:
+        """
+        :param signals: Signals found by detect.
+        :return: Their categories.
+        """
+        return {category for _, category in signals}
@@ -2,7 +2,8 @@ import json
 import re
 
 import requests
-from bs4 import BeautifulSoup
+
+from com.gwngames.pubscraper.scraper.scraper.HtmlParser import HtmlParser
 
 
 class NameFetcher:
@@ -55,7 +56,7 @@ class NameFetcher:
     @staticmethod
     def generate_roots(url: str):
         html = NameFetcher._fetch_html(url)
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = HtmlParser.parse(html)
         # List to store JSON-like objects found in the HTML
         json_objects = []
         # Recursively find JSON-like objects in the HTML structure
@@ -63,6 +64,4 @@ class NameFetcher:
         # Extract names from the JSON-like objects
         names = NameFetcher.extract_names_from_json(json_objects)
         if names is not None:
-            return list(reversed(names))
-        else:
-            return []
\ No newline at end of file
+            yield from reversed(names)
\ No newline at end of file
@@ -1,8 +1,9 @@
+import itertools
 import logging
+import random
 import threading
 import time
-
-from numpy import random
+from typing import Iterable
 
 from com.gwngames.pubscraper.Context import Context
 from com.gwngames.pubscraper.comm.OutSender import OutSender
@@ -23,6 +24,7 @@ from com.gwngames.pubscraper.utils.StringUtils import StringUtils
 
 class WebScraper:
     logger = logging.getLogger('WebScraper')
+    SHUFFLE_SEED_KEY = "root_shuffle_seed"
 
     class SemicolonFoundException(Exception):
         pass
@@ -32,28 +34,46 @@ class WebScraper:
 
     def start(self):
         if self.thread is None:
-            self.thread = threading.Thread(target=self.scrape_interfaces(), daemon=True)
+            self.thread = threading.Thread(target=self.scrape_interfaces, daemon=True)
             self.thread.start()
             WebScraper.logger.debug("Massive General Scraping started")
 
+    @staticmethod
+    def generate_roots(config: JsonReader):
+        """
+        Lazily generate the root authors, in the same order across restarts.
+        """
+        author_from: str = config.get_value(ConfigConstants.AUTHORS_REF)
+        root_authors: str = config.get_value(ConfigConstants.ROOT_AUTHORS)
+        roots = iter([])
+        if author_from is not None:
+            roots = itertools.chain(roots, NameFetcher.generate_roots(author_from))
+        if root_authors is not None and root_authors != '':
+            roots = itertools.chain(roots, StringUtils.process_string(root_authors))
+        yield from WebScraper.order_roots(config, roots)
+
+    @staticmethod
+    def order_roots(config: JsonReader, roots: Iterable[str]) -> Iterable[str]:
+        """
+        Shuffle the roots if shuffle_roots is set, in the same order across restarts.
+        Shuffling needs the whole list, its seed is persisted in the message statistics.
+        """
+        if not config.get_value(ConfigConstants.SHUFFLE_ROOTS):
+            return roots
+        stats = Context().get_message_data()
+        if stats.get_value(WebScraper.SHUFFLE_SEED_KEY) is None:
+            stats.set_and_save(WebScraper.SHUFFLE_SEED_KEY, random.randint(0, 2 ** 31 - 1))
+        roots = list(roots)
+        random.Random(stats.get_value(WebScraper.SHUFFLE_SEED_KEY)).shuffle(roots)
+        return roots
+
     @staticmethod
     def scrape_interfaces():
         config = JsonReader(JsonReader.CONFIG_FILE_NAME)
 
-        # definition of roots
-        scraping_authors: list = []
-        author_from: str = config.get_value(ConfigConstants.AUTHORS_REF)
-        root_authors: str = config.get_value(ConfigConstants.ROOT_AUTHORS)
         core_current_pages = int(config.get_value(ConfigConstants.CORE_PAGES_NUMBER))
         years = [str(year) for year in range(1999, __import__('datetime').datetime.now().year)]
         edu_pages = [str(i) for i in range(core_current_pages, 0, -1)]
-        if author_from is not None:
-            scraping_authors += NameFetcher.generate_roots(author_from)
-        if root_authors is not None and root_authors != '':
-            scraping_authors += StringUtils.process_string(root_authors)
-
-        if config.get_value(ConfigConstants.SHUFFLE_ROOTS):
-            random.shuffle(scraping_authors)
 
         # ---- RECOVERY ----
         if config.get_value(ConfigConstants.RECOVERY_INST) is True:
@@ -70,12 +90,9 @@ class WebScraper:
 
             iface_instance = iface()
 
-            if isinstance(iface_instance, ScholarDataFetcher):
-                WebScraper.logger.info("Fetching for %s - Authors: %s", iface.__name__, scraping_authors)
-                iface_instance.start_interface_fetching(opt_arg=scraping_authors)
-            elif isinstance(iface_instance, DblpDataFetcher):
-                WebScraper.logger.info("Fetching for %s - Authors: %s", iface.__name__, scraping_authors)
-                iface_instance.start_interface_fetching(opt_arg=scraping_authors)
+            if iface.ROOT_MESSAGE_TYPE is not None:
+                WebScraper.logger.info("Fetching for %s - seeding root authors", iface.__name__)
+                iface_instance.start_interface_fetching(opt_arg=WebScraper.generate_roots(config))
             elif isinstance(iface_instance, ScimagoDataFetcher):
                 WebScraper.logger.info("Fetching for %s - Years: %s", iface.__name__, years)
                 iface_instance.start_interface_fetching(opt_arg=years)
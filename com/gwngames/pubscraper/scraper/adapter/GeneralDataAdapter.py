@@ -15,3 +15,8 @@ class GeneralDataAdapter:
     def add_property(self, property_name: str, property_value):
         self._data_properties[property_name] = property_value
         return self
+
+    def copy(self) -> 'GeneralDataAdapter':
+        adapter = GeneralDataAdapter()
+        adapter._data_properties = dict(self._data_properties)
+        return adapter
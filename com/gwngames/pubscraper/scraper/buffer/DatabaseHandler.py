@@ -1,11 +1,16 @@
 import logging
 import time
 from datetime import datetime
+from typing import Final
 
 from couchdb import ResourceConflict, ResourceNotFound, Unauthorized, ServerError, Database
 
 
 class DatabaseHandler:
+    DATE_FORMAT: Final = "%Y-%m-%d %H:%M:%S"
+    RECRAWL_DESIGN_ID: Final = "_design/recrawl"
+    RECRAWL_VIEW: Final = "recrawl/by_type_update_date"
+
     def __init__(self, client, db_name, logger_name='DatabaseHandler'):
         self.client = client
         self.db_name = db_name
@@ -39,7 +44,7 @@ class DatabaseHandler:
     def insert_or_update_document(self, doc_type, doc_id, doc):
         doc['_id'] = doc_id
         doc['type'] = doc_type
-        doc['update_date'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        doc['update_date'] = datetime.now().strftime(DatabaseHandler.DATE_FORMAT)
 
         retry_count = 0
         max_retries = 3
@@ -66,3 +71,43 @@ class DatabaseHandler:
 
         # If max retries exceeded, raise an exception
         raise Exception(f"Failed to save document of type {doc_type} with id {doc_id} after {max_retries} retries.")
+
+    def ensure_recrawl_view(self):
+        """
+        Create the design document indexing entities by type and update date, if missing.
+        Dates are stored as sortable strings, so the view keys come out oldest first.
+        """
+        if self.get_document(DatabaseHandler.RECRAWL_DESIGN_ID) is not None:
+            return
+        try:
+            self.db.save({
+                '_id': DatabaseHandler.RECRAWL_DESIGN_ID,
+                'language': 'javascript',
+                'views': {
+                    'by_type_update_date': {
+                        'map': "function(doc) { if (doc.type !== undefined && doc.update_date) "
+                               "{ emit([doc.type, doc.update_date], null); } }"
+                    }
+                }
+            })
+            self.logger.info(f"Created recrawl view for database {self.db_name}.")
+        except ResourceConflict:
+            self.logger.debug(f"Recrawl view for database {self.db_name} already created.")
+
+    def get_stale_documents(self, doc_type, older_than: datetime, limit: int) -> list:
+        """
+        Retrieve the documents of a given type last updated before a date, oldest first.
+
+        :param doc_type: The type of the documents, i.e. the phase that produced them.
+        :param older_than: Only documents updated strictly before this date are returned.
+        :param limit: The maximum number of documents to return.
+        :return: The list of stale documents.
+        """
+        self.ensure_recrawl_view()
+        rows = self.db.view(DatabaseHandler.RECRAWL_VIEW,
+                            startkey=[doc_type],
+                            endkey=[doc_type, older_than.strftime(DatabaseHandler.DATE_FORMAT)],
+                            inclusive_end=False,
+                            limit=limit,
+                            include_docs=True)
+        return [row.doc for row in rows]
@@ -18,6 +18,7 @@ from com.gwngames.pubscraper.utils.JsonReader import JsonReader
 
 class CoreEduDataFetcher(GeneralDataFetcher):
     INTERFACE_ID: Final = 'core_edu'
+    SCRAPER: Final = CoreEduScraper  # Owner of the driver pool of the interface
 
     def __init__(self):
         super().__init__()
@@ -60,3 +61,15 @@ class CoreEduDataFetcher(GeneralDataFetcher):
 
     def get_variant_type(self) -> int:
         return EntityVidConstants.CORE_EDU_VID
+
+    def get_refresh_phases(self) -> list[int]:
+        return [EntityCidConstants.CONFERENCE]
+
+    def get_refresh_params(self, phase_ref: int, entity: Document) -> list | None:
+        if phase_ref == EntityCidConstants.CONFERENCE:
+            return [int(entity["_id"])]
+        return None
+
+    def generate_fetch_message(self, adapter: GeneralDataAdapter) -> FetchCoreEduData:
+        return FetchCoreEduData(MessageConstants.MSG_CORE_CONFERENCE, adapter)
+
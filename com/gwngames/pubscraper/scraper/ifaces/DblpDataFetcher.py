@@ -1,5 +1,5 @@
 import logging
-from typing import Final
+from typing import Final, Iterable
 
 from couchdb import Document
 
@@ -8,7 +8,7 @@ from com.gwngames.pubscraper.constants.EntityVidConstants import EntityVidConsta
 from com.gwngames.pubscraper.constants.MessageConstants import MessageConstants
 from com.gwngames.pubscraper.constants.PriorityConstants import PriorityConstants
 from com.gwngames.pubscraper.msg.scraper.FetchDblpData import FetchDblpData
-from com.gwngames.pubscraper.scheduling.MessageRouter import MessageRouter
+from com.gwngames.pubscraper.scheduling.RootSeeder import RootSeeder
 from com.gwngames.pubscraper.scraper.adapter.AdapterPropertiesConstants import AdapterPropertiesConstants
 from com.gwngames.pubscraper.scraper.adapter.GeneralDataAdapter import GeneralDataAdapter
 from com.gwngames.pubscraper.scraper.ifaces.GeneralDataFetcher import GeneralDataFetcher
@@ -18,6 +18,8 @@ from com.gwngames.pubscraper.utils.JsonReader import JsonReader
 
 class DblpDataFetcher(GeneralDataFetcher):
     INTERFACE_ID: Final = 'dblp'
+    SCRAPER: Final = DblpScraper  # Owner of the driver pool of the interface
+    ROOT_MESSAGE_TYPE: Final = MessageConstants.MSG_DBLP_AUTHOR
     authors_seen = []
     def __init__(self):
         super().__init__()
@@ -56,13 +58,14 @@ class DblpDataFetcher(GeneralDataFetcher):
 
         return super(DblpDataFetcher, self).prepare_next_phase(phase_ref, current_entity, phase_depth=phase_depth, prev_adapter=prev_adapter)
 
-    def _start_interface_collectors(self, opt_arg: list):
-        for author_name in opt_arg:
-            adapter = self.generate_fetch_adapter(EntityCidConstants.PUB)
-            adapter.add_property(AdapterPropertiesConstants.IFACE_FX_PARAM_LIST, [author_name])
-            adapter.add_property(AdapterPropertiesConstants.EXPECTED_ID, author_name)
-            MessageRouter.get_instance().send_message(FetchDblpData(MessageConstants.MSG_DBLP_AUTHOR, adapter),
-                                    PriorityConstants.PUB_REQ)
+    def _start_interface_collectors(self, opt_arg: Iterable[str]):
+        RootSeeder(self, opt_arg).run()
+
+    def generate_root_message(self, root: str) -> tuple[FetchDblpData, int]:
+        adapter = self.generate_fetch_adapter(EntityCidConstants.PUB)
+        adapter.add_property(AdapterPropertiesConstants.IFACE_FX_PARAM_LIST, [root])
+        adapter.add_property(AdapterPropertiesConstants.EXPECTED_ID, root)
+        return FetchDblpData(self.ROOT_MESSAGE_TYPE, adapter), PriorityConstants.PUB_REQ
 
     def get_interface_id(self) -> str:
         return self.INTERFACE_ID
@@ -70,3 +73,14 @@ class DblpDataFetcher(GeneralDataFetcher):
     def get_variant_type(self) -> int:
         return EntityVidConstants.DBLP_VID
 
+    def get_refresh_phases(self) -> list[int]:
+        return [EntityCidConstants.PUB]
+
+    def get_refresh_params(self, phase_ref: int, entity: Document) -> list | None:
+        if phase_ref == EntityCidConstants.PUB:
+            return [entity["_id"]]
+        return None
+
+    def generate_fetch_message(self, adapter: GeneralDataAdapter) -> FetchDblpData:
+        return FetchDblpData(MessageConstants.MSG_DBLP_AUTHOR, adapter)
+
@@ -18,11 +18,13 @@ from com.gwngames.pubscraper.scraper.adapter.AdapterPropertiesConstants import A
 from com.gwngames.pubscraper.scraper.adapter.GeneralDataAdapter import GeneralDataAdapter
 from com.gwngames.pubscraper.scraper.buffer.DatabaseHandler import DatabaseHandler
 from com.gwngames.pubscraper.utils.ClassUtils import ClassUtils
+from com.gwngames.pubscraper.utils.HashUtils import HashUtils
 
 
 class GeneralDataFetcher:
     duplicate_lock = threading.Lock()
     seen_ids = []
+    ROOT_MESSAGE_TYPE: str = None  # Type of the root messages, None if the interface is not seeded with root authors
 
     def __init__(self):
         self.ctx = Context()
@@ -94,6 +96,7 @@ class GeneralDataFetcher:
             interface_fx_ref = adapter.get_property(AdapterPropertiesConstants.PHASE_REF)
 
             entity_none_or_outdated = self.is_outdated(existing_object)
+            entity_unchanged = False
 
             if entity_none_or_outdated:
                 self.logger.info("Entity outdated or not found for ID: %s", existing_data_id)
@@ -124,15 +127,28 @@ class GeneralDataFetcher:
                     if adapter.get_property(AdapterPropertiesConstants.MULTI_RESULT, can_fail=False) is True:
                         fetched_entity[AdapterPropertiesConstants.MULTI_RESULT] = True
 
-                    self.logger.info("Inserting or updating document in data source for content: %s - %s",
-                                      data.content, existing_data_id)
-                    data_source.insert_or_update_document(data.content, existing_data_id, fetched_entity)
+                    content_hash = HashUtils.content_hash(fetched_entity)
+                    entity_unchanged = (existing_object is not None
+                                        and existing_object.get("sent") is True
+                                        and existing_object.get("content_hash") == content_hash)
+                    if existing_object is not None:
+                        self.record_refresh(entity_unchanged)
+
+                    if entity_unchanged:
+                        # Already delivered with the same payload, only the refresh date is bumped
+                        self.logger.info("Entity unchanged since last update: %s - %s", data.content, existing_data_id)
+                        data_source.insert_or_update_document(data.content, existing_data_id, existing_object)
+                    else:
+                        fetched_entity["content_hash"] = content_hash
+                        self.logger.info("Inserting or updating document in data source for content: %s - %s",
+                                          data.content, existing_data_id)
+                        data_source.insert_or_update_document(data.content, existing_data_id, fetched_entity)
             else:
                 self.logger.info("Entity is up-to-date: %s - ID: %s", data.content, existing_data_id)
                 fetched_entity = existing_object
 
             # Step 4 - Request serialization for new object
-            if entity_none_or_outdated and fetched_entity is not None:
+            if entity_none_or_outdated and fetched_entity is not None and not entity_unchanged:
                 self.logger.info("Requesting serialization for content: %s - ID: %s", data.content, existing_data_id)
                 serialize_entity_msg = SerializeEntity(data.content,
                                                        entity_id=existing_data_id,
@@ -188,13 +204,70 @@ class GeneralDataFetcher:
             return True
         if entity.get("serialized") is None or entity.get("serialized") is False:
             return True
-        decoded_date = datetime.strptime(entity.get("update_date"), "%Y-%m-%d %H:%M:%S")
+        decoded_date = datetime.strptime(entity.get("update_date"), DatabaseHandler.DATE_FORMAT)
         time_difference = datetime.now() - decoded_date
-        if abs(time_difference) > timedelta(seconds=self.ctx.get_config().get_value(ConfigConstants.MIN_SECONDS_BEWTWEEN_UPDATES)):
+        if abs(time_difference) > timedelta(seconds=self.get_phase_ttl(entity.get("type"))):
             self.logger.info("[General] Entity outdated: " + str(entity.get("_id")))
             return True
         return False
 
+    def get_phase_ttl(self, phase_ref) -> int:
+        """
+        :param phase_ref: The phase which produced the entity, as stored in its type.
+        :return: The seconds after which an entity of the phase must be refreshed.
+        """
+        phase_ttls: dict = self.ctx.get_config().get_value(ConfigConstants.PHASE_TTL_SEC) or {}
+        ttl = phase_ttls.get(str(phase_ref))
+        if ttl is None:
+            ttl = self.ctx.get_config().get_value(ConfigConstants.MIN_SECONDS_BEWTWEEN_UPDATES)
+        return ttl
+
+    def get_refresh_phases(self) -> list[int]:
+        """
+        :return: The phases whose entities can be re-fetched on their own by the recrawl planner.
+        """
+        return []
+
+    def get_refresh_params(self, phase_ref: int, entity: Document) -> list | None:
+        """
+        Rebuild the interface function parameters that produced a stored entity.
+
+        :param phase_ref: The phase which produced the entity.
+        :param entity: The stored entity.
+        :return: The parameter list, None if the entity cannot be refreshed on its own.
+        """
+        return None
+
+    @abstractmethod
+    def generate_fetch_message(self, adapter: GeneralDataAdapter) -> FetchGeneralData:
+        pass
+
+    @abstractmethod
+    def generate_root_message(self, root: str) -> tuple[FetchGeneralData, int]:
+        """
+        Build the message starting the crawl of the interface from a root author,
+        only called on interfaces with a ROOT_MESSAGE_TYPE.
+
+        :param root: The name of the root author.
+        :return: The message and its priority.
+        """
+        pass
+
+    def record_refresh(self, skipped: bool):
+        """
+        Keep track of how many refreshes of existing entities did not need the outsender pipeline.
+
+        :param skipped: True if the refreshed entity was unchanged and its serialization was skipped.
+        """
+        stats = self.ctx.get_message_data()
+        interface_id = self.get_interface_id()
+        refreshes = stats.increment("refresh_count_" + interface_id)
+        skips = stats.get_value("refresh_skipped_" + interface_id) or 0
+        if skipped:
+            skips = stats.increment("refresh_skipped_" + interface_id)
+        self.logger.info("[%s] Unchanged refresh skip rate: %.1f%% (%s/%s)", interface_id,
+                         100.0 * skips / refreshes, skips, refreshes)
+
     def generate_adapter_with_prio(self, ref: int, prio: int, param_list: list, expected_id: str):
         if param_list is None:
             self.logger.warning(f"None FX parameters found: {ref} - {prio}")
@@ -1,6 +1,5 @@
 import logging
-import time
-from typing import Final, Set
+from typing import Final, Set, Iterable
 
 from couchdb import Document
 
@@ -9,7 +8,7 @@ from com.gwngames.pubscraper.constants.EntityVidConstants import EntityVidConsta
 from com.gwngames.pubscraper.constants.MessageConstants import MessageConstants
 from com.gwngames.pubscraper.constants.PriorityConstants import PriorityConstants
 from com.gwngames.pubscraper.msg.scraper.FetchScholarData import FetchScholarlyData
-from com.gwngames.pubscraper.scheduling.MessageRouter import MessageRouter
+from com.gwngames.pubscraper.scheduling.RootSeeder import RootSeeder
 from com.gwngames.pubscraper.scraper.adapter.AdapterPropertiesConstants import AdapterPropertiesConstants
 from com.gwngames.pubscraper.scraper.adapter.GeneralDataAdapter import GeneralDataAdapter
 from com.gwngames.pubscraper.scraper.ifaces.GeneralDataFetcher import GeneralDataFetcher
@@ -19,6 +18,8 @@ from com.gwngames.pubscraper.utils.JsonReader import JsonReader
 
 class ScholarDataFetcher(GeneralDataFetcher):
     INTERFACE_ID: Final = 'google_scholar'
+    SCRAPER: Final = ScholarScraper  # Owner of the driver pool of the interface
+    ROOT_MESSAGE_TYPE: Final = MessageConstants.MSG_SCHOLARLY_AUTHOR
 
     PUB_AUTHORS: Set = set()
 
@@ -80,7 +81,7 @@ class ScholarDataFetcher(GeneralDataFetcher):
         elif phase_ref == EntityCidConstants.PUB:
             self.logger.debug("Processing Google Scholar Publication phase")
             cit_graph = current_entity.get("citation_graph", [])
-            authors = current_entity.get("authors")
+            authors = current_entity.get("authors", [])
             pub_id = current_entity.get("publication_id")
 
             for author in authors:
@@ -102,17 +103,29 @@ class ScholarDataFetcher(GeneralDataFetcher):
 
         return super(ScholarDataFetcher, self).prepare_next_phase(phase_ref, current_entity, phase_depth, prev_adapter)
 
-    def _start_interface_collectors(self, opt_arg: list):
-        for author in opt_arg:
-            author_adapter = self.generate_fetch_adapter(EntityCidConstants.AUTHOR)
-            author_adapter.add_property(AdapterPropertiesConstants.IFACE_FX_PARAM_LIST, [author])
-            author_adapter.add_property(AdapterPropertiesConstants.EXPECTED_ID, author)
-            MessageRouter.get_instance().send_message(FetchScholarlyData(MessageConstants.MSG_SCHOLARLY_AUTHOR,
-                author_adapter),
-                PriorityConstants.AUTHOR_REQ)
-            time.sleep(30)
+    def _start_interface_collectors(self, opt_arg: Iterable[str]):
+        RootSeeder(self, opt_arg).run()
+
+    def generate_root_message(self, root: str) -> tuple[FetchScholarlyData, int]:
+        author_adapter = self.generate_fetch_adapter(EntityCidConstants.AUTHOR)
+        author_adapter.add_property(AdapterPropertiesConstants.IFACE_FX_PARAM_LIST, [root])
+        author_adapter.add_property(AdapterPropertiesConstants.EXPECTED_ID, root)
+        return FetchScholarlyData(self.ROOT_MESSAGE_TYPE, author_adapter), PriorityConstants.AUTHOR_REQ
 
     def get_variant_type(self):
         return EntityVidConstants.SCHOLAR_VID
 
+    def get_refresh_phases(self) -> list[int]:
+        return [EntityCidConstants.AUTHOR, EntityCidConstants.PUB]
+
+    def get_refresh_params(self, phase_ref: int, entity: Document) -> list | None:
+        if phase_ref == EntityCidConstants.AUTHOR:
+            return [entity["_id"]]
+        elif phase_ref == EntityCidConstants.PUB and entity.get("publication_url"):
+            return [entity["publication_url"]]
+        return None
+
+    def generate_fetch_message(self, adapter: GeneralDataAdapter) -> FetchScholarlyData:
+        return FetchScholarlyData(MessageConstants.MSG_SCHOLARLY_AUTHOR, adapter)
+
 
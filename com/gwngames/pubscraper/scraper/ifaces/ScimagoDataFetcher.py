@@ -18,6 +18,7 @@ from com.gwngames.pubscraper.utils.JsonReader import JsonReader
 
 class ScimagoDataFetcher(GeneralDataFetcher):
     INTERFACE_ID: Final = 'scimago'
+    SCRAPER: Final = ScimagoScraper  # Owner of the driver pool of the interface
 
     def __init__(self):
         super().__init__()
@@ -77,3 +78,16 @@ class ScimagoDataFetcher(GeneralDataFetcher):
 
     def get_variant_type(self) -> int:
         return EntityVidConstants.SCIMAGO_VID
+
+    def get_refresh_phases(self) -> list[int]:
+        return [EntityCidConstants.JOURNAL]
+
+    def get_refresh_params(self, phase_ref: int, entity: Document) -> list | None:
+        if phase_ref == EntityCidConstants.JOURNAL:
+            year, page = entity["_id"].split("_", 1)
+            return [year, page]
+        return None
+
+    def generate_fetch_message(self, adapter: GeneralDataAdapter) -> FetchScimagoData:
+        return FetchScimagoData(MessageConstants.MSG_SCIMAGO_JOURNAL, adapter)
+
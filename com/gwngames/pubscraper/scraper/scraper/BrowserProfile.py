@@ -0,0 +1,82 @@
+class BrowserProfile:
+    """
+    The resources a browser is allowed to load.
+    Extractors only need the DOM, so images, fonts, media and trackers are wasted Tor bandwidth, CPU and memory.
+    Presets are chosen per interface with the browser_profiles configuration, interfaces not listed run the full one.
+
+    :param name: The name of the preset.
+    :param block_images: Do not load images.
+    :param block_fonts: Do not load web fonts.
+    :param block_media: Do not preload or play audio and video.
+    :param block_trackers: Do not load known tracker hosts.
+    """
+    TRACKER_HOSTS = ["google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com",
+                     "googleadservices.com", "facebook.net", "hotjar.com", "scorecardresearch.com", "addthis.com",
+                     "sharethis.com"]
+
+    # Url patterns blocked over the DevTools protocol in Chrome, which has no preferences for fonts and media
+    IMAGE_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"]
+    FONT_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+    MEDIA_PATTERNS = ["*.mp4", "*.webm", "*.mp3", "*.ogg", "*.m3u8"]
+
+    def __init__(self, name: str, block_images: bool = False, block_fonts: bool = False, block_media: bool = False,
+                 block_trackers: bool = False):
+        self.name = name
+        self.block_images = block_images
+        self.block_fonts = block_fonts
+        self.block_media = block_media
+        self.block_trackers = block_trackers
+
+    @staticmethod
+    def get(name: str) -> 'BrowserProfile':
+        """
+        :param name: The name of the preset, None for the full one.
+        :return: The preset.
+        """
+        if name is None:
+            return FULL
+        if name not in PRESETS:
+            raise ValueError(f"Unknown browser profile: {name}")
+        return PRESETS[name]
+
+    def firefox_preferences(self) -> dict:
+        """
+        :return: The preferences applying the profile, with their default value for resources that are allowed.
+        """
+        return {
+            "permissions.default.image": 2 if self.block_images else 1,
+            "gfx.downloadable_fonts.enabled": not self.block_fonts,
+            "media.autoplay.default": 5 if self.block_media else 1,
+            "media.preload.default": 0 if self.block_media else 1,
+            "media.preload.auto": 0 if self.block_media else 2,
+            "privacy.trackingprotection.enabled": self.block_trackers,
+            # Extra hosts added to the tracking protection list
+            "urlclassifier.trackingTable.testEntries": ",".join(BrowserProfile.TRACKER_HOSTS)
+            if self.block_trackers else "",
+        }
+
+    def blocked_urls(self) -> list[str]:
+        """
+        :return: The url patterns applying the profile through Network.setBlockedURLs.
+        """
+        patterns = []
+        if self.block_images:
+            patterns += BrowserProfile.IMAGE_PATTERNS
+        if self.block_fonts:
+            patterns += BrowserProfile.FONT_PATTERNS
+        if self.block_media:
+            patterns += BrowserProfile.MEDIA_PATTERNS
+        if self.block_trackers:
+            patterns += [f"*://*.{host}/*" for host in BrowserProfile.TRACKER_HOSTS]
+        return patterns
+
+    def __str__(self) -> str:
+        return self.name
+
+
+FULL = BrowserProfile("full")
+PRESETS = {
+    "full": FULL,
+    "lean": BrowserProfile("lean", block_images=True, block_fonts=True, block_media=True, block_trackers=True),
+    "no_images": BrowserProfile("no_images", block_images=True, block_media=True),
+}
@@ -0,0 +1,27 @@
+import os
+import threading
+
+
+class BrowserScript:
+    """
+    JavaScript bundled in the js directory, run in the page through execute_script.
+    Scripts extract only the fields needed by an extractor and return them as a small JSON structure,
+    instead of transferring the whole page source over the WebDriver protocol and parsing it again in Python.
+    A script returns null when the page does not hold the expected data, callers then fall back to the HTML.
+    """
+    DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "js")
+
+    _sources = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def load(name: str) -> str:
+        """
+        :param name: The file name of the script, without extension.
+        :return: The source of the script, read once.
+        """
+        with BrowserScript._lock:
+            if name not in BrowserScript._sources:
+                with open(os.path.join(BrowserScript.DIRECTORY, name + ".js"), encoding="utf-8") as f:
+                    BrowserScript._sources[name] = f.read()
+            return BrowserScript._sources[name]
@@ -2,9 +2,8 @@ import logging
 import re
 import time
 
-from bs4 import BeautifulSoup
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, JavascriptException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from twocaptcha import TwoCaptcha
@@ -14,6 +13,8 @@ from com.gwngames.pubscraper.constants.CaptchaConstants import CaptchaActionCons
 from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
 from com.gwngames.pubscraper.exception.IgnoreCaptchaException import IgnoreCaptchaException
 from com.gwngames.pubscraper.exception.UninplementedCaptchaException import UninmplementedCaptchaException
+from com.gwngames.pubscraper.scraper.scraper.BrowserScript import BrowserScript
+from com.gwngames.pubscraper.scraper.scraper.Page import Page
 
 
 class CaptchaHandler:
@@ -33,9 +34,34 @@ class CaptchaHandler:
         self.captcha_url = None
         self.captcha_type = None
 
-    def check_for_captcha(self) -> bool:
+    def check_for_captcha(self, page: Page = None) -> bool:
+        """
+        :param page: The page already obtained from the driver, if any, parsed instead of its source when the
+                     script cannot run.
+        """
         try:
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
+            # Checked in the page, the source is only transferred and parsed when the script cannot run
+            captcha = self.driver.execute_script(BrowserScript.load("captcha"))
+        except JavascriptException as e:
+            self.logger.warning(f"Captcha script failed, checking the HTML: {e.msg}")
+            return self._check_html_for_captcha(page)
+
+        if not captcha["found"]:
+            self.logger.info("No captcha detected.")
+            return False
+        self.logger.warning("Captcha found! Attempting to handle...")
+        if captcha["site_key"] is None or captcha["captcha_url"] is None:
+            self.logger.error("Captcha site key or iframe not found.")
+            return False
+        self.site_key = captcha["site_key"]
+        self.captcha_url = captcha["captcha_url"]
+        self.captcha_type = CaptchaConstants.RECAPTCHA_V2
+        self.logger.info(f"Captcha detected: type={self.captcha_type}, site_key={self.site_key}")
+        return True
+
+    def _check_html_for_captcha(self, page: Page = None) -> bool:
+        try:
+            soup = (page if page is not None else Page(self.driver.page_source)).soup
             for script in soup.find_all('script'):
                 script_content = script.string or ''
                 if 'grecaptcha.render' in script_content:
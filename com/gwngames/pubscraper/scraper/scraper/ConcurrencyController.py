@@ -0,0 +1,76 @@
+import logging
+import threading
+
+from com.gwngames.pubscraper.Context import Context
+from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+from com.gwngames.pubscraper.utils.Clock import Clock
+
+
+class ConcurrencyController:
+    """
+    Additive increase, multiplicative decrease of the number of drivers of an interface that may be leased at once.
+    Every healthy fetch grows the limit by 1 / limit, so by about one driver per round of fetches,
+    while a ban, captcha or timeout cuts it by aimd_decrease_factor, at most once per aimd_cooldown_sec
+    so that the fetches already in flight when a site pushes back count as one signal.
+    The limit is exported to the message stats and restored from them on start.
+
+    :param interface_name: The scraper owning the drivers.
+    :param maximum: The number of drivers of the pool.
+    """
+    MINIMUM = 1
+    LIMIT_KEY = "concurrency_limit_"
+
+    def __init__(self, interface_name: str, maximum: int):
+        self.interface_name = interface_name
+        self.maximum = maximum
+        self.ctx = Context()
+        self.logger = logging.getLogger(f"ConcurrencyController-{interface_name}")
+        self.enabled = bool(self.ctx.get_config().get_value(ConfigConstants.AIMD_ENABLED))
+        stored = self.ctx.get_message_data().get_value(ConcurrencyController.LIMIT_KEY + interface_name)
+        self._limit = float(min(max(stored or ConcurrencyController.MINIMUM, ConcurrencyController.MINIMUM), maximum))
+        self._cut_until = 0.0
+        self._lock = threading.Lock()
+
+    def limit(self) -> int:
+        """
+        :return: The number of drivers that may be leased at once.
+        """
+        if not self.enabled:
+            return self.maximum
+        return int(self._limit)
+
+    def on_success(self, latency: float) -> bool:
+        """
+        :param latency: Seconds spent on the request, politeness wait excluded.
+        :return: True if the limit grew by a driver.
+        """
+        if latency > self.ctx.get_config().get_value(ConfigConstants.AIMD_LATENCY_SEC):
+            self.logger.debug(f"Slow fetch of {latency:.1f} seconds, limit kept.")
+            return False
+        with self._lock:
+            previous = self.limit()
+            self._limit = min(self._limit + 1 / self._limit, float(self.maximum))
+            return self._changed(previous, "healthy fetches")
+
+    def on_congestion(self, reason: str):
+        """
+        :param reason: The signal, for logging: ban, captcha or timeout.
+        """
+        config = self.ctx.get_config()
+        with self._lock:
+            now = Clock.get().time()
+            if now < self._cut_until:
+                return
+            self._cut_until = now + config.get_value(ConfigConstants.AIMD_COOLDOWN_SEC)
+            previous = self.limit()
+            self._limit = max(self._limit * config.get_value(ConfigConstants.AIMD_DECREASE_FACTOR),
+                              float(ConcurrencyController.MINIMUM))
+            self._changed(previous, reason)
+
+    def _changed(self, previous: int, reason: str) -> bool:
+        if self.limit() == previous:
+            return False
+        self.logger.info(f"Concurrency limit of {self.interface_name}: {previous} -> {self.limit()} ({reason}).")
+        self.ctx.get_message_data().set_and_save(ConcurrencyController.LIMIT_KEY + self.interface_name,
+                                                 self.limit())
+        return True
@@ -1,14 +1,13 @@
 import threading
-import time
-
-import requests
-from bs4 import BeautifulSoup
-from requests import HTTPError, Timeout
 
 from com.gwngames.pubscraper.Context import Context
 from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
 from com.gwngames.pubscraper.scraper.BanChecker import BanChecker
+from com.gwngames.pubscraper.scraper.BanDetector import BanDetector
 from com.gwngames.pubscraper.scraper.scraper.GeneralScraper import GeneralScraper
+from com.gwngames.pubscraper.scraper.scraper.Page import Page
+from com.gwngames.pubscraper.scraper.scraper.PageRegion import PageRegion
+from com.gwngames.pubscraper.scraper.scraper.PageSpec import PageSpec
 import urllib.parse
 
 
@@ -55,6 +54,15 @@ class DblpScraper(GeneralScraper):
     journal_names = {}
     journal_lock = threading.Lock()
 
+    SEARCH_PAGE = PageSpec("dblp_search", lambda html: 'id="completesearch-authors"' in html,
+                           ready_selector="#completesearch-authors",
+                           regions=[PageRegion.element('div', id='completesearch-authors')])
+    PROFILE_PAGE = PageSpec("dblp_profile", lambda html: 'id="publ-section"' in html, ready_selector="#publ-section",
+                            regions=[PageRegion.element(None, id='publ-section')])
+    # Only the header is read, found by string search
+    JOURNAL_PAGE = PageSpec("dblp_journal", lambda html: 'id="headline"' in html, ready_selector="header#headline h1",
+                            regions=[PageRegion.sliced("<header", "</header>")])
+
     def get_author_publications(self, author_name):
         self.logger.info("Starting to fetch publications for author: %s", author_name)
         base_url = "https://dblp.org/search?q="
@@ -63,15 +71,15 @@ class DblpScraper(GeneralScraper):
         self.logger.debug("Loading search URL: %s", search_url)
         favored_orgs = self.ctx.get_config().get_value(ConfigConstants.FAVORED_ORG)
         favored_orgs = favored_orgs.split(",")
-        i = self.driver_manager.obtain_tab(author_name)
+        i = self.driver_manager.lease_driver(author_name)
         try:
-            self.driver_manager.load_url_from_tab(i, search_url)
-            search_content = self.driver_manager.obtain_html_from_tab(i, self.ctx.get_config().get_value(ConfigConstants.MIN_WAIT_TIME))
+            search_content = self.fetch_page(i, search_url, DblpScraper.SEARCH_PAGE)
 
-            if BanChecker(Context()).has_ban_phrase(search_content, "Too Many Requests"):
-                self.driver_manager.restart_driver()
+            signals = BanChecker(Context()).check_signals(search_content, self.__class__.__name__)
+            if BanDetector.BAN in BanDetector.categories(signals):
+                self.driver_manager.renew_identity(i, "dblp.org")
 
-            search_soup = BeautifulSoup(search_content, "html.parser")
+            search_soup = Page.of(search_content).soup_for(DblpScraper.SEARCH_PAGE)
 
             author_link_elements = search_soup.select("div#completesearch-authors .result-list li a")
             author_org_elements = search_soup.select("div#completesearch-authors .result-list li small")
@@ -96,31 +104,26 @@ class DblpScraper(GeneralScraper):
 
             if not author_link_element:
                 self.logger.error("No author profile found for %s", author_name)
-                self.driver_manager.release_tab(i, author_name)
                 return {"publications": []}
 
             author_profile_link = author_link_element.get("href")
             if not author_profile_link:
-                self.driver_manager.release_tab(i, author_name)
                 self.logger.error("Author profile link not found for %s", author_name)
                 return {"publications": []}
 
             self.logger.info("Found author profile link: %s", author_profile_link)
 
-            self.driver_manager.load_url_from_tab(i, author_profile_link, skip_ready_wait=True)
-            profile_content = self.driver_manager.obtain_html_from_tab(i, 5)
-            profile_soup = BeautifulSoup(profile_content, "html.parser")
+            profile_content = self.fetch_page(i, author_profile_link, DblpScraper.PROFILE_PAGE)
+            profile_soup = Page.of(profile_content).soup_for(DblpScraper.PROFILE_PAGE)
             publications = []
 
             publ_section = profile_soup.find(id="publ-section")
             if not publ_section:
                 self.logger.warning("Publication section not found for %s", author_name)
-                self.driver_manager.release_tab(i, author_name)
                 return {"publications": []}
 
             publ_items = publ_section.find_all("li", class_="entry")
             if not publ_items:
-                self.driver_manager.release_tab(i, author_name)
                 self.logger.warning("No publications found for %s", author_name)
                 return {"publications": []}
 
@@ -176,32 +179,10 @@ class DblpScraper(GeneralScraper):
                     if journal_link_element and journal_link_element.has_attr("href") and journal_name is None:
                         journal_link = journal_link_element["href"]
                         self.logger.info("Found journal link: %s", journal_link)
-                        #self.driver_manager.load_url_from_tab(i, journal_link, skip_ready_wait=True)
-                        #journal_page_content = self.driver_manager.obtain_html_from_tab(i, 5)
-                        journal_retrieved = False
-                        journal_page_content = None
-                        while not journal_retrieved:
-                            try:
-                                time.sleep(5)
-                                self.logger.info("skip1")
-
-                                response = requests.get(journal_link, timeout=10)
-                                self.logger.info("skip2")
-
-                                response.raise_for_status()
-                                journal_page_content = response.text
-                                journal_retrieved = True
-                            except HTTPError as http_err:
-                                self.logger.error("[TAB %s] HTTP error occurred while retrieving journal %s: %s", i,
-                                                  journal_short, http_err)
-                            except Timeout:
-                                self.logger.error("[TAB %s] Timeout occurred while retrieving journal %s", i,
-                                                  journal_short)
+                        # Journal names are looked up once per journal, outside of the politeness budget
+                        journal_page_content = self.fetch_page(i, journal_link, DblpScraper.JOURNAL_PAGE, paced=False)
                         self.logger.info("stop1")
-                        start_index = journal_page_content.find("<header")
-                        end_index = journal_page_content.find("</header>") + len("</header>")
-                        relevant_html = journal_page_content[start_index:end_index]
-                        journal_soup = BeautifulSoup(relevant_html, "html.parser")
+                        journal_soup = Page.of(journal_page_content).soup_for(DblpScraper.JOURNAL_PAGE)
                         self.logger.info("stop 1.5")
                         journal_header = journal_soup.select_one("header#headline h1")
                         if journal_header:
@@ -234,12 +215,8 @@ class DblpScraper(GeneralScraper):
                     **extra_info
                 })
 
-            self.driver_manager.release_tab(i, author_name)
-
             self.logger.info("Completed fetching publications for author: %s", author_name)
             return {"publications": publications}
-        except Exception as e:
-            if i is not None:
-                self.driver_manager.release_tab(i, author_name)
-            raise e
+        finally:
+            self.driver_manager.release_driver(i, author_name)
 
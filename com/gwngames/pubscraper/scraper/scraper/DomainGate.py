@@ -0,0 +1,56 @@
+import logging
+import threading
+
+
+class DomainGate:
+    """
+    Pauses the requests of every driver to a site while a captcha of that site is being solved,
+    so that the other drivers do not trigger more captchas meanwhile. Requests to other sites go on.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    CANCEL_POLL_SEC = 1
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance.__initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self.__initialized:
+            return
+        self.__initialized = True
+        self.logger = logging.getLogger(DomainGate.__name__)
+        self._paused = {}  # Captchas being solved per site
+        self._condition = threading.Condition()
+
+    def pause(self, domain: str):
+        with self._condition:
+            self._paused[domain] = self._paused.get(domain, 0) + 1
+        self.logger.warning(f"Requests to {domain} paused.")
+
+    def resume(self, domain: str):
+        with self._condition:
+            self._paused[domain] -= 1
+            if self._paused[domain] <= 0:
+                del self._paused[domain]
+                self.logger.info(f"Requests to {domain} resumed.")
+                self._condition.notify_all()
+
+    def wait(self, domain: str, cancel: threading.Event = None) -> bool:
+        """
+        Wait until no captcha of the site is being solved.
+
+        :param cancel: Optional event interrupting the wait.
+        :return: False if the wait was interrupted.
+        """
+        with self._condition:
+            while domain in self._paused:
+                if cancel is not None and cancel.is_set():
+                    return False
+                self._condition.wait(DomainGate.CANCEL_POLL_SEC if cancel is not None else None)
+        return True
@@ -1,11 +1,49 @@
+import hashlib
 import logging
+import os
 
 from com.gwngames.pubscraper.Context import Context
-from com.gwngames.pubscraper.scraper.scraper.SeleniumDriver import SeleniumDriver, SeleniumDriverManager
+from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+from com.gwngames.pubscraper.scraper.scraper.Page import Page
+from com.gwngames.pubscraper.scraper.scraper.PageSpec import PageSpec
+from com.gwngames.pubscraper.scraper.scraper.SeleniumDriverPool import SeleniumDriverPool, SeleniumDriverManager
+from com.gwngames.pubscraper.utils.Watchdog import Watchdog
 
 
 class GeneralScraper:
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.ctx = Context()
-        self.driver_manager: SeleniumDriver = SeleniumDriverManager.get_instance(self.__class__.__name__)
+
+    @property
+    def driver_manager(self) -> SeleniumDriverPool:
+        # Resolved on use, so that building fetch adapters does not start a browser
+        return SeleniumDriverManager.get_instance(self.__class__.__name__)
+
+    def fetch_page(self, slot: int, url: str, spec: PageSpec, possible_captcha: str = None,
+                   paced: bool = True) -> dict | Page:
+        """
+        Fetch a page with a leased driver, over plain HTTP when the page allows it.
+
+        :param slot: The leased driver.
+        :param spec: The page expected by the extractor.
+        :return: The fields extracted in the browser when the spec has a script, else the HTML of the page.
+        """
+        page = self.driver_manager.fetch(slot, url, possible_captcha, spec=spec, paced=paced)
+        Watchdog().progress()  # The handler fetching the page is not stalled
+        self._record(spec, page)
+        return page
+
+    def _record(self, spec: PageSpec, page: dict | Page):
+        """
+        Save the HTML of a fetched page in record_pages_dir, when set, named after its spec.
+        Recorded pages are the input of the parse benchmark.
+        """
+        directory = self.ctx.get_config().get_value(ConfigConstants.RECORD_PAGES_DIR)
+        if not directory or not isinstance(page, str):
+            return
+        directory = self.ctx.build_path(directory)
+        os.makedirs(directory, exist_ok=True)
+        digest = hashlib.sha1(page.encode('utf-8')).hexdigest()[:12]
+        with open(os.path.join(directory, f"{spec.name}_{digest}.html"), 'w', encoding='utf-8') as f:
+            f.write(page)
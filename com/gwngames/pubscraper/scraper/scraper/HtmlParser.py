@@ -0,0 +1,79 @@
+import importlib.util
+import logging
+import threading
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from com.gwngames.pubscraper.Context import Context
+from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+from com.gwngames.pubscraper.scraper.scraper.PageRegion import PageRegion
+
+
+class HtmlParser:
+    """
+    Builds the trees of fetched pages with the fastest backend installed: lxml when available, the html.parser of the
+    standard library otherwise, unless html_parser names one of them.
+    A tree may be restricted to the regions declared by an extractor: sliced regions are cut from the raw HTML and
+    element regions strained while parsing, no tree is built for the rest of the page.
+    """
+    AUTO = "auto"
+    LXML = "lxml"
+    STDLIB = "html.parser"
+
+    _backend = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def available() -> list[str]:
+        """
+        :return: The installed backends, fastest first.
+        """
+        return ([HtmlParser.LXML] if importlib.util.find_spec(HtmlParser.LXML) else []) + [HtmlParser.STDLIB]
+
+    @classmethod
+    def backend(cls) -> str:
+        """
+        :return: The backend of the configuration, the fastest installed one if auto or if not installed.
+        """
+        with cls._lock:
+            if cls._backend is None:
+                logger = logging.getLogger(HtmlParser.__name__)
+                configured = Context().get_config().get_value(ConfigConstants.HTML_PARSER) or HtmlParser.AUTO
+                available = HtmlParser.available()
+                cls._backend = configured if configured in available else available[0]
+                if configured not in (HtmlParser.AUTO, cls._backend):
+                    logger.warning(f"HTML parser {configured} is not installed, falling back to {cls._backend}.")
+                logger.info(f"Parsing pages with {cls._backend}.")
+            return cls._backend
+
+    @staticmethod
+    def parse(html: str, regions: list[PageRegion] = None, backend: str = None) -> BeautifulSoup:
+        """
+        :param html: The raw HTML of the page.
+        :param regions: The regions to parse, the whole page if none.
+        :param backend: The backend to use instead of the configured one.
+        :return: The tree of the regions, each a child of the root.
+        """
+        regions = regions or []
+        markup = HtmlParser.slice(html, [region for region in regions if region.is_sliced])
+        elements = [region for region in regions if not region.is_sliced]
+        strainer = SoupStrainer(lambda tag, attrs=None: any(region.matches(tag, attrs or {}) for region in elements)) \
+            if elements else None
+        return BeautifulSoup(markup, backend or HtmlParser.backend(), parse_only=strainer)
+
+    @staticmethod
+    def slice(html: str, regions: list[PageRegion]) -> str:
+        """
+        :param regions: Sliced regions.
+        :return: The regions cut from the page, one after the other; the whole page if a marker is missing.
+        """
+        if not regions:
+            return html
+        parts = []
+        for region in regions:
+            start = html.find(region.start)
+            end = html.find(region.end, start) if start >= 0 else -1
+            if end < 0:
+                return html
+            parts.append(html[start:end + len(region.end)])
+        return ''.join(parts)
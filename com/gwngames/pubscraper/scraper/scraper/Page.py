@@ -0,0 +1,68 @@
+import threading
+
+from bs4 import BeautifulSoup
+
+from com.gwngames.pubscraper.scraper.scraper.HtmlParser import HtmlParser
+from com.gwngames.pubscraper.scraper.scraper.PageSpec import PageSpec
+
+
+class Page(str):
+    """
+    HTML of a fetched page, parsed at most once: the tree and the text are built on first use and shared by the ban
+    check, the captcha check and the extractor.
+    An extractor declaring the regions it reads on its spec gets a tree of these regions only, unless the whole page
+    was already parsed.
+    A page is the HTML string itself, code reading the raw HTML takes it as it is.
+    The tree may be shared by the callers of a coalesced fetch, extractors must not modify it.
+    """
+    def __init__(self, html: str):
+        super().__init__()
+        self._soup = None
+        self._trees = {}
+        self._text = None
+        self._lower_text = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def of(html: str) -> 'Page':
+        """
+        :return: The page itself if the HTML already is one.
+        """
+        return html if isinstance(html, Page) else Page(html)
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            with self._lock:
+                if self._soup is None:
+                    self._soup = HtmlParser.parse(self)
+        return self._soup
+
+    def soup_for(self, spec: PageSpec) -> BeautifulSoup:
+        """
+        :param spec: The page expected by the extractor.
+        :return: The tree of the regions declared by the spec, parsed once per spec; the tree of the whole page if
+                 the spec declares none or if it is already parsed.
+        """
+        if not spec.regions or self._soup is not None:
+            return self.soup
+        if spec.name not in self._trees:
+            with self._lock:
+                if spec.name not in self._trees:
+                    self._trees[spec.name] = HtmlParser.parse(self, spec.regions)
+        return self._trees[spec.name]
+
+    @property
+    def text(self) -> str:
+        """
+        :return: The visible text of the page, space separated.
+        """
+        if self._text is None:
+            self._text = self.soup.get_text(separator=' ', strip=True)
+        return self._text
+
+    @property
+    def lower_text(self) -> str:
+        if self._lower_text is None:
+            self._lower_text = self.text.lower()
+        return self._lower_text
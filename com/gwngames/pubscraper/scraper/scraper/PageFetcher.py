@@ -0,0 +1,125 @@
+import logging
+import threading
+import urllib.parse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from com.gwngames.pubscraper.Context import Context
+from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+from com.gwngames.pubscraper.scraper.scraper.Page import Page
+from com.gwngames.pubscraper.scraper.scraper.PageSpec import PageSpec
+
+
+class PageFetcher:
+    """
+    Plain HTTP fast path of the drivers.
+    Pages are requested through a pooled session sharing the proxy and user agent of the driver, and are only
+    accepted when they need neither JavaScript nor a captcha and hold what the extractor expects.
+    Otherwise the driver falls back to the browser.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    BROWSER_MARKERS = (
+        "g-recaptcha",
+        "grecaptcha",
+        "gs_captcha",
+        "captcha-form",
+        "enable javascript",
+        "javascript is disabled",
+        "javascript is required",
+        "checking your browser",
+        "cf-browser-verification"
+    )
+    HITS_KEY = "fast_path_hits_"
+    TOTAL_KEY = "fast_path_total_"
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance.__initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self.__initialized:
+            return
+        self.__initialized = True
+        self.ctx = Context()
+        self.logger = logging.getLogger(PageFetcher.__name__)
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+
+    def _session(self, proxy: str | None) -> requests.Session:
+        with self._sessions_lock:
+            session = self._sessions.get(proxy)
+            if session is None:
+                pool_size = self.ctx.get_config().get_value(ConfigConstants.DRIVER_POOL_SIZE) or \
+                            self.ctx.get_max_requests()
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                if proxy is not None:
+                    session.proxies = {"http": proxy, "https": proxy}
+                self._sessions[proxy] = session
+            return session
+
+    def reset(self, proxy: str | None):
+        """
+        Drop the pooled connections of a proxy, so that the next requests open streams on a new circuit.
+        """
+        with self._sessions_lock:
+            session = self._sessions.pop(proxy, None)
+        if session is not None:
+            session.close()
+
+    def needs_browser(self, html: str) -> bool:
+        """
+        :return: True if the page asks for JavaScript or shows a captcha.
+        """
+        lowered = html.lower()
+        return any(marker in lowered for marker in PageFetcher.BROWSER_MARKERS)
+
+    def get(self, url: str, spec: PageSpec, user_agent: str, proxy: str = None) -> Page | None:
+        """
+        Try to obtain a page without the browser.
+
+        :param spec: The page expected by the extractor.
+        :param user_agent: The user agent of the driver, so that both paths look like the same client.
+        :param proxy: The proxy of the driver, e.g. socks5h://127.0.0.1:9150.
+        :return: The HTML of the page, None if the browser is needed.
+        """
+        if not self.ctx.get_config().get_value(ConfigConstants.HTTP_FAST_PATH):
+            return None
+
+        html = None
+        try:
+            response = self._session(proxy).get(url, headers={"User-Agent": user_agent},
+                                                timeout=self.ctx.get_config().get_value(ConfigConstants.URL_TIMEOUT))
+            if response.status_code != 200:
+                self.logger.info(f"Fast path of {spec} answered {response.status_code}: {url}")
+            elif self.needs_browser(response.text):
+                self.logger.info(f"Fast path of {spec} needs the browser: {url}")
+            elif not spec.is_valid(response.text):
+                self.logger.info(f"Fast path of {spec} did not return the expected page: {url}")
+            else:
+                html = Page(response.text)
+        except requests.RequestException as e:
+            self.logger.warning(f"Fast path of {spec} failed for {url}: {e}")
+
+        self.record_hit(urllib.parse.urlparse(url).netloc, html is not None)
+        return html
+
+    def record_hit(self, domain: str, hit: bool):
+        """
+        Keep track of how many pages of a domain were served by the fast path.
+        """
+        stats = self.ctx.get_message_data()
+        total = stats.increment(PageFetcher.TOTAL_KEY + domain)
+        hits = stats.get_value(PageFetcher.HITS_KEY + domain) or 0
+        if hit:
+            hits = stats.increment(PageFetcher.HITS_KEY + domain)
+        self.logger.info(f"Fast path hit rate for {domain}: {hits}/{total} ({100 * hits / total:.1f}%)")
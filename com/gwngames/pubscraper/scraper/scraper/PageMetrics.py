@@ -0,0 +1,107 @@
+import argparse
+import glob
+import json
+import logging
+import os
+import statistics
+import threading
+import urllib.parse
+
+from com.gwngames.pubscraper.Context import Context
+from com.gwngames.pubscraper.LogFileHandler import LogFileHandler
+from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+from com.gwngames.pubscraper.utils.Clock import Clock
+
+
+class PageMetrics:
+    """
+    Timing records of the pages loaded by the drivers, one JSON object per line in a rotating metrics file.
+    Each record holds the browser's Navigation and Resource Timing of a page, tagged with interface, extractor and
+    driver slot, along with the time the fetch waited for its politeness turn before the request.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    PHASES = ["wait_ms", "dns_ms", "connect_ms", "ttfb_ms", "dom_content_loaded_ms", "load_ms", "ready_ms", "bytes",
+              "resources"]
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance.__initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self.__initialized:
+            return
+        self.__initialized = True
+        config = Context().get_config()
+        self.file = Context().build_path(config.get_value(ConfigConstants.METRICS_FILE))
+        self.metrics_logger = logging.getLogger(PageMetrics.__name__)
+        self.metrics_logger.propagate = False  # Records only go to the metrics file
+        self.metrics_logger.setLevel(logging.INFO)
+        handler = LogFileHandler(filename=self.file, max_lines=config.get_value(ConfigConstants.MAX_LOGFILE_LINES))
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        self.metrics_logger.addHandler(handler)
+
+    def record(self, interface_name: str, extractor: str, slot: int, url: str, wait: float, timing: dict):
+        """
+        :param extractor: The page spec of the fetch.
+        :param wait: Seconds the fetch waited before the request.
+        :param timing: The phases returned by the navigation timing script.
+        """
+        entry = {
+            "time": Clock.get().time(),
+            "interface": interface_name,
+            "extractor": extractor,
+            "slot": slot,
+            "domain": urllib.parse.urlparse(url).netloc,
+            "wait_ms": wait * 1000,
+            **timing
+        }
+        self.metrics_logger.info(json.dumps(entry))
+
+    @staticmethod
+    def summarize(files: list[str]) -> dict:
+        """
+        :param files: Metrics files, rotated ones included.
+        :return: Count, p50 and p95 of each phase per domain.
+        """
+        values = {}
+        for file in files:
+            with open(file) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    for phase in PageMetrics.PHASES:
+                        if entry.get(phase) is not None:
+                            values.setdefault(entry["domain"], {}).setdefault(phase, []).append(entry[phase])
+
+        return {domain: {phase: PageMetrics._percentiles(samples) for phase, samples in phases.items()}
+                for domain, phases in sorted(values.items())}
+
+    @staticmethod
+    def _percentiles(samples: list[float]) -> dict:
+        if len(samples) == 1:
+            return {"count": 1, "p50": samples[0], "p95": samples[0]}
+        quantiles = statistics.quantiles(samples, n=20, method='inclusive')
+        return {"count": len(samples), "p50": statistics.median(samples), "p95": quantiles[18]}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Summarize the page timing metrics per domain and phase.")
+    parser.add_argument("file", nargs="?", default="page_metrics.jsonl", help="Metrics file, rotated ones are included")
+    args = parser.parse_args()
+
+    summary = PageMetrics.summarize(sorted(glob.glob(glob.escape(args.file) + ".*")) +
+                                    ([args.file] if os.path.exists(args.file) else []))
+    for domain, phases in summary.items():
+        print(domain)
+        for phase in PageMetrics.PHASES:
+            if phase in phases:
+                stats = phases[phase]
+                print(f"    {phase:<24}{stats['count']:>8}  p50 {stats['p50']:>12.1f}  p95 {stats['p95']:>12.1f}")
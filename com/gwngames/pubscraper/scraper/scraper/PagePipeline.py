@@ -0,0 +1,86 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Iterator
+
+from com.gwngames.pubscraper.scraper.scraper.Page import Page
+from com.gwngames.pubscraper.scraper.scraper.PageSpec import PageSpec
+from com.gwngames.pubscraper.utils.Watchdog import Watchdog
+
+
+class PagePipeline:
+    """
+    Streams the pages of a paginated listing from a leased driver, as HTML or as fields extracted by the spec script.
+    While the caller parses page k, page k+1 is already being fetched as soon as the politeness wait allows,
+    so that the time per listing is bounded by the request pacing alone.
+
+    Use it as a context manager, so that a speculative fetch is cancelled before the driver is released:
+
+        with PagePipeline(self.driver_manager, i, urls, has_next) as pages:
+            for page_source in pages:
+                ...
+
+    :param pool: The driver pool.
+    :param slot: The leased driver.
+    :param urls: The page urls, possibly endless.
+    :param has_next: Optional hint telling from a fetched page whether the next one exists.
+                     The next page is prefetched only when the hint is true, otherwise it is fetched on demand.
+    :param possible_captcha: The captcha element to check on each page.
+    :param spec: The page expected by the extractor, enabling the HTTP fast path.
+    """
+
+    def __init__(self, pool, slot: int, urls: Iterator[str], has_next: Callable[[dict | Page], bool] = None,
+                 possible_captcha: str = None, spec: PageSpec = None):
+        self.pool = pool
+        self.slot = slot
+        self.urls = iter(urls)
+        self.has_next = has_next
+        self.possible_captcha = possible_captcha
+        self.spec = spec
+        self.logger = logging.getLogger(PagePipeline.__name__)
+        self._cancel = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending: Future | None = None
+
+    def _submit(self, url: str) -> Future:
+        return self._executor.submit(self.pool.fetch, self.slot, url, self.possible_captcha, self._cancel, self.spec)
+
+    def __iter__(self) -> Iterator[dict | Page]:
+        url = next(self.urls, None)
+        if url is None:
+            return
+        self._pending = self._submit(url)
+
+        while self._pending is not None:
+            page_source = self._pending.result()
+            self._pending = None
+            Watchdog().progress()  # Reported from the thread of the caller, which the handler runs on
+            if page_source is None:
+                return  # Cancelled
+
+            next_url = next(self.urls, None)
+            if next_url is not None and (self.has_next is None or self.has_next(page_source)):
+                self.logger.debug(f"Driver[{self.slot}] - Prefetching {next_url}")
+                self._pending = self._submit(next_url)
+
+            yield page_source
+
+            if self._pending is None and next_url is not None:
+                # The hint expected no more pages, but the caller asked for the next one
+                self._pending = self._submit(next_url)
+
+    def close(self):
+        self._cancel.set()
+        if self._pending is not None:
+            try:
+                self._pending.result()
+            except Exception as e:
+                self.logger.debug(f"Driver[{self.slot}] - Discarded prefetch failed: {e}")
+            self._pending = None
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'PagePipeline':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
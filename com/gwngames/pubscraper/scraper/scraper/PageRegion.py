@@ -0,0 +1,54 @@
+class PageRegion:
+    """
+    Part of a page read by an extractor, declared on its PageSpec so that only that part of the page is parsed.
+    An element region keeps, while parsing, the elements with the tag and attributes, along with their subtree:
+    declare the elements the extractor searches for, it must not navigate out of them.
+    A sliced region cuts the raw HTML from a start marker to an end marker, both kept, before parsing,
+    for a region cheaply found by string search.
+
+    :param tag: The tag of the elements of an element region, any tag if None.
+    :param attrs: Attributes the elements must have, a class matching any of the classes of the element.
+    :param start: The marker opening a sliced region.
+    :param end: The marker closing a sliced region.
+    """
+
+    def __init__(self, tag: str = None, attrs: dict = None, start: str = None, end: str = None):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.start = start
+        self.end = end
+
+    @staticmethod
+    def element(tag: str, **attrs) -> 'PageRegion':
+        """
+        :param attrs: Attributes of the elements, class_ standing for class.
+        """
+        return PageRegion(tag, {name.rstrip('_'): value for name, value in attrs.items()})
+
+    @staticmethod
+    def sliced(start: str, end: str) -> 'PageRegion':
+        return PageRegion(start=start, end=end)
+
+    @property
+    def is_sliced(self) -> bool:
+        return self.start is not None
+
+    def matches(self, tag: str, attrs: dict) -> bool:
+        """
+        :param tag: The tag of an element being parsed.
+        :param attrs: Its attributes, as found in the HTML.
+        """
+        if self.is_sliced or (self.tag is not None and tag != self.tag):
+            return False
+        for name, value in self.attrs.items():
+            actual = attrs.get(name)
+            if isinstance(actual, list):
+                actual = ' '.join(actual)
+            if actual is None or (actual != value and (name != 'class' or value not in actual.split())):
+                return False
+        return True
+
+    def __str__(self) -> str:
+        if self.is_sliced:
+            return f"{self.start}...{self.end}"
+        return (self.tag or '*') + ''.join(f"[{name}={value}]" for name, value in self.attrs.items())
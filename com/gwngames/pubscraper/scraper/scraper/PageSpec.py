@@ -0,0 +1,31 @@
+from typing import Callable
+
+from com.gwngames.pubscraper.scraper.scraper.PageRegion import PageRegion
+
+
+class PageSpec:
+    """
+    Describes a page needed by an extractor, so that a fetch can tell whether, and when, it obtained a usable page.
+
+    :param name: The name of the page, used for logging.
+    :param validator: Tells from the raw HTML whether the page holds the data of the extractor.
+    :param ready_selector: CSS selector of the element the extractor needs, the browser returns as soon as it is present.
+    :param http: False for pages that must always be loaded by the browser.
+    :param script: Name of the bundled script extracting the fields of the extractor in the browser, see BrowserScript.
+    :param regions: The parts of the page read by the extractor, the only ones in its tree, see PageRegion.
+    """
+
+    def __init__(self, name: str, validator: Callable[[str], bool] = None, ready_selector: str = None,
+                 http: bool = True, script: str = None, regions: list[PageRegion] = None):
+        self.name = name
+        self.validator = validator
+        self.ready_selector = ready_selector
+        self.http = http
+        self.script = script
+        self.regions = regions or []
+
+    def is_valid(self, html: str) -> bool:
+        return self.validator is None or self.validator(html)
+
+    def __str__(self) -> str:
+        return self.name
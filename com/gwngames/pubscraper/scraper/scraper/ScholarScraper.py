@@ -1,16 +1,44 @@
+import copy
+import itertools
 import json
 import re
 import traceback
 from datetime import datetime
 
-from bs4 import BeautifulSoup
-
 from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
 from com.gwngames.pubscraper.scraper.BanChecker import BanChecker
 from com.gwngames.pubscraper.scraper.scraper.GeneralScraper import GeneralScraper
+from com.gwngames.pubscraper.scraper.scraper.Page import Page
+from com.gwngames.pubscraper.scraper.scraper.PagePipeline import PagePipeline
+from com.gwngames.pubscraper.scraper.scraper.PageRegion import PageRegion
+from com.gwngames.pubscraper.scraper.scraper.PageSpec import PageSpec
 
 
 class ScholarScraper(GeneralScraper):
+    # Scholar answers plain HTTP clients with a captcha, its pages are always loaded by the browser
+    SEARCH_PAGE = PageSpec("scholar_search", ready_selector="#gs_res_ccl_mid", http=False,
+                           regions=[PageRegion.element('h4', class_='gs_rt2'),
+                                    PageRegion.element('span', class_='gs_nph')])
+    AUTHOR_SEARCH_PAGE = PageSpec("scholar_author_search", ready_selector="#gsc_sa_ccl", http=False,
+                                  regions=[PageRegion.element('div', class_='gsc_1usr'),
+                                           PageRegion.element('div', class_='gs_ai_eml')])
+    PROFILE_PAGE = PageSpec("scholar_profile", ready_selector="#gsc_prf_w", http=False,
+                            regions=[PageRegion.element('div', id='gsc_prf_w'),
+                                     PageRegion.element('td', class_='gsc_rsb_std')])
+    # The extractor navigates the whole page
+    PUBLICATION_PAGE = PageSpec("scholar_publication", ready_selector="#gsc_oci_title", http=False)
+    COLLEAGUES_PAGE = PageSpec("scholar_colleagues", http=False,
+                               regions=[PageRegion.element('h3', class_='gs_ai_name')])
+    # Listings are extracted in the browser, only their fields are transferred
+    PUBLICATIONS_PAGE = PageSpec("scholar_publications", ready_selector="tbody#gsc_a_b", http=False,
+                                 script="scholar_publications", regions=[PageRegion.element('tbody', id='gsc_a_b')])
+    CITATIONS_PAGE = PageSpec("scholar_citations", ready_selector="#gs_res_ccl_mid", http=False,
+                              script="scholar_citations",
+                              regions=[PageRegion.element('div', class_='gs_r'),
+                                       PageRegion.element('span', class_='gs_ico_nav_first')])
+    VERSIONS_PAGE = PageSpec("scholar_versions", ready_selector="#gs_res_ccl_mid", http=False,
+                             script="scholar_versions", regions=[PageRegion.element('div', class_='gs_or')])
+
     def __init__(self):
         super().__init__()
 
@@ -20,16 +48,13 @@ class ScholarScraper(GeneralScraper):
         author_base_url = "https://scholar.google.com/citations?hl=it&user=" + profile_id
         i = tab_id
         try:
-            self.driver_manager.load_url_from_tab(i, author_base_url)
-
-            page_source = self.driver_manager.obtain_html_from_tab(i)
+            page_source = self.fetch_page(i, author_base_url, ScholarScraper.PROFILE_PAGE)
 
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = Page.of(page_source).soup_for(ScholarScraper.PROFILE_PAGE)
 
             profile_section = soup.find('div', id='gsc_prf_w')
             if not profile_section:
                 self.logger.error(f"TAB[{i}] - Profile data not found.")
-                self.driver_manager.release_tab(i, profile_id)
                 return {}
 
             name = profile_section.find('div', id='gsc_prf_in').text if profile_section.find('div',
@@ -108,8 +133,6 @@ class ScholarScraper(GeneralScraper):
             return author_data
         except Exception:
             self.logger.error(f"Error extracting profile data: {str(traceback.format_exc())}")
-            if i is not None:
-                self.driver_manager.release_tab(i, profile_id)
             return None
 
     def get_scholar_profile(self, author_name):
@@ -123,14 +146,12 @@ class ScholarScraper(GeneralScraper):
             search_url = f"https://scholar.google.com/scholar?hl=it&as_sdt=0%252C5&q={formatted_name}"
 
             self.logger.info(f"Opening search URL: {search_url}")
-            i = self.driver_manager.obtain_tab(author_name)
-            self.driver_manager.load_url_from_tab(i, search_url)
-            page_source = self.driver_manager.obtain_html_from_tab(i, possible_captcha='gs_captcha_ccl')
+            i = self.driver_manager.lease_driver(author_name)
+            page_source = self.fetch_page(i, search_url, ScholarScraper.SEARCH_PAGE, possible_captcha='gs_captcha_ccl')
 
-            checker = BanChecker(self.ctx)
-            if checker.has_ban_phrase(page_source, "We're sorry...") or checker.has_ban_phrase(page_source, search_url):
-                self.driver_manager.restart_driver()
-            soup = BeautifulSoup(page_source, 'html.parser')
+            if BanChecker(self.ctx).check_signals(page_source, self.__class__.__name__):
+                self.driver_manager.renew_identity(i, "scholar.google.com")
+            soup = Page.of(page_source).soup_for(ScholarScraper.SEARCH_PAGE)
 
             author_divs = soup.find_all('h4', class_='gs_rt2')
             author_orgs = soup.find_all('span', class_='gs_nph', attrs={"class": ["gs_nph"]})
@@ -139,9 +160,8 @@ class ScholarScraper(GeneralScraper):
             if len(author_divs) == 0: # Fallback measure
                 search_url = f"https://scholar.google.com/citations?view_op=search_authors&mauthors={formatted_name}"
                 self.logger.info(f"Opening fallback search URL: {search_url}")
-                self.driver_manager.load_url_from_tab(i, search_url)
-                page_source = self.driver_manager.obtain_html_from_tab(i)
-                soup = BeautifulSoup(page_source, 'html.parser')
+                page_source = self.fetch_page(i, search_url, ScholarScraper.AUTHOR_SEARCH_PAGE)
+                soup = Page.of(page_source).soup_for(ScholarScraper.AUTHOR_SEARCH_PAGE)
                 author_divs = soup.find_all('div', class_='gsc_1usr')
                 author_orgs = soup.find_all('div', class_='gs_ai_eml')
 
@@ -163,8 +183,6 @@ class ScholarScraper(GeneralScraper):
 
             if not author_div:
                 self.logger.error(f"TAB[{i}] - No author found for the name: {author_name}")
-                if i is not None:
-                    self.driver_manager.release_tab(i, author_name)
                 return {}
 
             profile_link = author_div.find_next('a')['href']
@@ -177,20 +195,21 @@ class ScholarScraper(GeneralScraper):
 
             author_data = self.get_author_profile_data(user_id, i)
 
-            self.driver_manager.release_tab(i, author_name)
             self.logger.info(f"TAB[{i}] - Author profile {author_name} found and data extracted successfully.")
             return json.dumps(author_data, indent=4)
 
         except Exception as e:
             self.logger.error(f"Error extracting profile for {author_name}: {str(e)}")
-            if i is not None:
-                self.driver_manager.release_tab(i, author_name)
             return {}
+        finally:
+            if i is not None:
+                self.driver_manager.release_driver(i, author_name)
 
     def fetch_publications(self, profile_url, tab_id):
         """
         This function takes a Selenium WebDriver instance and the Google Scholar profile URL,
         makes successive requests to retrieve all the author's publications, and returns the data.
+        Pages are pipelined, the next one is fetched while the current one is parsed.
         """
         self.logger.info(f"Starting publication extraction from: {profile_url}")
 
@@ -198,60 +217,76 @@ class ScholarScraper(GeneralScraper):
         publications = []
         cstart = 0
         pagesize = 100
-        more_results = True
         total_pages = 0
 
         i = tab_id
 
-        while more_results:
-            paginated_url = f"{base_url}&cstart={cstart}&pagesize={pagesize}"
-            self.logger.info(f"Loading page with start index {cstart} and page size {pagesize}")
-            try:
-                self.driver_manager.load_url_from_tab(i, paginated_url)
-                page_source = self.driver_manager.obtain_html_from_tab(i)
-
-                soup = BeautifulSoup(page_source, 'html.parser')
-
-                # Find the publication table content
-                table_body = soup.find('tbody', id='gsc_a_b')
-                if not table_body:
-                    self.logger.warning(f"TAB[{i}] - No data found on this page. Stopping publication extraction...")
-                    break
-
-                rows = table_body.find_all('tr', class_='gsc_a_tr')
-                if not rows or len(rows) == 1:
-                    self.logger.info(f"TAB[{i}] - No more rows found. Stopping extraction.")
-                    break
-
-                # Log the number of publications found on this page
-                self.logger.info(f"TAB[{i}] - Found {len(rows)} publications on page with start index {cstart}")
-
-                # For each row, extract publication details
-                for row in rows:
-                    title_tag = row.find('a', class_='gsc_a_at')
-                    title = title_tag.text if title_tag else "N/A"
-                    pub_url = f"https://scholar.google.com{title_tag['href']}" if title_tag else "N/A"
-
-                    publication = {
-                        "title": title,
-                        "url": pub_url,
-                        "publication_id": pub_url.rsplit('=', 1)[1]
-                    }
-                    publications.append(publication)
-
-                cstart += pagesize
-                total_pages += 1
-            except Exception as e:
-                self.logger.error(f"Error during publication extraction on page {total_pages + 1}: {str(e)}")
-                if i is not None:
-                    self.driver_manager.release_tab(i, profile_url)
-                break
+        urls = (f"{base_url}&cstart={start}&pagesize={pagesize}" for start in itertools.count(0, pagesize))
+        try:
+            # A full page hints that another one follows
+            with PagePipeline(self.driver_manager, i, urls,
+                              has_next=lambda page: self.count_publication_rows(page) >= pagesize,
+                              spec=ScholarScraper.PUBLICATIONS_PAGE) as pages:
+                for page in pages:
+                    self.logger.info(f"Loaded page with start index {cstart} and page size {pagesize}")
+
+                    rows = self.get_publication_rows(page)
+                    if rows is None:
+                        self.logger.warning(f"TAB[{i}] - No data found on this page. Stopping publication extraction...")
+                        break
+
+                    if not rows or len(rows) == 1:
+                        self.logger.info(f"TAB[{i}] - No more rows found. Stopping extraction.")
+                        break
+
+                    # Log the number of publications found on this page
+                    self.logger.info(f"TAB[{i}] - Found {len(rows)} publications on page with start index {cstart}")
+
+                    # For each row, extract publication details
+                    for row in rows:
+                        title = row["title"] if row else "N/A"
+                        pub_url = f"https://scholar.google.com{row['href']}" if row else "N/A"
+
+                        publication = {
+                            "title": title,
+                            "url": pub_url,
+                            "publication_id": pub_url.rsplit('=', 1)[1]
+                        }
+                        publications.append(publication)
+
+                    cstart += pagesize
+                    total_pages += 1
+        except Exception as e:
+            self.logger.error(f"Error during publication extraction on page {total_pages + 1}: {str(e)}")
 
         # Log the total number of pages loaded and total publications extracted
         self.logger.info(
             f"Publication extraction complete. Loaded {total_pages} pages and extracted {len(publications)} publications.")
         return publications
 
+    @staticmethod
+    def get_publication_rows(page) -> list | None:
+        """
+        :param page: The fields extracted by the publications script, or the HTML of the page.
+        :return: The title and link of each row, None for rows without a title; None if the table is missing.
+        """
+        if isinstance(page, dict):
+            return page["rows"]
+
+        table_body = Page.of(page).soup_for(ScholarScraper.PUBLICATIONS_PAGE).find('tbody', id='gsc_a_b')
+        if not table_body:
+            return None
+        rows = []
+        for row in table_body.find_all('tr', class_='gsc_a_tr'):
+            title_tag = row.find('a', class_='gsc_a_at')
+            rows.append({"title": title_tag.text, "href": title_tag['href']} if title_tag else None)
+        return rows
+
+    @staticmethod
+    def count_publication_rows(page) -> int:
+        # Counted on the raw HTML, the page is parsed by the caller
+        return len(page["rows"]) if isinstance(page, dict) else page.count('class="gsc_a_tr"')
+
     def fetch_publication_data(self, publication_url):
         """
         Extracts publication data from a Google Scholar publication URL using Selenium and BeautifulSoup.
@@ -260,17 +295,14 @@ class ScholarScraper(GeneralScraper):
         self.logger.info(f"Fetching publication data from: {publication_url}")
         i = None
         try:
-            i = self.driver_manager.obtain_tab(publication_url)
-            self.driver_manager.load_url_from_tab(i, publication_url)
-            page_source = self.driver_manager.obtain_html_from_tab(i)
+            i = self.driver_manager.lease_driver(publication_url)
+            page_source = self.fetch_page(i, publication_url, ScholarScraper.PUBLICATION_PAGE)
 
             if not page_source:
                 self.logger.error(f"TAB[{i}] - Failed to retrieve page source for: {publication_url}")
-                if i is not None:
-                    self.driver_manager.release_tab(i, publication_url)
                 return {}
 
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = Page.of(page_source).soup
 
             publication_id_match = re.search(r'citation_for_view=([^&]+)', publication_url)
             publication_id = publication_id_match.group(1) if publication_id_match else "Publication ID not available"
@@ -320,6 +352,8 @@ class ScholarScraper(GeneralScraper):
                 elif "Descr" in key:
                     descr_div = field.find('div', class_='gsc_oci_value', id='gsc_oci_descr')
                     if descr_div:
+                        # The tree of the page may be shared, the tags are removed from a copy
+                        descr_div = copy.copy(descr_div)
                         # Remove <svg> tags (and anything else you’d like to exclude):
                         for svg_tag in descr_div.find_all('svg'):
                             svg_tag.decompose()
@@ -390,14 +424,14 @@ class ScholarScraper(GeneralScraper):
                 "all_versions_url": all_versions_url
             }
 
-            self.driver_manager.release_tab(i, publication_url)
             self.logger.info(f"TAB[{i}] - Successfully extracted publication data.")
             return publication_data
         except Exception as e:
             self.logger.error(f"Error fetching publication data: {str(e)}")
-            if i is not None:
-                self.driver_manager.release_tab(i, publication_url)
             return {}
+        finally:
+            if i is not None:
+                self.driver_manager.release_driver(i, publication_url)
 
     def fetch_colleagues_ids(self, user_id, tab_id):
         """
@@ -411,9 +445,8 @@ class ScholarScraper(GeneralScraper):
         colleagues_url = base_url.format(user_id)
         i = tab_id
         try:
-            self.driver_manager.load_url_from_tab(i, colleagues_url)
-            page_source = self.driver_manager.obtain_html_from_tab(i)
-            soup = BeautifulSoup(page_source, 'html.parser')
+            page_source = self.fetch_page(i, colleagues_url, ScholarScraper.COLLEAGUES_PAGE)
+            soup = Page.of(page_source).soup_for(ScholarScraper.COLLEAGUES_PAGE)
 
             author_names = [h3.get_text() for h3 in soup.find_all('h3', class_='gs_ai_name')]
             self.logger.info(f"TAB[{i}] - Extracted coauthor IDs: {len(author_names)}")
@@ -421,8 +454,6 @@ class ScholarScraper(GeneralScraper):
 
         except Exception as e:
             self.logger.error(f"Error fetching colleagues for user {user_id}: {str(e)}")
-            if i is not None:
-                self.driver_manager.release_tab(i, user_id)
             return None
 
     def extract_id_from(self, url, var_name):
@@ -431,57 +462,35 @@ class ScholarScraper(GeneralScraper):
         self.logger.info(f"Extracted {var_name}: {var_id} from URL: {url}")
         return var_id
 
-    def get_citations_from_page(self, url, cites_id):
-        stop = False
-        self.logger.info(f"Fetching page citation page: {url}")
-        i = self.driver_manager.obtain_tab(cites_id)
-        self.driver_manager.load_url_from_tab(i, url)
-        page_source = self.driver_manager.obtain_html_from_tab(i, possible_captcha='gs_captcha_ccl')
-
-        checker = BanChecker(self.ctx)
-        if checker.has_ban_phrase(page_source, "We're sorry...") or checker.has_ban_phrase(page_source, "That’s an error."):
-            self.driver_manager.restart_driver()
-        soup = BeautifulSoup(page_source, 'html.parser')
-
-        citation_divs = soup.find_all('div', class_='gs_r')
-        citation_divs = citation_divs[2:-1]
-        citation_data = []
+    def get_citations_from_page(self, page, cites_id, i):
+        if isinstance(page, dict):
+            # Extracted in the browser, ban pages have no result list and always come as HTML
+            entries, stop = page["entries"], page["last_page"]
+        else:
+            entries, stop = self.parse_citations_html(page, i)
 
-        if soup.find('span', class_='gs_ico gs_ico_nav_first') is None:
-            stop = True
-
-        for citation in citation_divs:
-            title_tag = citation.find('h3', class_='gs_rt')
-            title = title_tag.get_text(strip=True) if title_tag else 'No Title'
-            link_tag = title_tag.find('a') if title_tag else None
-            link = link_tag['href'] if link_tag else 'No Link'
+        citation_data = []
+        for entry in entries:
+            title = entry["title"] if entry["title"] is not None else 'No Title'
+            link = entry["link"] if entry["link"] is not None else 'No Link'
 
-            authors_tag = citation.find('div', class_='gs_a')
             author_ids = []
             profile_urls = []
             author_names = []
-            if authors_tag:
-                author_links = authors_tag.find_all('a')
-                for author_link in author_links:
-                    profile_url = author_link['href']
-                    author_name = author_link.get_text(strip=True)
-                    author_id_match = re.search(r'user=([a-zA-Z0-9_-]+)', profile_url)
-                    if author_id_match:
-                        # If there's an author id, add it to author_ids and profile_urls
-                        author_ids.append(author_id_match.group(1))
-                        profile_urls.append(f"https://scholar.google.com{profile_url}")
-                    else:
-                        # Only add the author name if no author_id is present
-                        author_names.append(author_name)
-
-            summary_tag = citation.find('div', class_='gs_rs')
-            summary = summary_tag.get_text(strip=True) if summary_tag else 'No Summary'
-
-            document_link = citation.find('div', class_='gs_or_ggsm')
-            if document_link is not None:
-                document_link = document_link.find('a')['href']
-            else:
-                document_link = "No Document link"
+            for author in entry["authors"]:
+                profile_url = author["href"]
+                author_name = author["name"]
+                author_id_match = re.search(r'user=([a-zA-Z0-9_-]+)', profile_url)
+                if author_id_match:
+                    # If there's an author id, add it to author_ids and profile_urls
+                    author_ids.append(author_id_match.group(1))
+                    profile_urls.append(f"https://scholar.google.com{profile_url}")
+                else:
+                    # Only add the author name if no author_id is present
+                    author_names.append(author_name)
+
+            summary = entry["summary"] if entry["summary"] is not None else 'No Summary'
+            document_link = entry["document_link"] if entry["document_link"] is not None else "No Document link"
 
             self.logger.debug(
                 f"TAB[{i}] - Extracted citation: Title={title}, Link={link}, Authors={author_ids}, Author Names={author_names}, Profile URLs={profile_urls}")
@@ -497,48 +506,96 @@ class ScholarScraper(GeneralScraper):
                 'document_link': document_link
             })
 
-        self.logger.info(f"TAB[{i}] - Finished fetching citations from page: {url}")
-        self.driver_manager.release_tab(i, cites_id)
+        self.logger.info(f"TAB[{i}] - Finished parsing citations page")
         return citation_data, stop
 
+    def parse_citations_html(self, page_source, i) -> tuple[list, bool]:
+        """
+        Fallback of the citations script, returning the same fields from the HTML of the page.
+
+        :return: The citation entries and whether the page is the last one.
+        """
+        if BanChecker(self.ctx).check_signals(page_source, self.__class__.__name__):
+            self.driver_manager.renew_identity(i, "scholar.google.com")
+        soup = Page.of(page_source).soup_for(ScholarScraper.CITATIONS_PAGE)
+
+        entries = []
+        for citation in soup.find_all('div', class_='gs_r')[2:-1]:
+            title_tag = citation.find('h3', class_='gs_rt')
+            link_tag = title_tag.find('a') if title_tag else None
+            authors_tag = citation.find('div', class_='gs_a')
+            summary_tag = citation.find('div', class_='gs_rs')
+            document_tag = citation.find('div', class_='gs_or_ggsm')
+            entries.append({
+                'title': title_tag.get_text(strip=True) if title_tag else None,
+                'link': link_tag['href'] if link_tag else None,
+                'authors': [{'href': author_link['href'], 'name': author_link.get_text(strip=True)}
+                            for author_link in authors_tag.find_all('a')] if authors_tag else [],
+                'summary': summary_tag.get_text(strip=True) if summary_tag else None,
+                'document_link': document_tag.find('a')['href'] if document_tag is not None else None
+            })
+
+        return entries, soup.find('span', class_='gs_ico gs_ico_nav_first') is None
+
+    @staticmethod
+    def has_next_citations(page) -> bool:
+        # Same condition as the stop flag of the page parser
+        return not page["last_page"] if isinstance(page, dict) else 'gs_ico_nav_first' in page
+
     def scrape_all_citations(self, base_url, pub_id):
         start = 0
         all_citations = []
         cites_id = self.extract_id_from(base_url, "cites")
 
         self.logger.info(f"Starting to scrape citations for cites_id: {cites_id}")
-        while True:
-            url = f"{base_url}&start={start}"
-            self.logger.info(f"Scraping page with start={start}")
-            citations, stop = self.get_citations_from_page(url, cites_id)
-
-            if not citations:
-                self.logger.info(f"No more citations found at start={start}. Ending scraping.")
-                break
+        i = self.driver_manager.lease_driver(cites_id)
+        urls = (f"{base_url}&start={page_start}" for page_start in itertools.count(0, 10))
+        try:
+            with PagePipeline(self.driver_manager, i, urls, has_next=ScholarScraper.has_next_citations,
+                              possible_captcha='gs_captcha_ccl', spec=ScholarScraper.CITATIONS_PAGE) as pages:
+                for page in pages:
+                    self.logger.info(f"Scraping page with start={start}")
+                    citations, stop = self.get_citations_from_page(page, cites_id, i)
+
+                    if not citations:
+                        self.logger.info(f"No more citations found at start={start}. Ending scraping.")
+                        break
 
-            all_citations.extend(citations)
-            self.logger.info(f"Collected {len(citations)} citations from page {start // 10 + 1}")
-            start += 10
-            if stop:
-                break
+                    all_citations.extend(citations)
+                    self.logger.info(f"Collected {len(citations)} citations from page {start // 10 + 1}")
+                    start += 10
+                    if stop:
+                        break
+        finally:
+            self.driver_manager.release_driver(i, cites_id)
 
         if len(all_citations) == 0:
             raise Exception("No citations found for: " + base_url)
         self.logger.info(f"Scraping complete. Total citations collected: {len(all_citations)}")
         return {"citations": all_citations, "cites_id": cites_id, "pub_id": pub_id}
 
-    def get_versions_from_page(self, url, cluster_id):
+    def get_versions_from_page(self, page, cluster_id, i):
         stop = False
-        self.logger.info(f"Fetching versions page: {url}")
-        i = self.driver_manager.obtain_tab(cluster_id)
-        self.driver_manager.load_url_from_tab(i, url)
-        page_source = self.driver_manager.obtain_html_from_tab(i, possible_captcha='gs_captcha_ccl')
+        if isinstance(page, dict):
+            # Extracted in the browser, ban pages have no result list and always come as HTML
+            extracted_data = page["entries"]
+        else:
+            extracted_data = self.parse_versions_html(page, i)
+
+        for data_dict in extracted_data:
+            data_dict['cluster_id'] = cluster_id
+
+        self.logger.info(f"TAB[{i}] - Finished parsing versions page")
+        return extracted_data, stop
 
-        checker = BanChecker(self.ctx)
-        if checker.has_ban_phrase(page_source, "We're sorry...") or checker.has_ban_phrase(page_source, "Error"):
-            self.driver_manager.restart_driver()
+    def parse_versions_html(self, page_source, i) -> list:
+        """
+        Fallback of the versions script, returning the same fields from the HTML of the page.
+        """
+        if BanChecker(self.ctx).check_signals(page_source, self.__class__.__name__):
+            self.driver_manager.renew_identity(i, "scholar.google.com")
 
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = Page.of(page_source).soup_for(ScholarScraper.VERSIONS_PAGE)
 
         extracted_data = []
 
@@ -565,13 +622,14 @@ class ScholarScraper(GeneralScraper):
             else:
                 data_dict['description'] = ''
 
-            data_dict['cluster_id'] = cluster_id
-
             extracted_data.append(data_dict)
 
-        self.logger.info(f"TAB[{i}] - Finished fetching versions from page: {url}")
-        self.driver_manager.release_tab(i, cluster_id)
-        return extracted_data, stop
+        return extracted_data
+
+    @staticmethod
+    def has_next_versions(page) -> bool:
+        # A page listing versions hints that another one follows
+        return len(page["entries"]) > 0 if isinstance(page, dict) else 'gs_r gs_or gs_scl' in page
 
     def scrape_all_versions(self, base_url: str):
         start = 0
@@ -582,19 +640,25 @@ class ScholarScraper(GeneralScraper):
             return {"versions": []}
 
         self.logger.info(f"Starting to scrape documents for cluster_id: {cluster_id}")
-        while True:
-            url = f"{base_url}&start={start}"
-            versions, stop = self.get_versions_from_page(url, cluster_id)
-
-            if not versions:
-                self.logger.info(f"No more versions found at start={start}. Ending scraping.")
-                break
-
-            all_versions.extend(versions)
-            self.logger.info(f"Collected {len(versions)} versions from page {start // 10 + 1}")
-            start += 10
-            if stop:
-                break
+        i = self.driver_manager.lease_driver(cluster_id)
+        urls = (f"{base_url}&start={page_start}" for page_start in itertools.count(0, 10))
+        try:
+            with PagePipeline(self.driver_manager, i, urls, has_next=ScholarScraper.has_next_versions,
+                              possible_captcha='gs_captcha_ccl', spec=ScholarScraper.VERSIONS_PAGE) as pages:
+                for page in pages:
+                    versions, stop = self.get_versions_from_page(page, cluster_id, i)
+
+                    if not versions:
+                        self.logger.info(f"No more versions found at start={start}. Ending scraping.")
+                        break
+
+                    all_versions.extend(versions)
+                    self.logger.info(f"Collected {len(versions)} versions from page {start // 10 + 1}")
+                    start += 10
+                    if stop:
+                        break
+        finally:
+            self.driver_manager.release_driver(i, cluster_id)
 
         if len(all_versions) == 0:
             raise Exception("No versions found for: " + base_url)
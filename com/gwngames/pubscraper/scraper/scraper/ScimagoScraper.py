@@ -1,11 +1,18 @@
 import re
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from com.gwngames.pubscraper.scraper.scraper.GeneralScraper import GeneralScraper
+from com.gwngames.pubscraper.scraper.scraper.Page import Page
+from com.gwngames.pubscraper.scraper.scraper.PageRegion import PageRegion
+from com.gwngames.pubscraper.scraper.scraper.PageSpec import PageSpec
 
 
 class ScimagoScraper(GeneralScraper):
+    RANKING_PAGE = PageSpec("scimago_ranking", lambda html: 'class="table_wrap"' in html,
+                            ready_selector="div.table_wrap table",
+                            regions=[PageRegion.element('div', class_='pagination'),
+                                     PageRegion.element('div', class_='table_wrap')])
 
     def get_journals_from_page(self, journal_year, page):
         """
@@ -18,18 +25,21 @@ class ScimagoScraper(GeneralScraper):
         target_url = f"{base_url}?year={journal_year}&page={page}"
         self.logger.info("Fetching journals from URL: %s", target_url)
 
+        i = None
         try:
-            i = self.driver_manager.obtain_tab(journal_year+"-"+page)
-            self.driver_manager.load_url_from_tab(i, target_url)
-            page_content = self.driver_manager.obtain_html_from_tab(i)
+            i = self.driver_manager.lease_driver(journal_year+"-"+page)
+            page_content = self.fetch_page(i, target_url, ScimagoScraper.RANKING_PAGE)
         except Exception as e:
             self.logger.error("Error loading or releasing tab: %s", e)
+            if i is not None:
+                self.driver_manager.release_driver(i, journal_year+"-"+page)
             return {"journals": [], "is_end": False}
 
         try:
-            page_soup = BeautifulSoup(page_content, "html.parser")
+            page_soup = Page.of(page_content).soup_for(ScimagoScraper.RANKING_PAGE)
         except Exception as e:
             self.logger.error("Error parsing page content with BeautifulSoup: %s", e)
+            self.driver_manager.release_driver(i, journal_year+"-"+page)
             return {"journals": [], "is_end": False}
 
         # Extract pagination information
@@ -139,6 +149,6 @@ class ScimagoScraper(GeneralScraper):
         except Exception as e:
             self.logger.error("Error extracting journal data: %s", e)
 
-        self.driver_manager.release_tab(i, journal_year+"-"+page)
+        self.driver_manager.release_driver(i, journal_year+"-"+page)
         return {"journals": journals, "is_end": is_end}
 
@@ -1,10 +1,13 @@
 import logging
+import os
 import threading
 import time
+import urllib.parse
 
 from fake_useragent import UserAgent
 from selenium import webdriver
-from selenium.common import NoAlertPresentException, UnexpectedAlertPresentException
+from selenium.common import NoAlertPresentException, UnexpectedAlertPresentException, TimeoutException, \
+    JavascriptException, WebDriverException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.common.by import By
 from selenium.webdriver.firefox.options import Options as FirefoxOptions, Options
@@ -13,30 +16,90 @@ from selenium.webdriver.support.wait import WebDriverWait
 
 from com.gwngames.pubscraper.Context import Context
 from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+from com.gwngames.pubscraper.exception.CaptchaDetectedException import CaptchaDetectedException
+from com.gwngames.pubscraper.scraper.scraper.BrowserProfile import BrowserProfile, FULL
+from com.gwngames.pubscraper.scraper.scraper.BrowserScript import BrowserScript
 from com.gwngames.pubscraper.scraper.scraper.CaptchaHandler import CaptchaHandler
+from com.gwngames.pubscraper.scraper.scraper.DomainGate import DomainGate
+from com.gwngames.pubscraper.scraper.scraper.Page import Page
+from com.gwngames.pubscraper.scraper.scraper.PageFetcher import PageFetcher
+from com.gwngames.pubscraper.scraper.scraper.PageMetrics import PageMetrics
+from com.gwngames.pubscraper.scraper.scraper.PageSpec import PageSpec
+from com.gwngames.pubscraper.scraper.scraper.SessionStore import SessionStore
+from com.gwngames.pubscraper.scraper.scraper.TorController import TorController
+from com.gwngames.pubscraper.utils.Clock import Clock
 from com.gwngames.pubscraper.utils.JsonReader import JsonReader
+from com.gwngames.pubscraper.utils.ProcessUtils import ProcessUtils
 from com.gwngames.pubscraper.utils.ThreadUtils import ThreadUtils
+from com.gwngames.pubscraper.utils.Watchdog import Watchdog
 
 
 class SeleniumDriver:
-
-    def __init__(self, interface_name: str):
+    """
+    A single browser process with one window, owned by a slot of a SeleniumDriverPool.
+    Every slot runs with its own profile, Tor ports and optional proxy, so that drivers never wait on each other.
+
+    :param interface_name: The scraper owning the pool.
+    :param slot: The index of the driver in the pool.
+    :param session: The stored session restored by the driver, None to start with a new client.
+    """
+    TOR_SOCKS_PORT = 9150
+    TOR_CONTROL_PORT = 9151
+    TOR_PORT_STRIDE = 10
+    PAGE_LOAD_STRATEGY = "eager"  # Return once the DOM is ready, readiness is decided by the page spec
+    TOR_CONNECT_URL = "about:torconnect"
+
+    def __init__(self, interface_name: str, slot: int = 0, session: SessionStore = None):
         self.interface_name = interface_name
-        self.logger = logging.getLogger(f"SeleniumDriver-{interface_name}")
+        self.slot = slot
+        self.logger = logging.getLogger(f"SeleniumDriver-{interface_name}-{slot}")
         self.logger.info("Initializing SeleniumDriver instance.")
         self.ctx = Context()
         self.config = JsonReader(JsonReader.CONFIG_FILE_NAME)
-        self.number_of_tabs = self.ctx.get_max_requests()
-        self.available_tabs = {i: True for i in range(self.number_of_tabs)}
-        self.window_handles = {}
-        self._condition = threading.Condition()
-        self._captcha_condition = threading.Condition()
+        self._lock = threading.RLock()
         self.timeout = self.config.get_value(ConfigConstants.URL_TIMEOUT)
         self.logger.debug(f"Timeout set to {self.timeout} seconds.")
+        self.next_request_at = 0.0  # Clock time from which the politeness wait allows the next fetch
+        self.tor_controller = self._tor_controller()
+        self.session = session
+        self._session_domains = set()  # Sites whose stored state was restored in the running browser
+        self._snapshot_at = {}
+        self.pages_served = 0  # Pages loaded by the running browser
+        self.last_request_sec = 0.0  # Duration of the last fetch, politeness wait excluded
+        self.load_timed_out = False  # The ready element of the last page was not found in time
+        self.stalled = False  # The watchdog killed the browser during a fetch, it needs a restart
+        profiles = self.config.get_value(ConfigConstants.BROWSER_PROFILES) or {}
+        self.profile = BrowserProfile.get(profiles.get(interface_name))
+        self.headless = bool(self.config.get_value(ConfigConstants.BROWSER_HEADLESS))
+        self.logger.info(f"Browser profile: {self.profile}, headless: {self.headless}.")
         self.driver = self._initialize_driver()
-        self._initialize_tabs()
-        self.logger.info("Driver initialization complete. Sleeping for 5 seconds.")
-        time.sleep(5)  # Initialization time
+        self.logger.info("Driver initialization complete.")
+        if self.config.get_value(ConfigConstants.BROWSER_EMBEDDED):
+            self.logger.debug("Clicking 'always connect automatically' button.")
+            self.click_always_connect_automatically()
+
+    def _proxy(self) -> tuple[str, int] | None:
+        proxies = self.config.get_value(ConfigConstants.DRIVER_PROXIES)
+        if not proxies:
+            return None
+        host, port = proxies[self.slot % len(proxies)].rsplit(':', 1)
+        return host, int(port)
+
+    def _set_firefox_preferences(self, profile: webdriver.FirefoxProfile, embedded: bool):
+        profile.set_preference("general.useragent.override", self.user_agent)
+        profile.set_preference("dom.webdriver.enabled", False)
+        for name, value in self.profile.firefox_preferences().items():
+            profile.set_preference(name, value)
+
+        proxy = self._proxy()
+        if proxy is not None:
+            profile.set_preference("network.proxy.type", 1)
+            profile.set_preference("network.proxy.socks", proxy[0])
+            profile.set_preference("network.proxy.socks_port", proxy[1])
+            profile.set_preference("network.proxy.socks_remote_dns", True)
+        elif embedded and self.slot > 0:
+            # Each Tor browser launches its own tor, which cannot share the ports of the first slot
+            profile.set_preference("network.proxy.socks_port", int(self._tor_environment()["TOR_SOCKS_PORT"]))
 
     def _initialize_driver(self):
         browser_type = self.config.get_value(ConfigConstants.BROWSER_TYPE)
@@ -46,36 +109,53 @@ class SeleniumDriver:
         try:
             if browser_type.lower() == 'chrome':
                 chrome_options = ChromeOptions()
-                self.user_agent = UserAgent().random
+                chrome_options.page_load_strategy = SeleniumDriver.PAGE_LOAD_STRATEGY
+                self.user_agent = self._session_user_agent()
+                # Chrome locks its user data directory, every slot needs its own
+                data_path = self.config.get_value(ConfigConstants.BROWSER_DATA_PATH)
+                if self.slot > 0:
+                    data_path = f"{data_path}_{self.slot}"
                 chrome_options.add_argument(f"user-agent={self.user_agent}")
-                chrome_options.add_argument(f"user-data-dir={self.config.get_value(ConfigConstants.BROWSER_DATA_PATH)}")
+                chrome_options.add_argument(f"user-data-dir={data_path}")
                 chrome_options.add_argument(f"profile-directory=Default")
+                proxy = self._proxy()
+                if proxy is not None:
+                    chrome_options.add_argument(f"proxy-server=socks5://{proxy[0]}:{proxy[1]}")
                 chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
                 chrome_options.add_experimental_option('useAutomationExtension', False)
+                if self.headless:
+                    chrome_options.add_argument("--headless=new")
                 chrome_options.binary_location = browser_driver_path
                 driver = webdriver.Chrome(options=chrome_options)
+                self._block_urls(driver, self.profile)
             elif browser_type.lower() == 'firefox':
                 firefox_options = FirefoxOptions()
-                self.user_agent = UserAgent().random
+                firefox_options.page_load_strategy = SeleniumDriver.PAGE_LOAD_STRATEGY
+                self.user_agent = self._session_user_agent()
+                # The profile is copied to a temporary directory, every driver gets its own
                 profile = webdriver.FirefoxProfile(
                     f"{self.config.get_value(ConfigConstants.BROWSER_DATA_PATH)}")
-                profile.set_preference("general.useragent.override", self.user_agent)
-                profile.set_preference("dom.webdriver.enabled", False)
+                self._set_firefox_preferences(profile, embedded=False)
                 firefox_options.profile = profile
+                if self.headless:
+                    firefox_options.add_argument("-headless")
                 firefox_options.binary_location = browser_driver_path
                 driver = webdriver.Firefox(options=firefox_options)
             elif browser_type.lower() == 'embedded':
                 options = Options()
+                options.page_load_strategy = SeleniumDriver.PAGE_LOAD_STRATEGY
 
-                self.user_agent = UserAgent().random
+                self.user_agent = self._session_user_agent()
                 profile = webdriver.FirefoxProfile(
                     f"{self.config.get_value(ConfigConstants.BROWSER_DATA_PATH)}")
-                profile.set_preference("general.useragent.override", self.user_agent)
-                profile.set_preference("dom.webdriver.enabled", False)
+                self._set_firefox_preferences(profile, embedded=True)
                 options.profile = profile
+                if self.headless:
+                    options.add_argument("-headless")
 
                 options.binary_location = self.config.get_value(ConfigConstants.BROWSER_DRIVER_PATH)
-                service = Service(executable_path=self.config.get_value("geckodriver"))
+                service = Service(executable_path=self.config.get_value("geckodriver"),
+                                  env={**os.environ, **self._tor_environment()})
 
                 driver = webdriver.Firefox(
                     options=options,
@@ -84,6 +164,11 @@ class SeleniumDriver:
             else:
                 raise ValueError(f"Unsupported browser type: {browser_type}")
 
+            # A stalled browser makes the call to the driver fail instead of hanging on it
+            driver.command_executor.client_config.timeout = self.config.get_value(
+                ConfigConstants.DRIVER_COMMAND_TIMEOUT_SEC)
+            driver.set_page_load_timeout(self.timeout)
+            self.stalled = False
             self.logger.info(f"Browser driver for {browser_type} initialized successfully.")
             return driver
 
@@ -91,174 +176,356 @@ class SeleniumDriver:
             self.logger.error(f"Failed to initialize browser driver: {e}")
             raise
 
-    def _initialize_tabs(self):
-        self.logger.info("Initializing browser tabs.")
-        for tab in range(1, self.number_of_tabs):
-            self.driver.execute_script("window.open('about:blank', '_blank');")
-            time.sleep(2)
-            self.logger.debug(f"Opened tab {tab}.")
-            if tab == 1 and self.config.get_value(ConfigConstants.BROWSER_EMBEDDED):
-                self.logger.debug("Clicking 'always connect automatically' button.")
-                self.click_always_connect_automatically()
-                time.sleep(5)
+    @staticmethod
+    def _block_urls(driver, profile: BrowserProfile):
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": profile.blocked_urls()})
+
+    def apply_profile(self, profile: BrowserProfile):
+        """
+        Switch the resources the running browser loads, effective from the next page load.
+
+        :param profile: The profile to apply.
+        """
+        with self._lock:
+            self.logger.info(f"Applying browser profile: {profile}.")
+            if isinstance(self.driver, webdriver.Chrome):
+                self._block_urls(self.driver, profile)
+            else:
+                with self.driver.context(self.driver.CONTEXT_CHROME):
+                    self.driver.execute_script(BrowserScript.load("firefox_preferences"),
+                                               profile.firefox_preferences())
 
-        for i, handle in enumerate(self.driver.window_handles):
-            self.window_handles[i] = handle
-        self.logger.info(f"Initialized {self.number_of_tabs} tabs.")
+    def record_timing(self, url: str, spec: PageSpec, wait: float):
+        """
+        Record the Navigation and Resource Timing of the loaded page in the page metrics.
+        The page is already loaded, a failing script, a closed window or a script timeout only loses the metrics.
+
+        :param wait: Seconds the fetch waited before the request.
+        """
+        try:
+            timing = self.driver.execute_script(BrowserScript.load("navigation_timing"))
+        except WebDriverException as e:
+            self.logger.debug(f"Navigation timing not available: {e.msg}")
+            return
+        if not timing:
+            return
+        PageMetrics().record(self.interface_name, str(spec) if spec is not None else None, self.slot, url, wait, timing)
+        self.logger.debug(f"Page {spec} with profile {self.profile}: {timing['bytes'] / 1024:.1f} KiB, "
+                          f"{timing['resources']} resources, ready in {timing['ready_ms']:.0f} ms.")
+
+    def _tor_environment(self) -> dict:
+        """
+        :return: The ports of the tor launched by an embedded Tor browser, read by its launcher from the environment.
+        """
+        if self.slot == 0 or self._proxy() is not None:
+            return {}
+        offset = self.slot * SeleniumDriver.TOR_PORT_STRIDE
+        return {"TOR_SOCKS_PORT": str(SeleniumDriver.TOR_SOCKS_PORT + offset),
+                "TOR_CONTROL_PORT": str(SeleniumDriver.TOR_CONTROL_PORT + offset)}
+
+    def _tor_controller(self) -> TorController | None:
+        """
+        :return: The controller of the tor launched by an embedded Tor browser, None for other browsers.
+        """
+        if self.config.get_value(ConfigConstants.BROWSER_TYPE).lower() != 'embedded' or self._proxy() is not None:
+            return None
+        port = SeleniumDriver.TOR_CONTROL_PORT + self.slot * SeleniumDriver.TOR_PORT_STRIDE
+        return TorController(port, self.config.get_value(ConfigConstants.TOR_CONTROL_PASSWORD) or None,
+                             timeout=self.timeout)
+
+    def rotate_identity(self, domain: str) -> bool:
+        """
+        Get a new exit IP without restarting the browser: NEWNYM is sent to the control port of its tor,
+        then the cookies of the banned site are cleared.
+
+        :param domain: The banned site.
+        :return: False if the driver cannot rotate its identity, a restart is then needed.
+        """
+        if self.tor_controller is None:
+            return False
+        self.logger.info(f"Rotating Tor identity for {domain}.")
+        with self._lock:
+            if not self.tor_controller.new_identity():
+                return False
+            # Pooled fast path connections would keep using the old circuit
+            PageFetcher().reset(self.proxy_url())
+            try:
+                if domain in urllib.parse.urlparse(self.driver.current_url).netloc:
+                    self.driver.delete_all_cookies()
+                    self.logger.info(f"Cookies of {domain} cleared.")
+            except WebDriverException as e:
+                self.logger.warning(f"Failed to clear cookies of {domain}: {e.msg}")
+        return True
 
     def click_always_connect_automatically(self):
+        """
+        Connect the Tor browser, waiting for the connection page to show its button and then to go away.
+        """
         try:
             self.logger.info("Attempting to click 'always connect automatically' button.")
-            connect_button = self.driver.find_element(By.ID, "connectButton")
+            connect_button = WebDriverWait(self.driver, self.timeout).until(
+                lambda x: self.driver.find_element(By.ID, "connectButton"))
             connect_button.click()
+            WebDriverWait(self.driver, self.timeout).until(
+                lambda x: not self.driver.current_url.startswith(SeleniumDriver.TOR_CONNECT_URL))
             self.logger.info("Connection was successful.")
         except Exception as e:
             self.logger.error(f"Error clicking 'always connect automatically': {e}")
 
-    def restart_driver(self):
+    def _session_user_agent(self) -> str:
+        """
+        :return: The user agent of the stored session, a new one for a new session.
+        """
+        user_agent = self.session.user_agent() if self.session is not None else None
+        if user_agent is None:
+            user_agent = UserAgent().random
+            if self.session is not None:
+                self.session.reset(user_agent)
+        return user_agent
+
+    def adopt_session(self, session: SessionStore):
+        """
+        Take over the session of a slot with the user agent of this browser, dropping the stored site state:
+        cookies obtained with another user agent would give the client away.
+        """
+        with self._lock:
+            session.reset(self.user_agent)
+            self.session = session
+            self._session_domains.clear()
+            self._snapshot_at.clear()
+
+    def discard_session(self, domain: str):
+        if self.session is not None:
+            self.logger.info(f"Discarding the stored session of {domain}.")
+            self.session.discard(domain)
+            self._snapshot_at.pop(domain, None)
+
+    def _restore_session(self, url: str):
+        parsed = urllib.parse.urlparse(url)
+        if self.session is None or parsed.netloc in self._session_domains:
+            return
+        self._session_domains.add(parsed.netloc)
+        state = self.session.get(parsed.netloc)
+        if state is None:
+            return
+
+        self.logger.info(f"Restoring the stored session of {parsed.netloc}.")
+        try:
+            # Cookies and storage can only be set on the current site, a small page of it is loaded first
+            self.driver.get(f"{parsed.scheme}://{parsed.netloc}/robots.txt")
+            for cookie in state["cookies"]:
+                try:
+                    self.driver.add_cookie(cookie)
+                except WebDriverException as e:
+                    self.logger.debug(f"Cookie {cookie.get('name')} not restored: {e.msg}")
+            self.driver.execute_script(BrowserScript.load("write_local_storage"), state["local_storage"])
+        except WebDriverException as e:
+            self.logger.warning(f"Failed to restore the session of {parsed.netloc}: {e.msg}")
+
+    def _snapshot_session(self, url: str):
+        domain = urllib.parse.urlparse(url).netloc
+        if self.session is None or Clock.get().time() < self._snapshot_at.get(domain, 0):
+            return
+        self._snapshot_at[domain] = Clock.get().time() + self.config.get_value(ConfigConstants.SESSION_SNAPSHOT_SEC)
+        try:
+            self.session.save(domain, self.driver.get_cookies(),
+                              self.driver.execute_script(BrowserScript.load("read_local_storage")))
+        except WebDriverException as e:
+            self.logger.warning(f"Failed to store the session of {domain}: {e.msg}")
+
+    def browser_rss(self) -> int | None:
+        """
+        :return: The resident set size of the driver service and its browser processes in bytes, None if unknown.
+        """
+        try:
+            return ProcessUtils.tree_rss(self.driver.service.process.pid)
+        except AttributeError:
+            return None
+
+    def restart(self):
         self.logger.info("Restarting browser driver.")
-        with self._condition:
-            urls_to_reload = {}
-            i = 0
-            for tab in self.driver.window_handles:
-                self.driver.switch_to.window(tab)
-                urls_to_reload[str(i)] = self.driver.current_url
-                i+=1
-
-            self.close_driver()
-            self.driver = self._initialize_driver()
-            self._initialize_tabs()
-            time.sleep(2)
+        with self._lock:
+            url_to_reload = None if self.stalled else self.driver.current_url
 
-            i = 0
-            for tab in self.driver.window_handles:
-                self.driver.switch_to.window(tab)
-                self.driver.get(urls_to_reload[str(i)])
+            self.close()
+            self.driver = self._initialize_driver()
+            self._session_domains.clear()
+            self.pages_served = 0
+            if url_to_reload is not None:
+                time.sleep(2)
+                self.driver.get(url_to_reload)
                 time.sleep(5)
-                i+=1
-            time.sleep(5)
 
-    def obtain_tab(self, url_search: str) -> int:
-        self.logger.info(f"Attempting to obtain a tab for URL search: {url_search}.")
-        index_tab = None
-        while True:
-            with self._condition:
-                for tab_id, is_available in self.available_tabs.items():
-                    if is_available:
-                        index_tab = tab_id
-                        self.available_tabs[tab_id] = False
-                        self.logger.info(f"Tab[{tab_id}] assigned for URL search: {url_search}.")
-                        break
-                if index_tab is None:
-                    self._condition.wait()
-                    continue
-
-                self._condition.notify_all()
-                return index_tab
-
-    def load_url_from_tab(self, index_tab: int, url: str, skip_ready_wait: bool = False):
-        self.logger.info(f"Loading URL: {url} in tab[{index_tab}].")
-        if index_tab is not None and (0 <= index_tab < self.number_of_tabs):
-            with self._condition:
-                self.driver.switch_to.window(self.window_handles[index_tab])
+    def kill_stalled(self):
+        """
+        Kill the browser of a stalled fetch, failing the call it hangs on. Called by the watchdog, or by the pool
+        taking back the driver of a stalled handler.
+        """
+        self.stalled = True
+        ProcessUtils.kill_tree(self.driver.service.process.pid)
+
+    def load_url(self, url: str, ready_selector: str = None, possible_captcha: str = None):
+        """
+        Load a page. With the eager page load strategy the driver returns once the DOM is parsed, without waiting
+        for images and frames; the page is then ready as soon as the element needed by the extractor is present.
+
+        :param ready_selector: CSS selector of the element the extractor needs.
+        :param possible_captcha: Id of the captcha element, which ends the wait as well.
+        """
+        self.logger.info(f"Loading URL: {url}.")
+        with self._lock:
+            self.load_timed_out = False
+            try:
                 self.driver.get(url)
-
+                if ready_selector is not None:
+                    WebDriverWait(self.driver, self.timeout).until(
+                        lambda x: self.driver.find_elements(By.CSS_SELECTOR, ready_selector) or (
+                                possible_captcha is not None and self.driver.find_elements(By.ID, possible_captcha))
+                    )
+                self.logger.info(f"URL {url} loaded successfully.")
+            except TimeoutException:
+                self.load_timed_out = True
+                self.logger.warning(f"Element {ready_selector} not found within {self.timeout} seconds: {url}")
+            except UnexpectedAlertPresentException:
+                self.logger.warning("Unexpected alert detected; dismissing.")
                 try:
-                    if not skip_ready_wait:
-                        WebDriverWait(self.driver, self.timeout).until(
-                            lambda x: self.driver.execute_script("return document.readyState") == "complete"
-                        )
-                    else:
-                        time.sleep(3)
-                    self.logger.info(f"URL {url} loaded successfully in tab[{index_tab}].")
-                except UnexpectedAlertPresentException:
-                    self.logger.warning("Unexpected alert detected; dismissing.")
-                    try:
-                        alert = self.driver.switch_to.alert
-                        alert.dismiss()
-                        self.logger.info("Alert dismissed.")
-                    except NoAlertPresentException:
-                        self.logger.warning("No alert found during dismissal attempt.")
-
-                self._condition.notify_all()
-        else:
-            error_msg = f"Invalid tab index: {index_tab} for URL: {url}"
-            self.logger.error(error_msg)
-            raise Exception(error_msg)
-
-    def obtain_html_from_tab(self, index_tab: int, specific_wait_time: int = 0, possible_captcha: str = None) -> str:
-        self.logger.info(f"Obtaining HTML from tab[{index_tab}].")
-        if index_tab is not None and (0 <= index_tab < self.number_of_tabs):
-            if specific_wait_time > 0:
-                self.logger.debug(f"Waiting for {specific_wait_time} seconds before fetching HTML.")
-                time.sleep(specific_wait_time)
-            else:
-                self.logger.debug("Using default wait time.")
-                ThreadUtils.sleep_for(self.ctx.get_config().get_value(ConfigConstants.MIN_WAIT_TIME),
-                                      self.ctx.get_config().get_value(ConfigConstants.MAX_WAIT_TIME),
-                                      self.logger,
-                                      str(index_tab))
-
-            with self._condition:
-                self.driver.switch_to.window(self.window_handles[index_tab])
-
-                if possible_captcha is not None:
-                    with self._captcha_condition:
-                        captcha_handler = CaptchaHandler(self.driver, index_tab, self.timeout, self.user_agent,
-                                                         possible_captcha)
-
-                        if captcha_handler.check_for_captcha():
-                            self.logger.info("Captcha detected. Attempting to solve.")
-                            captcha_handler.solve_captcha()
-                            self.refresh_all_tabs()
-
-                self.logger.info(f"HTML obtained from tab[{index_tab}].")
-                self._condition.notify_all()
-                return self.driver.page_source
-
-        else:
-            error_msg = f"Invalid tab index: {index_tab}"
-            self.logger.error(error_msg)
-            raise Exception(error_msg)
-
-    def release_tab(self, index_tab: int, url_search: str):
-        self.logger.info(f"Releasing tab[{index_tab}] for URL search: {url_search}.")
-        if index_tab is not None and (0 <= index_tab < self.number_of_tabs):
-            with self._condition:
-                self.available_tabs[index_tab] = True
-                self.logger.info(f"Tab[{index_tab}] released successfully.")
-                self._condition.notify_all()
-        else:
-            error_msg = f"Invalid tab index: {index_tab} during release for URL search: {url_search}"
-            self.logger.error(error_msg)
-            raise Exception(error_msg)
-
-    def refresh_all_tabs(self):
-        for tab in self.driver.window_handles:
-            self.driver.switch_to.window(tab)
+                    alert = self.driver.switch_to.alert
+                    alert.dismiss()
+                    self.logger.info("Alert dismissed.")
+                except NoAlertPresentException:
+                    self.logger.warning("No alert found during dismissal attempt.")
+
+    def obtain_html(self, possible_captcha: str = None) -> Page:
+        self.logger.info("Obtaining HTML.")
+        with self._lock:
+            page = Page(self.driver.page_source)
+            self._handle_captcha(possible_captcha, page)
+            self.logger.info("HTML obtained.")
+            return page
+
+    def extract(self, script: str, possible_captcha: str = None) -> dict | Page:
+        """
+        Run a bundled script on the loaded page, falling back to the HTML when it finds nothing.
+
+        :param script: The name of the script.
+        :return: The fields returned by the script, else the HTML of the page.
+        """
+        with self._lock:
+            self._handle_captcha(possible_captcha)
+            try:
+                data = self.driver.execute_script(BrowserScript.load(script))
+            except JavascriptException as e:
+                self.logger.warning(f"Script {script} failed, falling back to HTML: {e.msg}")
+                data = None
+            if data is None:
+                self.logger.info(f"Script {script} found no data, obtaining HTML.")
+                return Page(self.driver.page_source)
+
+            self.logger.info(f"Data extracted by script {script}.")
+            return data
+
+    def _handle_captcha(self, possible_captcha: str = None, page: Page = None):
+        if possible_captcha is None:
+            return
+        captcha_handler = CaptchaHandler(self.driver, self.slot, self.timeout, self.user_agent, possible_captcha)
+        if captcha_handler.check_for_captcha(page):
+            # Solved by the pool, either on this driver or on a quarantined one
+            raise CaptchaDetectedException(urllib.parse.urlparse(self.driver.current_url).netloc, captcha_handler)
+
+    def solve_captcha(self, captcha: CaptchaDetectedException):
+        """
+        Solve a captcha shown by the driver, while the requests of every driver to its site are paused.
+        """
+        self.logger.info(f"Captcha detected on {captcha.domain}. Attempting to solve.")
+        gate = DomainGate()
+        gate.pause(captcha.domain)
+        full_profile = self.profile is not FULL and self.config.get_value(ConfigConstants.CAPTCHA_FULL_PROFILE)
+        try:
+            with self._lock:
+                if full_profile:
+                    # The challenge needs its images and scripts, it is reloaded with every resource allowed
+                    self.apply_profile(FULL)
+                    self.refresh()
+                    if not captcha.handler.check_for_captcha():
+                        return
+                captcha.handler.solve_captcha()
+                self.refresh()
+        finally:
+            if full_profile:
+                self.apply_profile(self.profile)
+            gate.resume(captcha.domain)
+
+    def proxy_url(self) -> str | None:
+        """
+        :return: The proxy the browser goes through, for clients that must look like it.
+        """
+        proxy = self._proxy()
+        if proxy is not None:
+            return f"socks5h://{proxy[0]}:{proxy[1]}"
+        if self.config.get_value(ConfigConstants.BROWSER_TYPE).lower() == 'embedded':
+            port = SeleniumDriver.TOR_SOCKS_PORT + self.slot * SeleniumDriver.TOR_PORT_STRIDE
+            return f"socks5h://127.0.0.1:{port}"
+        return None
+
+    def fetch(self, url: str, possible_captcha: str = None, cancel: threading.Event = None,
+              spec: PageSpec = None, paced: bool = True) -> dict | Page | None:
+        """
+        Load a page as soon as the politeness wait since the previous fetch allows, and return its HTML.
+        The wait is paced from the start of each request, so it overlaps with whatever the caller does meanwhile.
+        Pages with a spec are first requested over plain HTTP, the browser is used when that fails.
+        Pages whose spec has a script are extracted in the browser, see extract.
+
+        :param cancel: Optional event aborting the fetch while it waits for its turn.
+        :param spec: The page expected by the extractor, enabling the HTTP fast path.
+        :param paced: False for requests outside of the politeness budget, such as lookups on another host.
+        :return: The fields extracted by the script of the spec, else the HTML of the page, None if cancelled.
+        :raise CaptchaDetectedException: The page shows the possible captcha.
+        """
+        started = Clock.get().time()
+        if paced and not ThreadUtils.sleep_until(self.next_request_at, self.logger, url, cancel):
+            return None
+        if not DomainGate().wait(urllib.parse.urlparse(url).netloc, cancel):
+            return None
+
+        with self._lock:
+            if paced:
+                self.next_request_at = Clock.get().time() + ThreadUtils.random_wait(
+                    self.ctx.get_config().get_value(ConfigConstants.MIN_WAIT_TIME),
+                    self.ctx.get_config().get_value(ConfigConstants.MAX_WAIT_TIME))
+
+            request_started = Clock.get().time()
+            self.load_timed_out = False
+            try:
+                if spec is not None and spec.http:
+                    page_source = PageFetcher().get(url, spec, self.user_agent, self.proxy_url())
+                    if page_source is not None:
+                        return page_source
+
+                with Watchdog().watch(f"Driver {self.interface_name}[{self.slot}] fetching {url}",
+                                      self.config.get_value(ConfigConstants.DRIVER_STALL_SEC), self.kill_stalled):
+                    self._restore_session(url)
+                    wait = Clock.get().time() - started
+                    self.load_url(url, spec.ready_selector if spec is not None else None, possible_captcha)
+                    self.pages_served += 1
+                    self.record_timing(url, spec, wait)
+                    self._snapshot_session(url)
+                    if spec is not None and spec.script is not None:
+                        return self.extract(spec.script, possible_captcha)
+                    return self.obtain_html(possible_captcha)
+            finally:
+                self.last_request_sec = Clock.get().time() - request_started
+
+    def refresh(self):
+        with self._lock:
             self.driver.get(self.driver.current_url)
             time.sleep(5)
-        time.sleep(5)
 
-    def close_driver(self):
+    def close(self):
         self.logger.info("Closing browser driver.")
-        with self._condition:
+        with self._lock:
             try:
                 self.driver.quit()
                 self.logger.info(f"Driver for interface {self.interface_name} closed successfully.")
             except Exception as e:
                 self.logger.error(f"Error closing driver: {e}")
-
-class SeleniumDriverManager:
-    _instances = {}
-    _lock = threading.Lock()
-
-    @classmethod
-    def get_instance(cls, interface_name: str) -> SeleniumDriver:
-        with cls._lock:
-            if interface_name not in cls._instances:
-                cls._instances[interface_name] = SeleniumDriver(interface_name)
-            return cls._instances[interface_name]
-
-
-
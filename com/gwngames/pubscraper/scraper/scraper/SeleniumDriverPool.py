@@ -0,0 +1,497 @@
+import logging
+import threading
+from collections import deque
+from typing import Callable
+
+from com.gwngames.pubscraper.Context import Context
+from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+from com.gwngames.pubscraper.exception.CaptchaDetectedException import CaptchaDetectedException
+from com.gwngames.pubscraper.scraper.scraper.ConcurrencyController import ConcurrencyController
+from com.gwngames.pubscraper.scraper.scraper.DomainGate import DomainGate
+from com.gwngames.pubscraper.scraper.scraper.Page import Page
+from com.gwngames.pubscraper.scraper.scraper.PageSpec import PageSpec
+from com.gwngames.pubscraper.scraper.scraper.SeleniumDriver import SeleniumDriver
+from com.gwngames.pubscraper.scraper.scraper.SessionStore import SessionStore
+from com.gwngames.pubscraper.utils.Clock import Clock
+from com.gwngames.pubscraper.utils.SingleFlight import SingleFlight
+from com.gwngames.pubscraper.utils.StringUtils import StringUtils
+
+
+class SeleniumDriverPool:
+    """
+    Pool of independent browser drivers of a scraper.
+    Scrapers lease a driver for the duration of a fetch, page loads and waits of different leases run in parallel.
+    Drivers are started on demand, up to the configured pool size.
+    With driver_hot_spare, a warmed spare driver with its own identity is kept aside: restarting a banned or crashed
+    driver swaps the spare in, and the next spare is built in the background on the identity of the retired driver.
+    Drivers that served driver_max_pages pages or whose browser outgrew driver_max_rss_mb are recycled the same way
+    when they are released, between two leases.
+    The number of drivers leased at once is adapted by a ConcurrencyController, from the latency of the fetches
+    and the bans, captchas and timeouts they run into.
+    Leases waiting for a driver are served first in, first out, each released driver wakes a single waiter.
+    A lease is released once, by the thread which took it: other releases of the driver are ignored.
+    The leases of a stalled handler are taken back, see abandon_leases.
+    The router admits messages of the scraper only while the limit allows, so that they do not wait at all,
+    and is notified whenever the limit grows or a driver is released to admit the messages it parked.
+
+    :param interface_name: The scraper owning the pool.
+    """
+
+    CAPTCHA_ATTEMPTS = 3  # Fetches of a page showing a captcha, each after a solving attempt
+    flights = SingleFlight()  # Shared by every pool, the same page may be requested through several scrapers
+
+    def __init__(self, interface_name: str):
+        self.interface_name = interface_name
+        self.logger = logging.getLogger(f"SeleniumDriverPool-{interface_name}")
+        self.ctx = Context()
+        self.size = self.ctx.get_config().get_value(ConfigConstants.DRIVER_POOL_SIZE) or self.ctx.get_max_requests()
+        self.drivers: dict[int, SeleniumDriver] = {}
+        self.available = {i: True for i in range(self.size)}
+        self._lock = threading.Lock()
+        self._waiters: deque[_LeaseWaiter] = deque()
+        self.hot_spare = bool(self.ctx.get_config().get_value(ConfigConstants.DRIVER_HOT_SPARE))
+        self._spare: SeleniumDriver | None = None
+        self._spare_identity = self.size  # Slot numbers past the pool size give the spare its own ports and profile
+        self._spare_building = False
+        self._generation = 0  # Incremented when the drivers are closed, discarding spares built meanwhile
+        self._spare_lock = threading.Lock()
+        self.rotations = {i: 0 for i in range(self.size)}  # Identity rotations of each slot since its last restart
+        self._rss_sampled_at = {}
+        self.concurrency = ConcurrencyController(interface_name, self.size)
+        self.leased = 0
+        self.holders: dict[int, tuple[str, int]] = {}  # What each leased driver is leased for, and by which thread
+        self.admitted = 0  # Messages the router dispatched to the scraper and not yet processed
+        self._warming = set()  # Slots held while their driver starts in the background
+        self._capacity_listener: Callable[[], None] | None = None
+        self.logger.info(f"Driver pool of {self.size} drivers created.")
+
+    def lease_driver(self, url_search: str) -> int:
+        """
+        Lease a driver, waiting until one is available within the concurrency limit.
+
+        :param url_search: What the driver is leased for, used for logging.
+        :return: The slot of the leased driver.
+        """
+        self.logger.info(f"Attempting to lease a driver for: {url_search}.")
+        with self._lock:
+            slot = None if self._waiters else self._take_slot()
+            if slot is None:
+                waiter = _LeaseWaiter()
+                self._waiters.append(waiter)
+        if slot is None:
+            waiter.ready.wait()
+            slot = waiter.slot
+        with self._lock:
+            self.holders[slot] = (url_search, threading.get_ident())
+
+        try:
+            self.get_driver(slot)
+        except Exception:
+            self.release_driver(slot, url_search)
+            raise
+        self.logger.info(f"Driver[{slot}] leased for: {url_search}.")
+        return slot
+
+    def _take_slot(self) -> int | None:
+        """
+        Lease a slot if one is available within the concurrency limit. Called with the lock held.
+        """
+        if self.leased >= self.concurrency.limit():
+            return None
+        # Started drivers come first, a new browser is only launched when all of them are busy
+        free = [i for i, is_available in self.available.items() if is_available]
+        started = [i for i in free if i in self.drivers]
+        if not started and self._warming:
+            return None  # The first driver warmed up comes sooner than a new browser
+        slot = (started or free or [None])[0]
+        if slot is not None:
+            self.available[slot] = False
+            self.leased += 1
+        return slot
+
+    def _hand_off(self):
+        """
+        Hand the available slots to the waiting leases, in their order. Called with the lock held.
+        """
+        while self._waiters:
+            slot = self._take_slot()
+            if slot is None:
+                return
+            waiter = self._waiters.popleft()
+            waiter.slot = slot
+            waiter.ready.set()
+
+    def admit(self) -> bool:
+        """
+        Admit a message of the scraper if the concurrency limit allows one more, see dismiss.
+
+        :return: False if the message has to wait for an admitted one to be processed.
+        """
+        with self._lock:
+            if self.admitted >= self.concurrency.limit():
+                return False
+            self.admitted += 1
+            return True
+
+    def dismiss(self):
+        """
+        End the admission of a processed message.
+        """
+        with self._lock:
+            self.admitted -= 1
+
+    def on_capacity(self, listener: Callable[[], None]):
+        """
+        :param listener: Called, without any lock of the pool held, whenever the pool may admit more messages.
+        """
+        self._capacity_listener = listener
+
+    def _capacity_grew(self):
+        if self._capacity_listener is not None:
+            self._capacity_listener()
+
+    def get_driver(self, slot: int) -> SeleniumDriver:
+        if slot is None or not (0 <= slot < self.size):
+            error_msg = f"Invalid driver slot: {slot}"
+            self.logger.error(error_msg)
+            raise Exception(error_msg)
+
+        driver = self.drivers.get(slot)
+        if driver is None:
+            SeleniumDriverManager.browser_ready.wait()
+            # Only the leaseholder of a slot starts its driver, no lock is needed
+            driver = SeleniumDriver(self.interface_name, slot, SessionStore(self.interface_name, slot))
+            self.drivers[slot] = driver
+            self._build_spare()
+        return driver
+
+    def warm_up(self):
+        """
+        Start drivers in the background and in parallel, up to the concurrency limit.
+        Their slots are held while they start, so that leases wait for the first driver ready
+        instead of launching browsers of their own.
+        """
+        with self._lock:
+            slots = [i for i, is_available in self.available.items()
+                     if is_available and i not in self.drivers][:self.concurrency.limit()]
+            for slot in slots:
+                self.available[slot] = False
+            self._warming.update(slots)
+
+        def start(slot: int):
+            try:
+                self.get_driver(slot)
+                self.logger.info(f"Driver[{slot}] warmed up.")
+            except Exception as e:
+                self.logger.error(f"Failed to warm up driver[{slot}]: {e}")
+            finally:
+                with self._lock:
+                    self.available[slot] = True
+                    self._warming.discard(slot)
+                    self._hand_off()
+
+        for slot in slots:
+            threading.Thread(target=start, args=(slot,), name=f"WarmUp-{self.interface_name}-{slot}",
+                             daemon=True).start()
+
+    def _build_spare(self, retired: SeleniumDriver = None, before: Callable[[], None] = None, reserved: bool = False):
+        """
+        Build the next spare in the background, unless one is ready or being built.
+
+        :param retired: A driver swapped out, closed first so that the spare takes over its identity.
+        :param before: Work done in the background with the retired driver before it is closed.
+        :param reserved: The caller already flagged the spare as being built, when it took the previous one.
+        """
+        if not self.hot_spare:
+            if retired is not None:
+                retired.close()
+            return
+
+        with self._spare_lock:
+            if not reserved and (self._spare is not None or self._spare_building):
+                return
+            self._spare_building = True
+            generation = self._generation
+
+        def build():
+            identity = self._spare_identity if retired is None else retired.slot
+            spare = None
+            try:
+                if before is not None:
+                    before()
+                if retired is not None:
+                    retired.close()
+                spare = SeleniumDriver(self.interface_name, identity)
+                self.logger.info(f"Spare driver {identity} ready.")
+            except Exception as e:
+                self.logger.error(f"Failed to build spare driver {identity}: {e}")
+            with self._spare_lock:
+                self._spare_building = False
+                if generation == self._generation:
+                    self._spare_identity = identity  # Free again once the spare is swapped in and retired
+                    self._spare, spare = spare, None
+            if spare is not None:
+                spare.close()  # The pool was closed meanwhile
+
+        threading.Thread(target=build, name=f"SpareDriver-{self.interface_name}", daemon=True).start()
+
+    def fetch(self, slot: int, url: str, possible_captcha: str = None, cancel: threading.Event = None,
+              spec: PageSpec = None, paced: bool = True) -> dict | Page | None:
+        """
+        Fetch a page with the driver of a slot.
+        Concurrent fetches of the same page are coalesced: one driver loads it and the others share its result,
+        which is served for single_flight_ttl_sec to later fetches as well.
+        A page showing a captcha is fetched again once the captcha is solved: the driver is quarantined when a spare
+        can take its slot, so that solving it does not hold the lease, otherwise it is solved in place.
+        Meanwhile, the requests of every driver to the site are paused.
+        """
+        key = (StringUtils.normalize_url(url), spec.name if spec is not None else None)
+        return SeleniumDriverPool.flights.do(
+            key, lambda: self._fetch(slot, url, possible_captcha, cancel, spec, paced),
+            self.ctx.get_config().get_value(ConfigConstants.SINGLE_FLIGHT_TTL_SEC) or 0, cancel)
+
+    def _fetch(self, slot: int, url: str, possible_captcha: str, cancel: threading.Event, spec: PageSpec,
+               paced: bool) -> dict | Page | None:
+        for attempt in range(SeleniumDriverPool.CAPTCHA_ATTEMPTS):
+            driver = self.get_driver(slot)
+            try:
+                page = driver.fetch(url, possible_captcha, cancel, spec, paced)
+                if driver.load_timed_out:
+                    self.concurrency.on_congestion("timeout")
+                elif page is not None and self.concurrency.on_success(driver.last_request_sec):
+                    with self._lock:
+                        self._hand_off()
+                    self._capacity_grew()
+                return page
+            except CaptchaDetectedException as captcha:
+                self.concurrency.on_congestion("captcha")
+                if attempt == SeleniumDriverPool.CAPTCHA_ATTEMPTS - 1:
+                    raise
+                if not self._quarantine(slot, captcha):
+                    self.get_driver(slot).solve_captcha(captcha)
+            except Exception:
+                if driver.stalled and self.drivers.get(slot) is driver:
+                    # Killed by the watchdog, the slot gets a fresh browser before the message is retried
+                    self.concurrency.on_congestion("timeout")
+                    self.restart_driver(slot)
+                raise
+
+    def _quarantine(self, slot: int, captcha: CaptchaDetectedException) -> bool:
+        """
+        Swap the spare into the slot and solve the captcha on the retired driver in the background,
+        then close it and build the next spare on its identity.
+
+        :return: False if no spare is ready.
+        """
+        with self._spare_lock:
+            spare, self._spare = self._spare, None
+            if spare is None:
+                return False
+            self._spare_building = True
+
+        driver = self.drivers[slot]
+        DomainGate().pause(captcha.domain)  # Until the quarantined driver starts solving
+        self._swap(slot, driver, spare)
+        self.logger.warning(f"Driver[{slot}] - Quarantined driver {driver.slot} for a captcha on {captcha.domain}.")
+
+        def solve():
+            try:
+                driver.solve_captcha(captcha)
+            except Exception as e:
+                self.logger.error(f"Quarantined driver {driver.slot} failed to solve the captcha: {e}")
+            finally:
+                DomainGate().resume(captcha.domain)
+
+        self._build_spare(retired=driver, before=solve, reserved=True)
+        return True
+
+    def restart_driver(self, slot: int):
+        """
+        Give the slot a fresh browser, swapping in the spare when one is ready, restarting the driver otherwise.
+        """
+        driver = self.get_driver(slot)
+        self.rotations[slot] = 0
+        with self._spare_lock:
+            spare, self._spare = self._spare, None
+            if spare is not None:
+                self._spare_building = True  # On the identity of the retired driver
+
+        if spare is None:
+            self.logger.warning(f"No spare driver ready, restarting driver[{slot}].")
+            driver.restart()
+            self._rss_sampled_at.pop(driver, None)
+            self._build_spare()
+            return
+
+        self._swap(slot, driver, spare)
+        self._build_spare(retired=driver, reserved=True)
+
+    def _swap(self, slot: int, driver: SeleniumDriver, spare: SeleniumDriver):
+        # The politeness wait and the session belong to the slot, the spare goes on with them
+        spare.next_request_at = driver.next_request_at
+        spare.adopt_session(driver.session)
+        self.drivers[slot] = spare
+        self._rss_sampled_at.pop(driver, None)
+        self.logger.info(f"Driver[{slot}] swapped with spare driver {spare.slot}.")
+
+    def renew_identity(self, slot: int, domain: str):
+        """
+        Handle a ban of a driver: rotate its Tor identity, escalating to a restart when it cannot rotate or the
+        configured number of rotations since its last restart is reached.
+
+        :param domain: The banned site.
+        """
+        self.concurrency.on_congestion("ban")
+        if self.ctx.get_config().get_value(ConfigConstants.SESSION_DISCARD_ON_BAN):
+            self.get_driver(slot).discard_session(domain)
+
+        limit = self.ctx.get_config().get_value(ConfigConstants.TOR_ROTATIONS_BEFORE_RESTART)
+        if self.rotations[slot] < limit and self.get_driver(slot).rotate_identity(domain):
+            self.rotations[slot] += 1
+            return
+
+        self.logger.warning(f"Driver[{slot}] - Escalating ban on {domain} to a restart.")
+        self.restart_driver(slot)
+
+    def release_driver(self, slot: int, url_search: str):
+        self.logger.info(f"Releasing driver[{slot}] for: {url_search}.")
+        if slot is None or not (0 <= slot < self.size):
+            error_msg = f"Invalid driver slot: {slot} during release for: {url_search}"
+            self.logger.error(error_msg)
+            raise Exception(error_msg)
+
+        with self._lock:
+            holder = self.holders.get(slot)
+            if holder is None or holder[1] != threading.get_ident():
+                self.logger.warning(f"Driver[{slot}] is not leased by this thread, ignoring its release for: "
+                                    f"{url_search}.")
+                return
+            del self.holders[slot]
+
+        try:
+            self._recycle_if_worn(slot)
+        except Exception as e:
+            self.logger.error(f"Driver[{slot}] - Failed to recycle driver: {e}")
+
+        with self._lock:
+            self.available[slot] = True
+            self.leased -= 1
+            self._hand_off()
+        self._capacity_grew()
+        self.logger.info(f"Driver[{slot}] released successfully.")
+
+    def abandon_leases(self, thread: int):
+        """
+        Take back the drivers leased by the thread of a stalled handler. Their browsers are killed, failing the calls
+        the thread may still make with them, and their slots start fresh drivers for the next leases.
+
+        :param thread: The identifier of the stalled thread.
+        """
+        with self._lock:
+            slots = [slot for slot, holder in self.holders.items() if holder[1] == thread]
+            for slot in slots:
+                del self.holders[slot]
+            drivers = [self.drivers.pop(slot) for slot in slots if slot in self.drivers]
+
+        for driver in drivers:
+            try:
+                driver.kill_stalled()
+            except Exception as e:
+                self.logger.error(f"Failed to kill the browser of driver {driver.slot}: {e}")
+
+        with self._lock:
+            for slot in slots:
+                self.logger.warning(f"Driver[{slot}] taken back from a stalled handler.")
+                self.available[slot] = True
+                self.leased -= 1
+            self._hand_off()
+        self._capacity_grew()
+
+    def _recycle_if_worn(self, slot: int):
+        """
+        Recycle the driver of a slot past its page or memory limit. Called by the leaseholder on release.
+        """
+        driver = self.drivers.get(slot)
+        if driver is None:
+            return
+
+        config = self.ctx.get_config()
+        max_pages = config.get_value(ConfigConstants.DRIVER_MAX_PAGES)
+        if max_pages and driver.pages_served >= max_pages:
+            self.logger.info(f"Driver[{slot}] - Served {driver.pages_served} pages, recycling.")
+            self.restart_driver(slot)
+            return
+
+        max_rss_mb = config.get_value(ConfigConstants.DRIVER_MAX_RSS_MB)
+        now = Clock.get().time()
+        if not max_rss_mb or now < self._rss_sampled_at.get(driver, 0):
+            return
+        self._rss_sampled_at[driver] = now + config.get_value(ConfigConstants.DRIVER_RSS_SAMPLE_SEC)
+        rss = driver.browser_rss()
+        if rss is None:
+            return
+        self.logger.debug(f"Driver[{slot}] - Browser RSS: {rss / 2 ** 20:.0f} MB after {driver.pages_served} pages.")
+        if rss >= max_rss_mb * 2 ** 20:
+            self.logger.info(f"Driver[{slot}] - Browser RSS of {rss / 2 ** 20:.0f} MB, recycling.")
+            self.restart_driver(slot)
+
+    def close_drivers(self):
+        self.logger.info("Closing all drivers of the pool.")
+        with self._lock:
+            drivers, self.drivers = self.drivers, {}
+        with self._spare_lock:
+            self._generation += 1
+            if self._spare is not None:
+                drivers[self.size] = self._spare
+                self._spare = None
+            self._spare_identity = self.size
+        for driver in drivers.values():
+            driver.close()
+
+
+class _LeaseWaiter:
+    """
+    A lease waiting in line, woken alone once a slot is handed to it.
+    """
+
+    def __init__(self):
+        self.ready = threading.Event()
+        self.slot = None
+
+
+class SeleniumDriverManager:
+    _instances = {}
+    _lock = threading.Lock()
+    browser_ready = threading.Event()  # Cleared while the browser is installed, drivers start once it is set
+    browser_ready.set()
+
+    @classmethod
+    def warm_up(cls, interface_names: list[str], prepare: Callable[[], None] = None):
+        """
+        Warm the driver pools of the given scrapers in the background, after preparing the browser.
+        Messages are processed meanwhile, their fetches wait for the first driver ready.
+
+        :param interface_names: The scrapers whose pools are warmed.
+        :param prepare: Installation of the browser, run in the background before any driver starts.
+        """
+        if prepare is not None:
+            cls.browser_ready.clear()
+
+            def run():
+                try:
+                    prepare()
+                finally:
+                    cls.browser_ready.set()
+
+            threading.Thread(target=run, name="BrowserInstall", daemon=True).start()
+
+        # The slots are held right away, the drivers start as soon as the browser is ready
+        for name in interface_names:
+            cls.get_instance(name).warm_up()
+
+    @classmethod
+    def get_instance(cls, interface_name: str) -> SeleniumDriverPool:
+        with cls._lock:
+            if interface_name not in cls._instances:
+                cls._instances[interface_name] = SeleniumDriverPool(interface_name)
+            return cls._instances[interface_name]
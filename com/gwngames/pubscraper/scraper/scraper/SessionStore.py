@@ -0,0 +1,49 @@
+from com.gwngames.pubscraper.Context import Context
+from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+from com.gwngames.pubscraper.utils.Clock import Clock
+from com.gwngames.pubscraper.utils.JsonReader import JsonReader
+
+
+class SessionStore:
+    """
+    Browser session of a driver slot, kept across restarts: the user agent of the slot together with the cookies
+    and local storage of each site it visited, so that a restarted browser is not a new unknown client.
+
+    :param interface_name: The scraper owning the driver.
+    :param slot: The slot of the driver in its pool.
+    """
+    USER_AGENT = "user_agent"
+    DOMAINS = "domains"
+
+    def __init__(self, interface_name: str, slot: int):
+        directory = Context().get_config().get_value(ConfigConstants.SESSION_STORE_DIR)
+        self.reader = JsonReader(f"{interface_name}_{slot}.json", directory, parent="SessionStore")
+
+    def user_agent(self) -> str | None:
+        return self.reader.get_value(SessionStore.USER_AGENT)
+
+    def reset(self, user_agent: str):
+        """
+        Start a new session, the state of the previous user agent is dropped.
+        """
+        with self.reader.lock:
+            self.reader.data = {SessionStore.USER_AGENT: user_agent, SessionStore.DOMAINS: {}}
+            self.reader.save_changes()
+
+    def get(self, domain: str) -> dict | None:
+        """
+        :return: The cookies and local storage of the site, None if unknown.
+        """
+        return (self.reader.get_value(SessionStore.DOMAINS) or {}).get(domain)
+
+    def save(self, domain: str, cookies: list[dict], local_storage: dict):
+        with self.reader.lock:
+            domains = self.reader.get_value(SessionStore.DOMAINS) or {}
+            domains[domain] = {"cookies": cookies, "local_storage": local_storage, "saved_at": Clock.get().time()}
+            self.reader.set_value(SessionStore.DOMAINS, domains)
+
+    def discard(self, domain: str):
+        with self.reader.lock:
+            domains = self.reader.get_value(SessionStore.DOMAINS) or {}
+            if domains.pop(domain, None) is not None:
+                self.reader.set_value(SessionStore.DOMAINS, domains)
@@ -0,0 +1,98 @@
+import logging
+import socket
+
+from com.gwngames.pubscraper.utils.Clock import Clock
+
+
+class TorControlException(Exception):
+    pass
+
+
+class TorController:
+    """
+    Minimal client of the Tor control protocol, requesting new circuits so that a banned driver gets a new exit IP
+    without restarting its browser.
+    Authenticates with the cookie file announced by PROTOCOLINFO, the configured password, or no credentials.
+
+    :param port: The control port of the tor instance.
+    :param password: Optional password of the control port.
+    :param timeout: Socket and circuit wait timeout, in seconds.
+    """
+    NEWNYM_INTERVAL = 10  # Tor delays NEWNYM signals sent more often than this
+    CIRCUIT_POLL_SEC = 0.5
+
+    def __init__(self, port: int, password: str = None, host: str = "127.0.0.1", timeout: float = 30):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+        self.logger = logging.getLogger(f"TorController-{port}")
+        self.last_newnym = None
+
+    def new_identity(self) -> bool:
+        """
+        Send NEWNYM and wait until tor has a circuit again.
+
+        :return: True when the new identity is ready.
+        """
+        try:
+            with socket.create_connection((self.host, self.port), timeout=self.timeout) as connection:
+                reader = connection.makefile("r", encoding="ascii", newline="\r\n")
+                self._authenticate(connection, reader)
+
+                if self.last_newnym is not None:
+                    remaining = self.last_newnym + TorController.NEWNYM_INTERVAL - Clock.get().time()
+                    if remaining > 0:
+                        self.logger.info(f"Waiting {remaining:.2f} seconds for the NEWNYM rate limit...")
+                        Clock.get().sleep(remaining)
+                self._command(connection, reader, "SIGNAL NEWNYM")
+                self.last_newnym = Clock.get().time()
+
+                deadline = Clock.get().time() + self.timeout
+                while Clock.get().time() < deadline:
+                    reply = self._command(connection, reader, "GETINFO status/circuit-established")
+                    if "status/circuit-established=1" in reply[0]:
+                        self.logger.info("New Tor identity ready.")
+                        self._command(connection, reader, "QUIT")
+                        return True
+                    Clock.get().sleep(TorController.CIRCUIT_POLL_SEC)
+                self.logger.warning(f"No circuit established within {self.timeout} seconds.")
+                return False
+        except (OSError, TorControlException) as e:
+            self.logger.error(f"Failed to request a new Tor identity: {e}")
+            return False
+
+    def _authenticate(self, connection: socket.socket, reader):
+        reply = self._command(connection, reader, "PROTOCOLINFO 1")
+        auth_line = next((line for line in reply if line.startswith("AUTH ")), "")
+        methods = auth_line.split("METHODS=", 1)[1].split(" ", 1)[0].split(",") if "METHODS=" in auth_line else []
+
+        if "NULL" in methods:
+            self._command(connection, reader, "AUTHENTICATE")
+        elif "COOKIE" in methods and 'COOKIEFILE="' in auth_line:
+            cookie_file = auth_line.split('COOKIEFILE="', 1)[1].rsplit('"', 1)[0]
+            with open(cookie_file, "rb") as f:
+                self._command(connection, reader, f"AUTHENTICATE {f.read().hex()}")
+        elif "HASHEDPASSWORD" in methods and self.password:
+            escaped = self.password.replace("\\", "\\\\").replace('"', '\\"')
+            self._command(connection, reader, f'AUTHENTICATE "{escaped}"')
+        else:
+            raise TorControlException(f"No supported authentication method: {methods}")
+
+    @staticmethod
+    def _command(connection: socket.socket, reader, command: str) -> list[str]:
+        """
+        :return: The lines of a successful reply, without status codes.
+        """
+        connection.sendall(f"{command}\r\n".encode("ascii"))
+        lines = []
+        while True:
+            line = reader.readline()
+            if not line:
+                raise TorControlException(f"Connection closed during: {command.split(' ', 1)[0]}")
+            line = line.rstrip("\r\n")
+            if not line[:3].startswith("2"):
+                raise TorControlException(f"{command.split(' ', 1)[0]} refused: {line}")
+            lines.append(line[4:])
+            if line[3:4] == " ":
+                return lines
@@ -0,0 +1,16 @@
+// Looks for a reCAPTCHA in the loaded page, run through execute_script.
+// Returns the site key and the url of the challenge, so that the page source is not transferred.
+var scripts = document.querySelectorAll('script');
+for (var i = 0; i < scripts.length; i++) {
+    var content = scripts[i].textContent || '';
+    if (content.indexOf('grecaptcha.render') >= 0) {
+        var match = content.match(/"sitekey":"(.*?)"/);
+        var iframe = document.querySelector('iframe[title="reCAPTCHA"]');
+        return {
+            found: true,
+            site_key: match === null ? null : match[1],
+            captcha_url: iframe === null ? null : iframe.getAttribute('src')
+        };
+    }
+}
+return {found: false};
@@ -0,0 +1,12 @@
+// Sets Firefox preferences at runtime, run through execute_script in the chrome context.
+var preferences = arguments[0];
+Object.keys(preferences).forEach(function (name) {
+    var value = preferences[name];
+    if (typeof value === 'boolean') {
+        Services.prefs.setBoolPref(name, value);
+    } else if (typeof value === 'number') {
+        Services.prefs.setIntPref(name, value);
+    } else {
+        Services.prefs.setStringPref(name, value);
+    }
+});
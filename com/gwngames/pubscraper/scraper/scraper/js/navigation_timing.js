@@ -0,0 +1,26 @@
+// Navigation and Resource Timing of the loaded page, run through execute_script.
+// Durations are in milliseconds, null when the phase did not happen yet (load with the eager strategy).
+// Cross-origin resources without Timing-Allow-Origin report no size and are only counted.
+function phase(end, start) {
+    return end > 0 ? end - start : null;
+}
+
+var navigation = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource');
+var bytes = navigation === undefined ? 0 : navigation.transferSize;
+resources.forEach(function (resource) {
+    bytes += resource.transferSize;
+});
+if (navigation === undefined) {
+    return {bytes: bytes, resources: resources.length, ready_ms: performance.now()};
+}
+return {
+    dns_ms: phase(navigation.domainLookupEnd, navigation.domainLookupStart),
+    connect_ms: phase(navigation.connectEnd, navigation.connectStart),
+    ttfb_ms: phase(navigation.responseStart, navigation.requestStart),
+    dom_content_loaded_ms: phase(navigation.domContentLoadedEventEnd, navigation.startTime),
+    load_ms: phase(navigation.loadEventEnd, navigation.startTime),
+    ready_ms: performance.now(),
+    bytes: bytes,
+    resources: resources.length
+};
@@ -0,0 +1,7 @@
+// Local storage of the loaded site, run through execute_script.
+var items = {};
+for (var i = 0; i < window.localStorage.length; i++) {
+    var key = window.localStorage.key(i);
+    items[key] = window.localStorage.getItem(key);
+}
+return items;
@@ -0,0 +1,36 @@
+// Results of a Scholar "cited by" page, run through execute_script.
+// Returns null when the result list is missing, the caller then falls back to the HTML of the page.
+function strippedText(element) {
+    // Same as get_text(strip=True) of BeautifulSoup
+    var walker = document.createTreeWalker(element, NodeFilter.SHOW_TEXT);
+    var parts = [];
+    while (walker.nextNode()) {
+        var part = walker.currentNode.nodeValue.trim();
+        if (part) {
+            parts.push(part);
+        }
+    }
+    return parts.join('');
+}
+
+if (document.querySelector('#gs_res_ccl_mid') === null) {
+    return null;
+}
+var results = Array.prototype.slice.call(document.querySelectorAll('div.gs_r'), 2, -1);
+var entries = results.map(function (result) {
+    var title = result.querySelector('h3.gs_rt');
+    var link = title === null ? null : title.querySelector('a');
+    var summary = result.querySelector('div.gs_rs');
+    var documentLink = result.querySelector('div.gs_or_ggsm a');
+    var authors = result.querySelector('div.gs_a');
+    return {
+        title: title === null ? null : strippedText(title),
+        link: link === null ? null : link.getAttribute('href'),
+        authors: authors === null ? [] : Array.prototype.map.call(authors.querySelectorAll('a'), function (author) {
+            return {href: author.getAttribute('href'), name: strippedText(author)};
+        }),
+        summary: summary === null ? null : strippedText(summary),
+        document_link: documentLink === null ? null : documentLink.getAttribute('href')
+    };
+});
+return {entries: entries, last_page: document.querySelector('span.gs_ico.gs_ico_nav_first') === null};
@@ -0,0 +1,12 @@
+// Publication rows of a Scholar profile, run through execute_script.
+// Returns null when the table is missing, the caller then falls back to the HTML of the page.
+var body = document.querySelector('tbody#gsc_a_b');
+if (body === null) {
+    return null;
+}
+var rows = [];
+body.querySelectorAll('tr.gsc_a_tr').forEach(function (row) {
+    var title = row.querySelector('a.gsc_a_at');
+    rows.push(title === null ? null : {title: title.textContent, href: title.getAttribute('href')});
+});
+return {rows: rows};
@@ -0,0 +1,17 @@
+// Results of a Scholar "all versions" page, run through execute_script.
+// Returns null when the result list is missing, the caller then falls back to the HTML of the page.
+if (document.querySelector('#gs_res_ccl_mid') === null) {
+    return null;
+}
+var entries = Array.prototype.map.call(document.querySelectorAll('div.gs_r.gs_or.gs_scl'), function (entry) {
+    var link = entry.querySelector('a[href]');
+    var source = entry.querySelector('span.gs_ct2');
+    var description = entry.querySelector('div.gs_rs');
+    return {
+        id: entry.getAttribute('data-cid') || '',
+        link: link === null ? '' : link.getAttribute('href'),
+        source: source === null ? '' : source.textContent.trim(),
+        description: description === null ? '' : description.textContent.trim()
+    };
+});
+return {entries: entries};
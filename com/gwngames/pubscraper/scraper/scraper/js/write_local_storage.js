@@ -0,0 +1,5 @@
+// Restores the local storage of the loaded site, run through execute_script.
+var items = arguments[0];
+Object.keys(items).forEach(function (key) {
+    window.localStorage.setItem(key, items[key]);
+});
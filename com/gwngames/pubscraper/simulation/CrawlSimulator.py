@@ -0,0 +1,306 @@
+import argparse
+import heapq
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+from collections import defaultdict, deque
+
+from com.gwngames.pubscraper.Context import Context
+from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+from com.gwngames.pubscraper.constants.EntityCidConstants import EntityCidConstants
+from com.gwngames.pubscraper.constants.PriorityConstants import PriorityConstants
+from com.gwngames.pubscraper.simulation.MemoryCouchServer import MemoryCouchServer
+from com.gwngames.pubscraper.simulation.SyntheticGraph import SyntheticGraph
+from com.gwngames.pubscraper.simulation.VirtualClock import VirtualClock
+from com.gwngames.pubscraper.utils.Clock import Clock
+from com.gwngames.pubscraper.utils.JsonReader import JsonReader
+
+
+class CrawlSimulator:
+    """
+    Runs the real frontier (MessageRouter, MasterPriorityQueue) and the real fetchers, including
+    GeneralDataFetcher.prepare_next_phase, against a synthetic graph in virtual time.
+
+    Only page fetches are simulated: each costs a configurable latency plus the politeness wait of the
+    configuration, and may end in a ban. Dispatch is modelled as in the router: at most max_active_threads
+    messages are in flight, and each interface serves at most max_iface_requests of them at a time.
+    """
+    SIMULATED_INTERFACES = ('google_scholar', 'dblp')
+    PAGES_PER_FETCH = {
+        ('google_scholar', EntityCidConstants.AUTHOR): 4,  # search, profile, publications, colleagues
+        ('google_scholar', EntityCidConstants.PUB): 1,
+        ('dblp', EntityCidConstants.PUB): 2  # search, profile
+    }
+    SAMPLE_PERIOD_SEC = 3600
+
+    def __init__(self, graph: SyntheticGraph, days: float = 7, roots: int = 10, latency_sec: float = 4.0,
+                 ban_probability: float = 0.01, ban_cost_sec: float = 300, seed: int = 0):
+        from com.gwngames.pubscraper.scheduling.MessageRouter import MessageRouter
+
+        self.ctx = Context()
+        self.logger = logging.getLogger(CrawlSimulator.__name__)
+        self.graph = graph
+        self.horizon = days * 86400
+        self.roots = roots
+        self.latency_sec = latency_sec
+        self.ban_probability = ban_probability
+        self.ban_cost_sec = ban_cost_sec
+        self.rnd = random.Random(seed)
+        random.seed(seed)  # Politeness waits are drawn by ThreadUtils
+
+        self.clock = VirtualClock()
+        Clock.install(self.clock)
+        self.router = MessageRouter.get_instance()
+        self.queue = self.router.incoming_queue
+
+        self.interfaces = [name for name in self.ctx.get_main_interfaces() if name in self.SIMULATED_INTERFACES]
+        self.max_threads = self.ctx.get_config().get_value(ConfigConstants.MAX_ACTIVE_THREADS)
+        self.free_workers = {name: self.ctx.get_max_requests() for name in self.interfaces}
+        self.waiting = {name: deque() for name in self.interfaces}
+        self.threads_in_use = 0
+        self._events = []
+        self._sequence = 0
+        self._result = None
+        self._fetched = set()
+
+        self.pages = 0
+        self.fetches = 0
+        self.pipeline_messages = 0
+        self.dropped_messages = 0
+        self.wasted = {'banned': 0, 'duplicate': 0, 'empty': 0}
+        self.entities_per_hour = defaultdict(int)
+        self.queue_depth = []
+
+    def _entity(self, interface_id: str, phase_ref: int, param) -> dict:
+        if interface_id == 'google_scholar' and phase_ref == EntityCidConstants.AUTHOR:
+            return self.graph.scholar_author(param)
+        elif interface_id == 'google_scholar' and phase_ref == EntityCidConstants.PUB:
+            return self.graph.scholar_publication(param)
+        elif interface_id == 'dblp' and phase_ref == EntityCidConstants.PUB:
+            return self.graph.dblp_author(param)
+        return {}
+
+    def _simulated_fx(self, interface_id: str, phase_ref: int):
+        from com.gwngames.pubscraper.utils.ThreadUtils import ThreadUtils
+
+        def fetch(*params):
+            config = self.ctx.get_config()
+            key = (interface_id, phase_ref, str(params[0]))
+            self.fetches += 1
+            if key in self._fetched:
+                self.wasted['duplicate'] += 1
+            self._fetched.add(key)
+
+            for _ in range(self.PAGES_PER_FETCH.get((interface_id, phase_ref), 1)):
+                self.pages += 1
+                self.clock.sleep(self.rnd.gauss(self.latency_sec, self.latency_sec / 4))
+                ThreadUtils.sleep_for(config.get_value(ConfigConstants.MIN_WAIT_TIME),
+                                      config.get_value(ConfigConstants.MAX_WAIT_TIME), self.logger, interface_id)
+                if self.rnd.random() < self.ban_probability:
+                    self.wasted['banned'] += 1
+                    self.clock.sleep(self.ban_cost_sec)
+                    return {}
+
+            entity = self._entity(interface_id, phase_ref, params[0])
+            if not entity:
+                self.wasted['empty'] += 1
+            self._result = entity
+            return entity
+
+        return fetch
+
+    def _seed(self):
+        from com.gwngames.pubscraper.scraper.WebScraper import WebScraper
+        from com.gwngames.pubscraper.scraper.ifaces.GeneralDataFetcher import GeneralDataFetcher
+
+        # Ordered as by the scraper, shuffled when shuffle_roots is set
+        roots = list(WebScraper.order_roots(self.ctx.get_config(), self.graph.roots(self.roots)))
+        for interface_id in self.interfaces:
+            fetcher = GeneralDataFetcher.get_data_fetcher_class(interface_id)()
+            if fetcher.ROOT_MESSAGE_TYPE is None:
+                continue
+            for root in roots:
+                self.router.send_message(*fetcher.generate_root_message(root))
+
+    def _deliver(self, message):
+        from com.gwngames.pubscraper.scraper.buffer.DatabaseHandler import DatabaseHandler
+
+        # Stands for OutSender, the entity is considered received by the server
+        data_source = DatabaseHandler(self.ctx.get_dbclient(), message.entity_db)
+        entity = data_source.get_document(message.entity_id)
+        entity['sent'] = True
+        data_source.insert_or_update_document(message.content, message.entity_id, entity)
+
+    def _dispatch(self, now: float):
+        from com.gwngames.pubscraper.msg.comm.SendEntity import SendEntity
+        from com.gwngames.pubscraper.scraper.adapter.AdapterPropertiesConstants import AdapterPropertiesConstants
+
+        while self.threads_in_use < self.max_threads:
+            _, message, subqueue = self.queue.receive()
+            if message is None:
+                break
+
+            if message.system_message:
+                self.clock.begin(now)
+                if isinstance(message, SendEntity):
+                    self._deliver(message)
+                else:
+                    subqueue.process_message(message)
+                self.clock.end()
+                self.pipeline_messages += 1
+                continue
+
+            interface_id = message.adapter.get_property(AdapterPropertiesConstants.IFACE_REF)
+            if interface_id not in self.waiting:
+                self.dropped_messages += 1
+                continue
+            self.waiting[interface_id].append((message, subqueue))
+            self.threads_in_use += 1
+
+        for interface_id in self.interfaces:
+            while self.free_workers[interface_id] > 0 and self.waiting[interface_id]:
+                message, subqueue = self.waiting[interface_id].popleft()
+                self.free_workers[interface_id] -= 1
+                self._start(now, interface_id, message, subqueue)
+
+    def _start(self, now: float, interface_id: str, message, subqueue):
+        from com.gwngames.pubscraper.scraper.adapter.AdapterPropertiesConstants import AdapterPropertiesConstants
+
+        phase_ref = message.adapter.get_property(AdapterPropertiesConstants.PHASE_REF)
+        message.adapter.add_property(AdapterPropertiesConstants.IFACE_FX, self._simulated_fx(interface_id, phase_ref))
+
+        self._result = None
+        self.clock.begin(now)
+        subqueue.process_message(message)
+        duration, deferred = self.clock.end()
+
+        self._sequence += 1
+        heapq.heappush(self._events, (now + duration, self._sequence, interface_id, deferred, bool(self._result)))
+
+    def _queue_depth(self) -> int:
+        return (len(self.queue.process_queue) + len(self.queue.system_queue)
+                + sum(len(waiting) for waiting in self.waiting.values()))
+
+    def run(self) -> dict:
+        started_at = time.time()
+        self._seed()
+        self._dispatch(0.0)
+
+        now = 0.0
+        next_sample = 0.0
+        while self._events:
+            completed_at, _, interface_id, deferred, has_entity = heapq.heappop(self._events)
+            if completed_at > self.horizon:
+                break
+
+            while next_sample <= completed_at:
+                self.queue_depth.append(self._queue_depth())
+                next_sample += self.SAMPLE_PERIOD_SEC
+
+            now = completed_at
+            self.clock.begin(now)
+            for target in deferred:
+                target()  # Messages sent by the fetch become visible once it completes
+            self.clock.end()
+
+            self.free_workers[interface_id] += 1
+            self.threads_in_use -= 1
+            if has_entity:
+                self.entities_per_hour[int(now // 3600)] += 1
+            self._dispatch(now)
+
+        simulated_hours = (self.horizon if self._events else now) / 3600
+        hours = int(simulated_hours) + 1
+        entities = sum(self.entities_per_hour.values())
+        return {
+            "simulated_hours": round(simulated_hours, 2),
+            "frontier_exhausted": not self._events,
+            "wall_clock_sec": round(time.time() - started_at, 2),
+            "entities": entities,
+            "entities_per_simulated_hour": round(entities / max(simulated_hours, 1e-9), 2),
+            "entities_by_hour": [self.entities_per_hour.get(hour, 0) for hour in range(hours)],
+            "queue_depth_by_hour": self.queue_depth,
+            "fetches": self.fetches,
+            "pages": self.pages,
+            "wasted_fetches": dict(self.wasted, total=sum(self.wasted.values())),
+            "pipeline_messages": self.pipeline_messages,
+            "dropped_messages": self.dropped_messages
+        }
+
+
+def prepare_environment(base_config: str, overrides: dict) -> str:
+    """
+    Create a scratch working directory holding the simulation configuration and wire the context to it,
+    with an in-memory database in place of CouchDB.
+
+    :return: The scratch directory.
+    """
+    # Message statistics are written on every message, keep them in memory backed storage when possible
+    directory = tempfile.mkdtemp(prefix="pubscraper_sim_", dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+    with open(base_config, 'r') as f:
+        config = json.load(f)
+    config.update({
+        ConfigConstants.RECOVERY_INST: False,
+        ConfigConstants.DEBUG_DELAY: False,
+        ConfigConstants.MAX_MS_WORKTIME: -1,
+        ConfigConstants.AUTO_ADAPTIVE: False
+    })
+    config.update(overrides)
+    with open(os.path.join(directory, JsonReader.CONFIG_FILE_NAME), 'w') as f:
+        json.dump(config, f, indent=4)
+    with open(os.path.join(directory, JsonReader.MESSAGE_STAT_FILE_NAME), 'w') as f:
+        json.dump({}, f)
+
+    ctx = Context()
+    ctx.set_current_dir(directory)
+    ctx.set_config(JsonReader(JsonReader.CONFIG_FILE_NAME))
+    ctx.set_message_data(JsonReader(JsonReader.MESSAGE_STAT_FILE_NAME))
+    ctx.set_client(MemoryCouchServer())
+
+    from com.gwngames.pubscraper.utils.ClassRegisterer import QueueRegisterer
+    QueueRegisterer().register_queues()
+    return directory
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Simulate a crawl in virtual time against a synthetic graph.")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                                         JsonReader.CONFIG_FILE_NAME))
+    parser.add_argument("--interfaces", default="google_scholar", help="Comma separated interfaces to simulate")
+    parser.add_argument("--days", type=float, default=7)
+    parser.add_argument("--authors", type=int, default=2000)
+    parser.add_argument("--publications-per-author", type=int, default=20)
+    parser.add_argument("--roots", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=4.0, help="Mean page latency in seconds")
+    parser.add_argument("--ban-probability", type=float, default=0.01, help="Probability of a ban per page")
+    parser.add_argument("--ban-cost", type=float, default=300, help="Seconds lost on each ban")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=JSON",
+                        help="Configuration override, e.g. depth_max=3")
+    parser.add_argument("--priority", action="append", default=[], metavar="NAME=VALUE",
+                        help="PriorityConstants override, e.g. PUB_REQ=103")
+    parser.add_argument("--output", default=None, help="File receiving the JSON report")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    config_overrides = {ConfigConstants.INTERFACES_ENABLED: args.interfaces}
+    for override in args.set:
+        key, value = override.split('=', 1)
+        config_overrides[key] = json.loads(value)
+    for override in args.priority:
+        name, value = override.split('=', 1)
+        setattr(PriorityConstants, name, int(value))
+
+    prepare_environment(args.config, config_overrides)
+    simulator = CrawlSimulator(SyntheticGraph(args.authors, args.publications_per_author, seed=args.seed),
+                               days=args.days, roots=args.roots, latency_sec=args.latency,
+                               ban_probability=args.ban_probability, ban_cost_sec=args.ban_cost, seed=args.seed)
+    report = json.dumps(simulator.run(), indent=4)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report)
+    print(report)
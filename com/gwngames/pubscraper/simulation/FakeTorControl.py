@@ -0,0 +1,91 @@
+import logging
+import socketserver
+import threading
+
+
+class FakeTorControl:
+    """
+    Local stand-in for the control port of tor, implementing the commands sent by TorController.
+    The circuit is reported as established a given number of polls after each NEWNYM.
+
+    :param methods: The authentication methods announced by PROTOCOLINFO.
+    :param cookie_file: The cookie file announced for COOKIE authentication.
+    :param password: The accepted password for HASHEDPASSWORD authentication.
+    :param polls_until_circuit: GETINFO polls answering that no circuit is established after NEWNYM.
+    """
+
+    def __init__(self, methods: str = "NULL", cookie_file: str = None, password: str = None,
+                 polls_until_circuit: int = 1):
+        self.methods = methods
+        self.cookie_file = cookie_file
+        self.password = password
+        self.polls_until_circuit = polls_until_circuit
+        self.newnym_count = 0
+        self.logger = logging.getLogger(FakeTorControl.__name__)
+        self._pending_polls = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    def start(self) -> int:
+        """
+        :return: The port the fake control port listens on.
+        """
+        control = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                authenticated = False
+                for raw in self.rfile:
+                    line = raw.decode("ascii").rstrip("\r\n")
+                    reply, authenticated, close = control._reply(line, authenticated)
+                    self.wfile.write(reply.encode("ascii"))
+                    if close:
+                        return
+
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server.server_address[1]
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def _reply(self, line: str, authenticated: bool) -> tuple[str, bool, bool]:
+        command, _, argument = line.partition(" ")
+        if command == "PROTOCOLINFO":
+            cookie = f' COOKIEFILE="{self.cookie_file}"' if self.cookie_file else ""
+            return (f"250-PROTOCOLINFO 1\r\n250-AUTH METHODS={self.methods}{cookie}\r\n"
+                    f"250-VERSION Tor=\"0.4.8.fake\"\r\n250 OK\r\n"), authenticated, False
+        if command == "AUTHENTICATE":
+            if self._accepts(argument):
+                return "250 OK\r\n", True, False
+            return "515 Authentication failed\r\n", False, True
+        if command == "QUIT":
+            return "250 closing connection\r\n", authenticated, True
+        if not authenticated:
+            return "514 Authentication required.\r\n", False, True
+
+        if line == "SIGNAL NEWNYM":
+            with self._lock:
+                self.newnym_count += 1
+                self._pending_polls = self.polls_until_circuit
+            return "250 OK\r\n", True, False
+        if line == "GETINFO status/circuit-established":
+            with self._lock:
+                established = self._pending_polls <= 0
+                self._pending_polls -= 1
+            return f"250-status/circuit-established={int(established)}\r\n250 OK\r\n", True, False
+        return f'510 Unrecognized command "{command}"\r\n', True, False
+
+    def _accepts(self, argument: str) -> bool:
+        methods = self.methods.split(",")
+        if "NULL" in methods:
+            return True
+        if "COOKIE" in methods and self.cookie_file:
+            with open(self.cookie_file, "rb") as f:
+                if argument == f.read().hex():
+                    return True
+        unquoted = argument[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+        return "HASHEDPASSWORD" in methods and argument.startswith('"') and unquoted == self.password
@@ -0,0 +1,99 @@
+import json
+import threading
+from collections import namedtuple
+
+from couchdb import Document, ResourceConflict, ResourceNotFound
+
+from com.gwngames.pubscraper.scraper.buffer.DatabaseHandler import DatabaseHandler
+
+ViewRow = namedtuple('ViewRow', ['id', 'key', 'value', 'doc'])
+
+
+class MemoryDatabase:
+    """
+    In-memory replacement of a CouchDB database, implementing the subset of the API used by the scraper.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._docs = {}
+        self._lock = threading.Lock()
+
+    def get(self, doc_id, default=None):
+        with self._lock:
+            doc = self._docs.get(doc_id)
+            return Document(json.loads(doc)) if doc is not None else default
+
+    def save(self, doc: dict):
+        with self._lock:
+            doc_id = doc['_id']
+            existing = self._docs.get(doc_id)
+            existing_rev = None if existing is None else json.loads(existing)['_rev']
+            if existing is not None and existing_rev != doc.get('_rev'):
+                raise ResourceConflict(f"Document update conflict: {doc_id}")
+
+            revision = 1 if existing is None else int(existing_rev.split('-')[0]) + 1
+            doc['_rev'] = f"{revision}-sim"
+            self._docs[doc_id] = json.dumps(doc)  # Stored serialized, as CouchDB would
+            return doc_id, doc['_rev']
+
+    def view(self, name: str, startkey=None, endkey=None, inclusive_end=True, limit=None, include_docs=False):
+        if name != DatabaseHandler.RECRAWL_VIEW:
+            raise ResourceNotFound(f"View not found: {name}")
+
+        with self._lock:
+            docs = {doc_id: json.loads(doc) for doc_id, doc in self._docs.items()}
+        rows = [ViewRow(doc_id, [doc['type'], doc['update_date']], None, doc)
+                for doc_id, doc in docs.items()
+                if doc.get('type') is not None and doc.get('update_date')]
+
+        rows.sort(key=lambda row: (str(row.key[0]), row.key[1]))
+        if startkey is not None:
+            rows = [row for row in rows if row.key[:len(startkey)] >= startkey]
+        if endkey is not None:
+            rows = [row for row in rows
+                    if row.key < endkey or (inclusive_end and row.key[:len(endkey)] == endkey)]
+        rows = rows[:limit] if limit is not None else rows
+        return [ViewRow(row.id, row.key, row.value, Document(row.doc) if include_docs else None) for row in rows]
+
+    def __getitem__(self, doc_id):
+        doc = self.get(doc_id)
+        if doc is None:
+            raise ResourceNotFound(f"Document not found: {doc_id}")
+        return doc
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._docs.keys()))
+
+    def __len__(self):
+        with self._lock:
+            return len(self._docs)
+
+
+class MemoryCouchServer:
+    """
+    In-memory replacement of a CouchDB server, used by the crawl simulator.
+    """
+
+    def __init__(self):
+        self._databases = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> MemoryDatabase:
+        with self._lock:
+            if name not in self._databases:
+                raise ResourceNotFound(f"Database not found: {name}")
+            return self._databases[name]
+
+    def create(self, name: str) -> MemoryDatabase:
+        with self._lock:
+            return self._databases.setdefault(name, MemoryDatabase(name))
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            return name in self._databases
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._databases.keys()))
@@ -0,0 +1,87 @@
+import random
+from collections import defaultdict
+
+
+class SyntheticGraph:
+    """
+    Synthetic author/publication graph served by the simulated interfaces.
+    Publications are written by groups of nearby authors, so that the coauthor graph has local communities
+    and reaches the whole population through a few long range links.
+    """
+    PUB_URL = "https://scholar.sim/citations?view_op=view_citation&citation_for_view="
+
+    def __init__(self, authors: int = 2000, publications_per_author: int = 20, authors_per_publication: int = 3,
+                 community_size: int = 50, seed: int = 0):
+        rnd = random.Random(seed)
+        self.author_names = [f"Author {index:05d}" for index in range(authors)]
+        self._author_index = {name: index for index, name in enumerate(self.author_names)}
+        self.publication_authors = {}
+        self.author_publications = defaultdict(list)
+
+        for pub_index in range(max(1, authors * publications_per_author // authors_per_publication)):
+            lead = rnd.randrange(authors)
+            members = [lead]
+            size = min(authors, max(1, round(rnd.gauss(authors_per_publication, 1))))
+            while len(members) < size:
+                member = (lead + round(rnd.gauss(0, community_size))) % authors
+                if rnd.random() < 0.05:
+                    member = rnd.randrange(authors)  # Long range collaboration
+                if member not in members:
+                    members.append(member)
+
+            publication_id = f"sim{pub_index:07d}"
+            self.publication_authors[publication_id] = members
+            for member in members:
+                self.author_publications[member].append(publication_id)
+
+    def roots(self, count: int) -> list[str]:
+        step = max(1, len(self.author_names) // max(1, count))
+        return self.author_names[::step][:count]
+
+    def _coauthors(self, index: int) -> list[str]:
+        coauthors = {}
+        for publication_id in self.author_publications[index]:
+            for member in self.publication_authors[publication_id]:
+                if member != index:
+                    coauthors[member] = coauthors.get(member, 0) + 1
+        top = sorted(coauthors, key=lambda member: -coauthors[member])[:20]
+        return [self.author_names[member] for member in top]
+
+    def _publication_authors(self, publication_id: str) -> list[str]:
+        return [self.author_names[member] for member in self.publication_authors[publication_id]]
+
+    def scholar_author(self, author_name: str) -> dict:
+        index = self._author_index.get(author_name)
+        if index is None:
+            return {}
+        return {
+            "author_id": f"sim{index:05d}",
+            "name": author_name,
+            "coauthors": self._coauthors(index),
+            "publications": [{"title": f"Publication {publication_id}",
+                              "url": SyntheticGraph.PUB_URL + publication_id,
+                              "publication_id": publication_id}
+                             for publication_id in self.author_publications[index]]
+        }
+
+    def scholar_publication(self, publication_url: str) -> dict:
+        publication_id = publication_url.rsplit('=', 1)[1]
+        if publication_id not in self.publication_authors:
+            return {}
+        return {
+            "publication_id": publication_id,
+            "publication_url": publication_url,
+            "title": f"Publication {publication_id}",
+            "authors": self._publication_authors(publication_id),
+            "citation_graph": []
+        }
+
+    def dblp_author(self, author_name: str) -> dict:
+        index = self._author_index.get(author_name)
+        if index is None:
+            return {"publications": []}
+        return {"publications": [{"title": f"Publication {publication_id}",
+                                  "type": "Conference",
+                                  "authors": self._publication_authors(publication_id),
+                                  "conference_acronym": "SIM"}
+                                 for publication_id in self.author_publications[index]]}
@@ -0,0 +1,40 @@
+from com.gwngames.pubscraper.utils.Clock import Clock
+
+
+class VirtualClock(Clock):
+    """
+    Clock for the crawl simulator.
+    Sleeps do not block, they are charged to the duration of the activity being simulated, and spawned
+    functions are collected so that the simulator can run them when the activity completes.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self._charged = 0.0
+        self._deferred = []
+
+    def time(self) -> float:
+        return self.now + self._charged
+
+    def sleep(self, seconds: float):
+        self._charged += max(0.0, seconds)
+
+    def spawn(self, target):
+        self._deferred.append(target)
+
+    def begin(self, at: float):
+        """
+        Start a new activity at the given virtual time.
+        """
+        self.now = at
+        self._charged = 0.0
+
+    def end(self) -> tuple[float, list]:
+        """
+        Complete the current activity.
+
+        :return: The virtual duration of the activity and the functions it spawned.
+        """
+        duration, deferred = self._charged, self._deferred
+        self._charged, self._deferred = 0.0, []
+        return duration, deferred
@@ -0,0 +1,38 @@
+import threading
+import time
+
+
+class Clock:
+    """
+    Source of time for the scheduling code.
+    The default implementation uses the wall clock and real threads, the crawl simulator installs a virtual one.
+    """
+    _current = None
+    _lock = threading.Lock()
+
+    def time(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+    def spawn(self, target):
+        """
+        Run a function asynchronously.
+
+        :param target: The function to run, without arguments.
+        """
+        threading.Thread(target=target).start()
+
+    @staticmethod
+    def get() -> 'Clock':
+        if Clock._current is None:
+            with Clock._lock:
+                if Clock._current is None:
+                    Clock._current = Clock()
+        return Clock._current
+
+    @staticmethod
+    def install(clock: 'Clock'):
+        with Clock._lock:
+            Clock._current = clock
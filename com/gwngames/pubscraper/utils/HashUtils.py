@@ -0,0 +1,23 @@
+import hashlib
+import json
+from typing import Final
+
+
+class HashUtils:
+    # Bookkeeping fields written by the storage and outsender pipeline, they change on every refresh
+    VOLATILE_FIELDS: Final = frozenset({
+        '_id', '_rev', 'type', 'update_date', 'update_count', 'serialized', 'sent',
+        'class_id', 'variant_id', 'content_hash'
+    })
+
+    @staticmethod
+    def content_hash(entity: dict) -> str:
+        """
+        Compute a stable hash of the scraped payload of an entity, ignoring volatile fields.
+
+        :param entity: The entity as stored or about to be stored.
+        :return: The hex sha256 digest of the canonical JSON form of the payload.
+        """
+        payload = {key: value for key, value in entity.items() if key not in HashUtils.VOLATILE_FIELDS}
+        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
@@ -184,9 +184,8 @@ class JsonReader:
 
     def increment(self, key: str):
         with self.lock:
-            prev = int(self.get_value(key))
-            if prev is None:
-                prev = 0
+            prev = self.get_value(key)
+            prev = 0 if prev is None else int(prev)
             self.set_value(key, prev + 1)
             self.save_changes()
             return prev + 1
@@ -0,0 +1,72 @@
+import os
+import signal
+
+
+class ProcessUtils:
+    PROC_DIR = "/proc"
+    PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+    @staticmethod
+    def tree_rss(pid: int) -> int | None:
+        """
+        Resident set size of a process and all of its descendants, read from /proc.
+
+        :param pid: The root of the process tree.
+        :return: The size in bytes, None if /proc is not available or the process is gone.
+        """
+        if not os.path.isdir(ProcessUtils.PROC_DIR):
+            return None
+
+        rss = ProcessUtils._rss(pid)
+        if rss is None:
+            return None
+        return rss + sum(ProcessUtils._rss(child) or 0 for child in ProcessUtils._descendants(pid))
+
+    @staticmethod
+    def kill_tree(pid: int):
+        """
+        Kill a process and all of its descendants, the descendants being unknown without /proc.
+
+        :param pid: The root of the process tree.
+        """
+        descendants = ProcessUtils._descendants(pid) if os.path.isdir(ProcessUtils.PROC_DIR) else []
+        for process in [pid] + descendants:
+            try:
+                os.kill(process, signal.SIGKILL)
+            except OSError:
+                pass  # Already gone
+
+    @staticmethod
+    def _descendants(pid: int) -> list[int]:
+        children = {}
+        for entry in os.listdir(ProcessUtils.PROC_DIR):
+            if not entry.isdigit():
+                continue
+            parent = ProcessUtils._parent(int(entry))
+            if parent is not None:
+                children.setdefault(parent, []).append(int(entry))
+
+        descendants = []
+        pending = list(children.get(pid, []))
+        while pending:
+            child = pending.pop()
+            descendants.append(child)
+            pending.extend(children.get(child, []))
+        return descendants
+
+    @staticmethod
+    def _parent(pid: int) -> int | None:
+        try:
+            with open(f"{ProcessUtils.PROC_DIR}/{pid}/stat") as f:
+                # The command name may contain spaces and parentheses, fields follow the last parenthesis
+                return int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            return None
+
+    @staticmethod
+    def _rss(pid: int) -> int | None:
+        try:
+            with open(f"{ProcessUtils.PROC_DIR}/{pid}/statm") as f:
+                return int(f.read().split()[1]) * ProcessUtils.PAGE_SIZE
+        except (OSError, IndexError, ValueError):
+            return None
@@ -0,0 +1,66 @@
+import threading
+from typing import Any, Callable, Hashable
+
+from com.gwngames.pubscraper.utils.Clock import Clock
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: the first caller runs the call, the others wait for it
+    and share its result, which is also kept for a short time to serve callers arriving right after.
+    Only results that are not None are shared, waiters run the call themselves when the first caller fails.
+    """
+    CANCEL_POLL_SEC = 1
+
+    class _Flight:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+
+    def __init__(self):
+        self._flights: dict[Hashable, SingleFlight._Flight] = {}
+        self._results: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, call: Callable[[], Any], ttl: float = 0, cancel: threading.Event = None) -> Any:
+        """
+        :param key: Identifies equivalent calls.
+        :param call: The call, without arguments.
+        :param ttl: Seconds during which the result is served to later callers.
+        :param cancel: Optional event interrupting the wait for another caller.
+        :return: The result of the call, None if cancelled while waiting.
+        """
+        while True:
+            with self._lock:
+                now = Clock.get().time()
+                cached = self._results.get(key)
+                if cached is not None and cached[0] > now:
+                    return cached[1]
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._flights[key] = SingleFlight._Flight()
+
+            if leader:
+                return self._lead(key, flight, call, ttl)
+
+            while not flight.done.wait(SingleFlight.CANCEL_POLL_SEC if cancel is not None else None):
+                if cancel.is_set():
+                    return None
+            if flight.result is not None:
+                return flight.result
+
+    def _lead(self, key: Hashable, flight: _Flight, call: Callable[[], Any], ttl: float) -> Any:
+        try:
+            flight.result = call()
+            return flight.result
+        finally:
+            with self._lock:
+                del self._flights[key]
+                now = Clock.get().time()
+                if ttl > 0 and flight.result is not None:
+                    self._results[key] = (now + ttl, flight.result)
+                # Expired results are dropped as new ones come in
+                for expired in [k for k, (expiry, _) in self._results.items() if expiry <= now]:
+                    del self._results[expired]
+            flight.done.set()
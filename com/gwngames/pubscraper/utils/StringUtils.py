@@ -1,3 +1,4 @@
+import urllib.parse
 from typing import List
 
 
@@ -21,3 +22,17 @@ class StringUtils:
         sanitized_string = ''.join('' if c in invalid_chars else c for c in trimmed_string)
 
         return sanitized_string
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """
+        Normalize a url so that equivalent urls compare equal: lowercase scheme and host, no default port,
+        no fragment and sorted query parameters.
+        """
+        parsed = urllib.parse.urlsplit(url.strip())
+        scheme = parsed.scheme.lower()
+        host = parsed.netloc.lower()
+        if (scheme, host.rsplit(':', 1)[-1]) in (('http', '80'), ('https', '443')):
+            host = host.rsplit(':', 1)[0]
+        query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)))
+        return urllib.parse.urlunsplit((scheme, host, parsed.path or '/', query, ''))
@@ -1,7 +1,8 @@
 import logging
 import random
-import time
+import threading
 
+from com.gwngames.pubscraper.utils.Clock import Clock
 
 class ThreadUtils:
 
@@ -11,6 +12,38 @@ class ThreadUtils:
         Sleep for a random number of seconds between min_seconds and max_seconds,
         with an additional delta that either adds or subtracts from the sleep time.
         """
+        sleep_time, delta = ThreadUtils._random_wait(min_seconds, max_seconds)
+        logger.info(f"Waiting {sleep_time:.2f} seconds for {object_for} (delta: {delta:.2f})...")
+        Clock.get().sleep(sleep_time)
+
+    @staticmethod
+    def random_wait(min_seconds: float, max_seconds: float) -> float:
+        """
+        Draw a wait with the same distribution as sleep_for, without sleeping.
+
+        :return: The wait in seconds.
+        """
+        return ThreadUtils._random_wait(min_seconds, max_seconds)[0]
+
+    @staticmethod
+    def sleep_until(deadline: float, logger: logging.Logger, object_for: str, cancel: threading.Event = None) -> bool:
+        """
+        Sleep until the given Clock time.
+
+        :param cancel: Optional event interrupting the sleep.
+        :return: False if the sleep was interrupted.
+        """
+        remaining = deadline - Clock.get().time()
+        if remaining <= 0:
+            return True
+        logger.info(f"Waiting {remaining:.2f} seconds for {object_for}...")
+        if cancel is not None:
+            return not cancel.wait(remaining)
+        Clock.get().sleep(remaining)
+        return True
+
+    @staticmethod
+    def _random_wait(min_seconds: float, max_seconds: float) -> tuple[float, float]:
         # Use a normal distribution to generate randomness closer to uniformity
         mid_point = (min_seconds + max_seconds) / 2
         range_seconds = (max_seconds - min_seconds) / 2
@@ -25,6 +58,4 @@ class ThreadUtils:
 
         sleep_time += delta
         sleep_time = max(min_seconds, sleep_time)
-
-        logger.info(f"Waiting {sleep_time:.2f} seconds for {object_for} (delta: {delta:.2f})...")
-        time.sleep(sleep_time)
+        return sleep_time, delta
@@ -0,0 +1,103 @@
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+from com.gwngames.pubscraper.Context import Context
+from com.gwngames.pubscraper.constants.ConfigConstants import ConfigConstants
+
+
+class Watchdog:
+    """
+    Tracks the start of in-flight operations, such as driver commands and message handlers, and calls the expiry
+    handler of each operation once it is past its deadline.
+    An operation made of steps, such as a handler fetching page after page, may be watched per step: its deadline
+    is re-armed each time its thread reports progress.
+    A stalled call cannot be interrupted from another thread: the handler either unblocks it, by killing what it
+    waits on, or replaces it. Deadlines are in wall-clock time, stalls are not simulated.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    class _Operation:
+        def __init__(self, name: str, started: float, deadline_sec: float, on_expire: Callable[[], None],
+                     per_step: bool):
+            self.name = name
+            self.started = started
+            self.deadline_sec = deadline_sec
+            self.deadline = started + deadline_sec
+            self.on_expire = on_expire
+            self.per_step = per_step
+            self.thread = threading.get_ident()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance.__initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self.__initialized:
+            return
+        self.__initialized = True
+        self.logger = logging.getLogger(Watchdog.__name__)
+        self.poll_sec = Context().get_config().get_value(ConfigConstants.WATCHDOG_POLL_SEC)
+        self._operations: dict[int, Watchdog._Operation] = {}
+        self._ids = itertools.count()
+        self._operations_lock = threading.Lock()
+        threading.Thread(target=self._monitor, name="Watchdog", daemon=True).start()
+
+    @contextmanager
+    def watch(self, name: str, deadline_sec: float, on_expire: Callable[[], None], per_step: bool = False):
+        """
+        Watch the operation run in the context.
+
+        :param name: The operation, for logging.
+        :param deadline_sec: Seconds the operation may take, no deadline if 0 or None.
+        :param on_expire: Called once, from the watchdog thread, if the operation is still running past its deadline.
+        :param per_step: True if the deadline applies to each step of the operation, see progress.
+        """
+        if not deadline_sec:
+            yield
+            return
+
+        operation_id = next(self._ids)
+        now = time.monotonic()
+        with self._operations_lock:
+            self._operations[operation_id] = Watchdog._Operation(name, now, deadline_sec, on_expire, per_step)
+        try:
+            yield
+        finally:
+            with self._operations_lock:
+                self._operations.pop(operation_id, None)
+
+    def progress(self):
+        """
+        Report a completed step of the operations watched per step in the calling thread, re-arming their deadline.
+        """
+        thread = threading.get_ident()
+        now = time.monotonic()
+        with self._operations_lock:
+            for operation in self._operations.values():
+                if operation.per_step and operation.thread == thread:
+                    operation.deadline = now + operation.deadline_sec
+
+    def _monitor(self):
+        while True:
+            time.sleep(self.poll_sec)
+            now = time.monotonic()
+            with self._operations_lock:
+                expired = [operation_id for operation_id, operation in self._operations.items()
+                           if operation.deadline <= now]
+                expired = [self._operations.pop(operation_id) for operation_id in expired]
+
+            for operation in expired:
+                self.logger.warning(f"{operation.name} stalled for {now - operation.started:.0f} seconds, recovering.")
+                try:
+                    operation.on_expire()
+                except Exception as e:
+                    self.logger.error(f"Failed to recover {operation.name}: {e}")